@@ -2,6 +2,7 @@
 
 import inspect
 import logging
+from typing import Any
 
 import voluptuous as vol
 
@@ -12,21 +13,55 @@ from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers.issue_registry import IssueSeverity, async_create_issue, async_delete_issue
 
 from .const import (
+    CONF_ADAPTIVE_TIMEOUTS,
+    CONF_AUTO_TIER,
+    CONF_CACHE_MAX_ENTRIES,
+    CONF_CACHE_TTL,
+    CONF_COALESCE_WINDOW,
+    CONF_FAST_MAX_WORDS,
+    CONF_FAST_MODEL,
+    CONF_FAST_THINKING,
+    CONF_HEDGE_DELAY,
+    CONF_HEDGE_MODEL,
+    CONF_HEDGE_REQUESTS,
+    CONF_LOCAL_INTENTS,
+    CONF_MAX_QUEUED_CHARS,
+    CONF_MAX_RESPONSE_CHARS,
     CONF_MODEL,
+    CONF_PRESENCE_INTERVAL,
     CONF_SESSION_KEY,
+    CONF_SESSION_ROUTING,
+    CONF_STALL_TIMEOUT,
+    CONF_STREAM_OVERFLOW_POLICY,
     CONF_STRIP_EMOJIS,
     CONF_THINKING,
     CONF_TIMEOUT,
     CONF_TTS_MAX_CHARS,
     CONF_USE_SSL,
+    DEFAULT_ADAPTIVE_TIMEOUTS,
+    DEFAULT_AUTO_TIER,
+    DEFAULT_CACHE_MAX_ENTRIES,
+    DEFAULT_CACHE_TTL,
+    DEFAULT_COALESCE_WINDOW,
+    DEFAULT_FAST_MAX_WORDS,
+    DEFAULT_FAST_MODEL,
+    DEFAULT_FAST_THINKING,
+    DEFAULT_HEDGE_DELAY,
+    DEFAULT_HEDGE_MODEL,
+    DEFAULT_HEDGE_REQUESTS,
+    DEFAULT_MAX_QUEUED_CHARS,
+    DEFAULT_MAX_RESPONSE_CHARS,
     DEFAULT_MODEL,
     DEFAULT_SESSION_KEY,
+    DEFAULT_STALL_TIMEOUT,
+    DEFAULT_STREAM_OVERFLOW_POLICY,
     DEFAULT_STRIP_EMOJIS,
     DEFAULT_THINKING,
     DEFAULT_TIMEOUT,
     DEFAULT_TTS_MAX_CHARS,
     DEFAULT_USE_SSL,
     DOMAIN,
+    EVENT_PRESENCE_CHANGED,
 )
 from .exceptions import (
     DevicePairingRequiredError,
@@ -60,6 +95,24 @@ _OPTION_KEYS = {
     CONF_THINKING,
     CONF_STRIP_EMOJIS,
     CONF_TTS_MAX_CHARS,
+    CONF_COALESCE_WINDOW,
+    CONF_CACHE_TTL,
+    CONF_CACHE_MAX_ENTRIES,
+    CONF_ADAPTIVE_TIMEOUTS,
+    CONF_STALL_TIMEOUT,
+    CONF_MAX_RESPONSE_CHARS,
+    CONF_MAX_QUEUED_CHARS,
+    CONF_STREAM_OVERFLOW_POLICY,
+    CONF_SESSION_ROUTING,
+    CONF_HEDGE_REQUESTS,
+    CONF_HEDGE_MODEL,
+    CONF_HEDGE_DELAY,
+    CONF_LOCAL_INTENTS,
+    CONF_AUTO_TIER,
+    CONF_FAST_MODEL,
+    CONF_FAST_THINKING,
+    CONF_FAST_MAX_WORDS,
+    CONF_PRESENCE_INTERVAL,
 }
 
 
@@ -99,6 +152,67 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         thinking=options.get(
             CONF_THINKING, entry.data.get(CONF_THINKING, DEFAULT_THINKING)
         ),
+        coalesce_window=options.get(
+            CONF_COALESCE_WINDOW,
+            entry.data.get(CONF_COALESCE_WINDOW, DEFAULT_COALESCE_WINDOW),
+        ),
+        cache_ttl=options.get(
+            CONF_CACHE_TTL, entry.data.get(CONF_CACHE_TTL, DEFAULT_CACHE_TTL)
+        ),
+        cache_max_entries=options.get(
+            CONF_CACHE_MAX_ENTRIES,
+            entry.data.get(CONF_CACHE_MAX_ENTRIES, DEFAULT_CACHE_MAX_ENTRIES),
+        ),
+        adaptive_timeouts=options.get(
+            CONF_ADAPTIVE_TIMEOUTS,
+            entry.data.get(CONF_ADAPTIVE_TIMEOUTS, DEFAULT_ADAPTIVE_TIMEOUTS),
+        ),
+        stall_timeout=options.get(
+            CONF_STALL_TIMEOUT,
+            entry.data.get(CONF_STALL_TIMEOUT, DEFAULT_STALL_TIMEOUT),
+        ),
+        max_response_chars=options.get(
+            CONF_MAX_RESPONSE_CHARS,
+            entry.data.get(CONF_MAX_RESPONSE_CHARS, DEFAULT_MAX_RESPONSE_CHARS),
+        ),
+        max_queued_chars=options.get(
+            CONF_MAX_QUEUED_CHARS,
+            entry.data.get(CONF_MAX_QUEUED_CHARS, DEFAULT_MAX_QUEUED_CHARS),
+        ),
+        stream_overflow_policy=options.get(
+            CONF_STREAM_OVERFLOW_POLICY,
+            entry.data.get(
+                CONF_STREAM_OVERFLOW_POLICY, DEFAULT_STREAM_OVERFLOW_POLICY
+            ),
+        ),
+        hedge_requests=options.get(
+            CONF_HEDGE_REQUESTS,
+            entry.data.get(CONF_HEDGE_REQUESTS, DEFAULT_HEDGE_REQUESTS),
+        ),
+        hedge_model=options.get(
+            CONF_HEDGE_MODEL,
+            entry.data.get(CONF_HEDGE_MODEL, DEFAULT_HEDGE_MODEL),
+        ),
+        hedge_delay=options.get(
+            CONF_HEDGE_DELAY,
+            entry.data.get(CONF_HEDGE_DELAY, DEFAULT_HEDGE_DELAY),
+        ),
+        auto_tier=options.get(
+            CONF_AUTO_TIER,
+            entry.data.get(CONF_AUTO_TIER, DEFAULT_AUTO_TIER),
+        ),
+        fast_model=options.get(
+            CONF_FAST_MODEL,
+            entry.data.get(CONF_FAST_MODEL, DEFAULT_FAST_MODEL),
+        ),
+        fast_thinking=options.get(
+            CONF_FAST_THINKING,
+            entry.data.get(CONF_FAST_THINKING, DEFAULT_FAST_THINKING),
+        ),
+        fast_max_words=options.get(
+            CONF_FAST_MAX_WORDS,
+            entry.data.get(CONF_FAST_MAX_WORDS, DEFAULT_FAST_MAX_WORDS),
+        ),
     )
 
     # Connect to Gateway
@@ -139,6 +253,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     gateway_client._gateway._on_fatal_error = _on_fatal_error
 
+    def _fire_presence_changed(kind: str, change: dict[str, Any] | None) -> None:
+        """Let automations react to specific clients joining or leaving."""
+        if kind == "presence" and change is not None:
+            hass.bus.async_fire(
+                EVENT_PRESENCE_CHANGED, {"entry_id": entry.entry_id, **change}
+            )
+
+    entry.async_on_unload(
+        gateway_client.add_state_listener(_fire_presence_changed)
+    )
+
     # Clear any stale repair issue from a previous session
     async_delete_issue(hass, DOMAIN, "gateway_auth_failed")
 
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
 from typing import Any
 
 from homeassistant.components.binary_sensor import (
@@ -11,14 +10,12 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
 from .gateway_client import OpenClawGatewayClient
 
-SCAN_INTERVAL = timedelta(seconds=10)
-
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -37,7 +34,7 @@ class OpenClawGatewayConnectivitySensor(BinarySensorEntity):
     _attr_name = "Gateway Connectivity"
     _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
     _attr_entity_category = EntityCategory.DIAGNOSTIC
-    _attr_should_poll = True
+    _attr_should_poll = False
 
     def __init__(
         self, config_entry: ConfigEntry, gateway_client: OpenClawGatewayClient
@@ -61,3 +58,17 @@ class OpenClawGatewayConnectivitySensor(BinarySensorEntity):
     def is_on(self) -> bool:
         """Return True if the gateway is connected."""
         return self._gateway_client.connected
+
+    async def async_added_to_hass(self) -> None:
+        """Follow gateway connection changes instead of polling."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._gateway_client.add_connection_listener(
+                self._handle_connection_change
+            )
+        )
+
+    @callback
+    def _handle_connection_change(self, _connected: bool) -> None:
+        """Write the new connectivity state as soon as it changes."""
+        self.async_write_ha_state()
@@ -14,22 +14,63 @@ from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import aiohttp_client, selector
 
 from .const import (
+    CONF_ADAPTIVE_TIMEOUTS,
+    CONF_AUTO_TIER,
+    CONF_CACHE_MAX_ENTRIES,
+    CONF_CACHE_TTL,
+    CONF_COALESCE_WINDOW,
+    CONF_FAST_MAX_WORDS,
+    CONF_FAST_MODEL,
+    CONF_FAST_THINKING,
+    CONF_HEDGE_DELAY,
+    CONF_HEDGE_MODEL,
+    CONF_HEDGE_REQUESTS,
+    CONF_LOCAL_INTENTS,
+    CONF_MAX_QUEUED_CHARS,
+    CONF_MAX_RESPONSE_CHARS,
     CONF_MODEL,
+    CONF_PRESENCE_INTERVAL,
     CONF_SESSION_KEY,
+    CONF_SESSION_ROUTING,
+    CONF_STALL_TIMEOUT,
+    CONF_STREAM_OVERFLOW_POLICY,
     CONF_STRIP_EMOJIS,
     CONF_THINKING,
     CONF_TTS_MAX_CHARS,
     CONF_USE_SSL,
+    DEFAULT_ADAPTIVE_TIMEOUTS,
+    DEFAULT_AUTO_TIER,
+    DEFAULT_CACHE_MAX_ENTRIES,
+    DEFAULT_CACHE_TTL,
+    DEFAULT_COALESCE_WINDOW,
+    DEFAULT_FAST_MAX_WORDS,
+    DEFAULT_FAST_MODEL,
+    DEFAULT_FAST_THINKING,
+    DEFAULT_HEDGE_DELAY,
+    DEFAULT_HEDGE_MODEL,
+    DEFAULT_HEDGE_REQUESTS,
+    DEFAULT_LOCAL_INTENTS,
     DEFAULT_HOST,
+    DEFAULT_MAX_QUEUED_CHARS,
+    DEFAULT_MAX_RESPONSE_CHARS,
     DEFAULT_MODEL,
+    DEFAULT_PRESENCE_INTERVAL,
     DEFAULT_PORT,
     DEFAULT_SESSION_KEY,
+    DEFAULT_SESSION_ROUTING,
+    DEFAULT_STALL_TIMEOUT,
+    DEFAULT_STREAM_OVERFLOW_POLICY,
     DEFAULT_STRIP_EMOJIS,
     DEFAULT_THINKING,
     DEFAULT_TTS_MAX_CHARS,
     DEFAULT_TIMEOUT,
     DEFAULT_USE_SSL,
     DOMAIN,
+    SESSION_ROUTING_CONVERSATION,
+    SESSION_ROUTING_DEVICE,
+    SESSION_ROUTING_NONE,
+    STREAM_OVERFLOW_FAIL,
+    STREAM_OVERFLOW_MERGE,
 )
 from .exceptions import (
     DevicePairingRequiredError,
@@ -144,6 +185,35 @@ def _build_thinking_selector() -> selector.SelectSelector:
     )
 
 
+def _build_session_routing_selector() -> selector.SelectSelector:
+    """Build a session routing mode selector."""
+    options = [
+        {"label": "Shared session", "value": SESSION_ROUTING_NONE},
+        {"label": "Per conversation", "value": SESSION_ROUTING_CONVERSATION},
+        {"label": "Per device", "value": SESSION_ROUTING_DEVICE},
+    ]
+    return selector.SelectSelector(
+        selector.SelectSelectorConfig(
+            options=options,
+            mode=selector.SelectSelectorMode.DROPDOWN,
+        )
+    )
+
+
+def _build_overflow_policy_selector() -> selector.SelectSelector:
+    """Build a stream overflow policy selector."""
+    options = [
+        {"label": "Skip ahead to the newest text", "value": STREAM_OVERFLOW_MERGE},
+        {"label": "Fail the response", "value": STREAM_OVERFLOW_FAIL},
+    ]
+    return selector.SelectSelector(
+        selector.SelectSelectorConfig(
+            options=options,
+            mode=selector.SelectSelectorMode.DROPDOWN,
+        )
+    )
+
+
 class OpenClawConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for OpenClaw."""
 
@@ -430,6 +500,59 @@ class OpenClawOptionsFlowHandler(config_entries.OptionsFlow):
                     CONF_TTS_MAX_CHARS: user_input.get(
                         CONF_TTS_MAX_CHARS, DEFAULT_TTS_MAX_CHARS
                     ),
+                    CONF_COALESCE_WINDOW: user_input.get(
+                        CONF_COALESCE_WINDOW, DEFAULT_COALESCE_WINDOW
+                    ),
+                    CONF_CACHE_TTL: user_input.get(
+                        CONF_CACHE_TTL, DEFAULT_CACHE_TTL
+                    ),
+                    CONF_CACHE_MAX_ENTRIES: user_input.get(
+                        CONF_CACHE_MAX_ENTRIES, DEFAULT_CACHE_MAX_ENTRIES
+                    ),
+                    CONF_ADAPTIVE_TIMEOUTS: user_input.get(
+                        CONF_ADAPTIVE_TIMEOUTS, DEFAULT_ADAPTIVE_TIMEOUTS
+                    ),
+                    CONF_STALL_TIMEOUT: user_input.get(
+                        CONF_STALL_TIMEOUT, DEFAULT_STALL_TIMEOUT
+                    ),
+                    CONF_MAX_RESPONSE_CHARS: user_input.get(
+                        CONF_MAX_RESPONSE_CHARS, DEFAULT_MAX_RESPONSE_CHARS
+                    ),
+                    CONF_MAX_QUEUED_CHARS: user_input.get(
+                        CONF_MAX_QUEUED_CHARS, DEFAULT_MAX_QUEUED_CHARS
+                    ),
+                    CONF_STREAM_OVERFLOW_POLICY: user_input.get(
+                        CONF_STREAM_OVERFLOW_POLICY,
+                        DEFAULT_STREAM_OVERFLOW_POLICY,
+                    ),
+                    CONF_SESSION_ROUTING: user_input.get(
+                        CONF_SESSION_ROUTING, DEFAULT_SESSION_ROUTING
+                    ),
+                    CONF_HEDGE_REQUESTS: user_input.get(
+                        CONF_HEDGE_REQUESTS, DEFAULT_HEDGE_REQUESTS
+                    ),
+                    CONF_HEDGE_MODEL: (
+                        user_input.get(CONF_HEDGE_MODEL) or ""
+                    ).strip(),
+                    CONF_HEDGE_DELAY: user_input.get(
+                        CONF_HEDGE_DELAY, DEFAULT_HEDGE_DELAY
+                    ),
+                    CONF_LOCAL_INTENTS: user_input.get(
+                        CONF_LOCAL_INTENTS, DEFAULT_LOCAL_INTENTS
+                    ),
+                    CONF_AUTO_TIER: user_input.get(
+                        CONF_AUTO_TIER, DEFAULT_AUTO_TIER
+                    ),
+                    CONF_FAST_MODEL: (
+                        user_input.get(CONF_FAST_MODEL) or ""
+                    ).strip(),
+                    CONF_FAST_THINKING: user_input.get(CONF_FAST_THINKING) or "",
+                    CONF_FAST_MAX_WORDS: user_input.get(
+                        CONF_FAST_MAX_WORDS, DEFAULT_FAST_MAX_WORDS
+                    ),
+                    CONF_PRESENCE_INTERVAL: user_input.get(
+                        CONF_PRESENCE_INTERVAL, DEFAULT_PRESENCE_INTERVAL
+                    ),
                 }
                 self.hass.config_entries.async_update_entry(
                     self.config_entry,
@@ -482,6 +605,96 @@ class OpenClawOptionsFlowHandler(config_entries.OptionsFlow):
                         CONF_TTS_MAX_CHARS, DEFAULT_TTS_MAX_CHARS
                     ),
                 ): vol.All(int, vol.Range(min=0, max=2000)),
+                vol.Optional(
+                    CONF_COALESCE_WINDOW,
+                    default=current.get(
+                        CONF_COALESCE_WINDOW, DEFAULT_COALESCE_WINDOW
+                    ),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=10)),
+                vol.Optional(
+                    CONF_CACHE_TTL,
+                    default=current.get(CONF_CACHE_TTL, DEFAULT_CACHE_TTL),
+                ): vol.All(int, vol.Range(min=0, max=86400)),
+                vol.Optional(
+                    CONF_CACHE_MAX_ENTRIES,
+                    default=current.get(
+                        CONF_CACHE_MAX_ENTRIES, DEFAULT_CACHE_MAX_ENTRIES
+                    ),
+                ): vol.All(int, vol.Range(min=1, max=1000)),
+                vol.Optional(
+                    CONF_ADAPTIVE_TIMEOUTS,
+                    default=current.get(
+                        CONF_ADAPTIVE_TIMEOUTS, DEFAULT_ADAPTIVE_TIMEOUTS
+                    ),
+                ): bool,
+                vol.Optional(
+                    CONF_STALL_TIMEOUT,
+                    default=current.get(CONF_STALL_TIMEOUT, DEFAULT_STALL_TIMEOUT),
+                ): vol.All(int, vol.Range(min=0, max=300)),
+                vol.Optional(
+                    CONF_MAX_RESPONSE_CHARS,
+                    default=current.get(
+                        CONF_MAX_RESPONSE_CHARS, DEFAULT_MAX_RESPONSE_CHARS
+                    ),
+                ): vol.All(int, vol.Range(min=1000, max=1_000_000)),
+                vol.Optional(
+                    CONF_MAX_QUEUED_CHARS,
+                    default=current.get(
+                        CONF_MAX_QUEUED_CHARS, DEFAULT_MAX_QUEUED_CHARS
+                    ),
+                ): vol.All(int, vol.Range(min=1000, max=1_000_000)),
+                vol.Optional(
+                    CONF_STREAM_OVERFLOW_POLICY,
+                    default=current.get(
+                        CONF_STREAM_OVERFLOW_POLICY, DEFAULT_STREAM_OVERFLOW_POLICY
+                    ),
+                ): _build_overflow_policy_selector(),
+                vol.Optional(
+                    CONF_SESSION_ROUTING,
+                    default=current.get(
+                        CONF_SESSION_ROUTING, DEFAULT_SESSION_ROUTING
+                    ),
+                ): _build_session_routing_selector(),
+                vol.Optional(
+                    CONF_HEDGE_REQUESTS,
+                    default=current.get(
+                        CONF_HEDGE_REQUESTS, DEFAULT_HEDGE_REQUESTS
+                    ),
+                ): bool,
+                vol.Optional(
+                    CONF_HEDGE_MODEL,
+                    default=current.get(CONF_HEDGE_MODEL, DEFAULT_HEDGE_MODEL),
+                ): str,
+                vol.Optional(
+                    CONF_HEDGE_DELAY,
+                    default=current.get(CONF_HEDGE_DELAY, DEFAULT_HEDGE_DELAY),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=30)),
+                vol.Optional(
+                    CONF_LOCAL_INTENTS,
+                    default=current.get(CONF_LOCAL_INTENTS, DEFAULT_LOCAL_INTENTS),
+                ): bool,
+                vol.Optional(
+                    CONF_AUTO_TIER,
+                    default=current.get(CONF_AUTO_TIER, DEFAULT_AUTO_TIER),
+                ): bool,
+                vol.Optional(
+                    CONF_FAST_MODEL,
+                    default=current.get(CONF_FAST_MODEL, DEFAULT_FAST_MODEL),
+                ): str,
+                vol.Optional(
+                    CONF_FAST_THINKING,
+                    default=current.get(CONF_FAST_THINKING, DEFAULT_FAST_THINKING),
+                ): thinking_selector,
+                vol.Optional(
+                    CONF_FAST_MAX_WORDS,
+                    default=current.get(CONF_FAST_MAX_WORDS, DEFAULT_FAST_MAX_WORDS),
+                ): vol.All(int, vol.Range(min=1, max=100)),
+                vol.Optional(
+                    CONF_PRESENCE_INTERVAL,
+                    default=current.get(
+                        CONF_PRESENCE_INTERVAL, DEFAULT_PRESENCE_INTERVAL
+                    ),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=60)),
             }
         )
 
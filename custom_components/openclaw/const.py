@@ -12,6 +12,21 @@ DEFAULT_MODEL = None
 DEFAULT_THINKING = None
 DEFAULT_STRIP_EMOJIS = True  # Strip emojis from TTS by default
 DEFAULT_TTS_MAX_CHARS = 0  # 0 disables TTS trimming
+DEFAULT_COALESCE_WINDOW = 0.5  # seconds; 0 disables request coalescing
+DEFAULT_CACHE_TTL = 0  # seconds; 0 disables the response cache
+DEFAULT_CACHE_MAX_ENTRIES = 32
+DEFAULT_ADAPTIVE_TIMEOUTS = False  # learn tighter deadlines from latency
+DEFAULT_STALL_TIMEOUT = 15  # seconds without agent events; 0 disables
+DEFAULT_SESSION_ROUTING = "none"  # one shared session for every conversation
+DEFAULT_HEDGE_REQUESTS = False
+DEFAULT_HEDGE_MODEL = ""  # empty: hedge with the configured model
+DEFAULT_HEDGE_DELAY = 1.0  # seconds before a backup request is sent
+DEFAULT_LOCAL_INTENTS = False  # try Home Assistant intents before the agent
+DEFAULT_AUTO_TIER = False  # pick the model tier per prompt complexity
+DEFAULT_FAST_MODEL = ""  # empty: fast tier uses the configured model
+DEFAULT_FAST_THINKING = "low"
+DEFAULT_FAST_MAX_WORDS = 12
+DEFAULT_PRESENCE_INTERVAL = 1.0  # seconds between presence sensor writes
 
 # Configuration keys
 CONF_HOST = "host"
@@ -24,6 +39,24 @@ CONF_MODEL = "model"
 CONF_THINKING = "thinking"
 CONF_STRIP_EMOJIS = "strip_emojis"
 CONF_TTS_MAX_CHARS = "tts_max_chars"
+CONF_COALESCE_WINDOW = "coalesce_window"
+CONF_CACHE_TTL = "cache_ttl"
+CONF_CACHE_MAX_ENTRIES = "cache_max_entries"
+CONF_ADAPTIVE_TIMEOUTS = "adaptive_timeouts"
+CONF_STALL_TIMEOUT = "stall_timeout"
+CONF_MAX_RESPONSE_CHARS = "max_response_chars"
+CONF_MAX_QUEUED_CHARS = "max_queued_chars"
+CONF_STREAM_OVERFLOW_POLICY = "stream_overflow_policy"
+CONF_SESSION_ROUTING = "session_routing"
+CONF_HEDGE_REQUESTS = "hedge_requests"
+CONF_HEDGE_MODEL = "hedge_model"
+CONF_HEDGE_DELAY = "hedge_delay"
+CONF_LOCAL_INTENTS = "local_intents"
+CONF_AUTO_TIER = "auto_tier"
+CONF_FAST_MODEL = "fast_model"
+CONF_FAST_THINKING = "fast_thinking"
+CONF_FAST_MAX_WORDS = "fast_max_words"
+CONF_PRESENCE_INTERVAL = "presence_interval"
 # Connection states
 STATE_CONNECTED = "connected"
 STATE_DISCONNECTED = "disconnected"
@@ -45,3 +78,56 @@ CLIENT_MODE = "backend"
 DEVICE_ROLE = "operator"
 DEVICE_SCOPES = ["operator.read", "operator.write"]
 CHALLENGE_TIMEOUT = 2.0  # seconds to wait for connect.challenge before fallback
+
+# Agent request deadlines
+AGENT_ACK_TIMEOUT = 10.0  # seconds to wait for the runId acknowledgement
+ADAPTIVE_MIN_SAMPLES = 5  # observations before learned deadlines apply
+ADAPTIVE_DEVIATIONS = 4  # learned deadline = mean + N * mean deviation
+ADAPTIVE_ACK_MIN_TIMEOUT = 2.0  # seconds
+ADAPTIVE_MIN_FRACTION = 0.5  # floor as a share of the configured timeouts
+
+# Gateway-side cancellation of runs nobody is waiting for
+AGENT_ABORT_METHOD = "chat.abort"
+AGENT_ABORT_TIMEOUT = 5.0  # seconds
+
+# Agent run buffering limits (characters)
+STREAM_OVERFLOW_MERGE = "merge"  # collapse a slow consumer's backlog
+STREAM_OVERFLOW_FAIL = "fail"  # fail the run once a cap is exceeded
+DEFAULT_MAX_RESPONSE_CHARS = 200_000
+DEFAULT_MAX_QUEUED_CHARS = 64_000
+DEFAULT_STREAM_OVERFLOW_POLICY = STREAM_OVERFLOW_MERGE
+
+# Length budget appended to the message; the agent API has no such option
+BREVITY_HINT = "\n\n(Keep the reply under {max_chars} characters.)"
+
+# Agent events that arrive before their run's ack is processed
+ORPHAN_EVENT_TTL = 10.0  # seconds to hold events for an unregistered run
+ORPHAN_EVENT_MAX_RUNS = 32
+
+# Session routing modes for conversations and satellites
+SESSION_ROUTING_NONE = "none"
+SESSION_ROUTING_CONVERSATION = "conversation"
+SESSION_ROUTING_DEVICE = "device"
+SESSION_ROUTE_MAX_ENTRIES = 64
+SESSION_ROUTE_IDLE_TIMEOUT = 1800  # seconds before a routed session is retired
+
+# Hedged agent requests
+HEDGE_SESSION_SUFFIX = "-hedge"  # backups run in a sibling session
+HEDGE_MAX_RATIO = 0.2  # at most this share of requests may be hedged
+HEDGE_BURST = 2  # hedges allowed back to back before the ratio applies
+
+# Model tiers chosen by query complexity
+QUERY_TIER_FAST = "fast"
+QUERY_TIER_FULL = "full"
+
+# Pushed gateway state; polling only covers missed or unsupported pushes
+STATE_POLL_INTERVAL = 600  # seconds
+
+# Bus event fired with the client ids that joined, left or changed
+EVENT_PRESENCE_CHANGED = f"{DOMAIN}_presence_changed"
+
+# Longest id list kept in sensor attributes; full data is in diagnostics
+SENSOR_ATTR_MAX_ITEMS = 5
+
+# Gateway connections closing sooner than this count as flapping
+CONNECTION_SHORT_SESSION = 60  # seconds
@@ -1,18 +1,24 @@
 """Conversation entity for OpenClaw integration."""
 
+import asyncio
 import logging
 import re
-from typing import Any, AsyncIterator
+import time
+from typing import Any, AsyncIterator, Awaitable
 
 from homeassistant.components import conversation
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import intent
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
+    CONF_LOCAL_INTENTS,
+    CONF_SESSION_ROUTING,
     CONF_STRIP_EMOJIS,
     CONF_TTS_MAX_CHARS,
+    DEFAULT_LOCAL_INTENTS,
+    DEFAULT_SESSION_ROUTING,
     DEFAULT_STRIP_EMOJIS,
     DEFAULT_TTS_MAX_CHARS,
     DOMAIN,
@@ -21,9 +27,11 @@ from .exceptions import (
     AgentExecutionError,
     GatewayAuthenticationError,
     GatewayConnectionError,
+    GatewayStalledError,
     GatewayTimeoutError,
 )
 from .gateway_client import OpenClawGatewayClient
+from .session_router import SessionRouter
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -55,6 +63,53 @@ def trim_tts_text(text: str, max_chars: int) -> str:
     return text[: max_chars - 3].rstrip() + "..."
 
 
+class _Turn:
+    """The in-flight reply to one utterance, cancellable by a newer one."""
+
+    __slots__ = (
+        "source",
+        "deadline",
+        "session_key",
+        "max_chars",
+        "cancelled",
+        "task",
+    )
+
+    def __init__(
+        self,
+        source: str | None,
+        deadline: float,
+        session_key: str,
+        max_chars: int | None = None,
+    ) -> None:
+        """Initialize the turn for a satellite or conversation.
+
+        Args:
+            source: Satellite or conversation the utterance came from
+            deadline: Monotonic time by which the whole reply must be done
+            session_key: Gateway session the reply runs in
+            max_chars: Spoken length budget, for voice-origin turns
+        """
+        self.source = source
+        self.deadline = deadline
+        self.session_key = session_key
+        self.max_chars = max_chars
+        self.cancelled = False
+        self.task: asyncio.Future | None = None
+
+    def attach(self, task: asyncio.Future) -> None:
+        """Attach the task doing the turn's gateway work."""
+        self.task = task
+        if self.cancelled:
+            task.cancel()
+
+    def cancel(self) -> None:
+        """Cancel the turn, now or as soon as its task is attached."""
+        self.cancelled = True
+        if self.task is not None:
+            self.task.cancel()
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
@@ -74,6 +129,10 @@ class OpenClawConversationEntity(conversation.ConversationEntity):
     _attr_supported_languages = "*"
     _attr_supports_streaming = False
 
+    # Streaming capabilities of the running HA version, probed once per class
+    _delta_streaming: bool | None = None
+    _result_streaming: bool | None = None
+
     def __init__(
         self, config_entry: ConfigEntry, gateway_client: OpenClawGatewayClient
     ) -> None:
@@ -81,11 +140,37 @@ class OpenClawConversationEntity(conversation.ConversationEntity):
         self._config_entry = config_entry
         self._gateway_client = gateway_client
         self._attr_unique_id = config_entry.entry_id
-        self._attr_supports_streaming = self._supports_streaming_result()
+        config = {**config_entry.data, **config_entry.options}
+        self._session_router = SessionRouter(
+            config.get(CONF_SESSION_ROUTING, DEFAULT_SESSION_ROUTING)
+        )
+        self._local_intents = config.get(CONF_LOCAL_INTENTS, DEFAULT_LOCAL_INTENTS)
+        # Latest turn per satellite or conversation; a new one preempts it
+        self._active_turns: dict[str, _Turn] = {}
+        self._attr_supports_streaming = (
+            self._supports_delta_stream() or self._supports_streaming_result()
+        )
 
-    @staticmethod
-    def _supports_streaming_result() -> bool:
+    @classmethod
+    def _supports_delta_stream(cls) -> bool:
+        """Return whether the HA chat log accepts streamed delta content."""
+        if cls._delta_streaming is None:
+            chat_log_cls = getattr(conversation, "ChatLog", None)
+            cls._delta_streaming = callable(
+                getattr(chat_log_cls, "async_add_delta_content_stream", None)
+            )
+        return cls._delta_streaming
+
+    @classmethod
+    def _supports_streaming_result(cls) -> bool:
         """Return whether the HA conversation result supports streaming."""
+        if cls._result_streaming is None:
+            cls._result_streaming = cls._probe_streaming_result()
+        return cls._result_streaming
+
+    @staticmethod
+    def _probe_streaming_result() -> bool:
+        """Inspect the HA conversation result class for stream support."""
         if hasattr(conversation, "StreamingConversationResult"):
             return True
         result_cls = getattr(conversation, "ConversationResult", None)
@@ -120,6 +205,7 @@ class OpenClawConversationEntity(conversation.ConversationEntity):
             "port": data.get("port"),
             "use_ssl": data.get("use_ssl"),
             "session_key": self._gateway_client.session_key,
+            "session_routing": self._session_router.mode,
             "model": self._gateway_client.model,
             "thinking": self._gateway_client.thinking,
             "strip_emojis": data.get(CONF_STRIP_EMOJIS, DEFAULT_STRIP_EMOJIS),
@@ -131,6 +217,20 @@ class OpenClawConversationEntity(conversation.ConversationEntity):
         """Return if entity is available."""
         return self._gateway_client.connected
 
+    async def async_added_to_hass(self) -> None:
+        """Track gateway connection changes for availability."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._gateway_client.add_connection_listener(
+                self._handle_connection_change
+            )
+        )
+
+    @callback
+    def _handle_connection_change(self, _connected: bool) -> None:
+        """Write availability as soon as the connection changes."""
+        self.async_write_ha_state()
+
     @property
     def supported_languages(self) -> list[str] | str:
         """Return supported languages."""
@@ -151,16 +251,59 @@ class OpenClawConversationEntity(conversation.ConversationEntity):
         # Extract user message
         user_message = user_input.text
 
+        if self._local_intents:
+            local_result = await self._async_handle_locally(user_input, chat_log)
+            if local_result is not None:
+                return local_result
+
+        conversation_id = (
+            getattr(chat_log, "conversation_id", None) or user_input.conversation_id
+        )
+        device_id = getattr(user_input, "device_id", None)
+        session_key = self._session_router.resolve(
+            self._gateway_client.session_key, conversation_id, device_id
+        )
+        # One budget for the whole turn, however late the stream is consumed;
+        # learned for the session and model tier this message will use
+        deadline = time.monotonic() + self._gateway_client.agent_budget(
+            user_message, session_key
+        )
+        turn = self._begin_turn(
+            _Turn(
+                device_id or conversation_id,
+                deadline,
+                session_key,
+                self._spoken_budget(device_id),
+            )
+        )
+
         try:
+            if self._supports_delta_stream():
+                result = await self._run_turn(
+                    turn,
+                    self._async_stream_to_chat_log(
+                        user_input, chat_log, user_message, turn
+                    ),
+                )
+                return result or self._preempted_result(user_input)
+
             streaming_result = self._build_streaming_result(
-                user_input, chat_log, user_message
+                user_input, chat_log, user_message, turn
             )
             if streaming_result is not None:
                 return streaming_result
 
-            response_text = await self._gateway_client.send_agent_request(
-                user_message
+            response_text = await self._run_turn(
+                turn,
+                self._gateway_client.send_agent_request(
+                    user_message,
+                    timeout=deadline - time.monotonic(),
+                    session_key=turn.session_key,
+                    max_chars=turn.max_chars,
+                ),
             )
+            if response_text is None:
+                return self._preempted_result(user_input)
             intent_response = intent.IntentResponse(language=user_input.language)
             self._finalize_response(
                 user_input, chat_log, response_text, intent_response
@@ -188,6 +331,14 @@ class OpenClawConversationEntity(conversation.ConversationEntity):
                 chat_log,
             )
 
+        except GatewayStalledError as err:
+            _LOGGER.warning("Gateway stalled: %s", err)
+            return self._create_error_result(
+                user_input,
+                "The assistant stopped responding. Please try again.",
+                chat_log,
+            )
+
         except GatewayTimeoutError as err:
             _LOGGER.warning("Gateway timeout: %s", err)
             return self._create_error_result(
@@ -217,6 +368,7 @@ class OpenClawConversationEntity(conversation.ConversationEntity):
         user_input: conversation.ConversationInput,
         chat_log: conversation.ChatLog,
         user_message: str,
+        turn: _Turn,
     ) -> conversation.ConversationResult | None:
         """Build a streaming conversation result when supported."""
         if not self._supports_streaming_result():
@@ -224,7 +376,11 @@ class OpenClawConversationEntity(conversation.ConversationEntity):
 
         intent_response = intent.IntentResponse(language=user_input.language)
         response_stream = self._stream_response(
-            user_input, chat_log, user_message, intent_response
+            user_input,
+            chat_log,
+            user_message,
+            intent_response,
+            turn,
         )
 
         result = conversation.ConversationResult(
@@ -274,24 +430,101 @@ class OpenClawConversationEntity(conversation.ConversationEntity):
             )
         return None
 
+    async def _async_stream_to_chat_log(
+        self,
+        user_input: conversation.ConversationInput,
+        chat_log: conversation.ChatLog,
+        user_message: str,
+        turn: _Turn,
+    ) -> conversation.ConversationResult:
+        """Stream the response into the chat log as delta content."""
+        chunks: list[str] = []
+
+        async def _deltas() -> AsyncIterator[dict[str, str]]:
+            yield {"role": "assistant"}
+            async for chunk in self._stream_chunks(user_message, turn):
+                chunks.append(chunk)
+                yield {"content": chunk}
+
+        async for _content in chat_log.async_add_delta_content_stream(
+            user_input.agent_id, _deltas()
+        ):
+            pass
+
+        intent_response = intent.IntentResponse(language=user_input.language)
+        self._set_speech(intent_response, "".join(chunks))
+        return conversation.ConversationResult(
+            response=intent_response,
+            conversation_id=user_input.conversation_id,
+        )
+
     async def _stream_response(
         self,
         user_input: conversation.ConversationInput,
         chat_log: conversation.ChatLog,
         user_message: str,
         intent_response: intent.IntentResponse,
+        turn: _Turn,
     ) -> AsyncIterator[str]:
-        """Stream response chunks from the Gateway."""
+        """Stream response chunks and write the full text when done.
+
+        HA consumes the stream from its own task, so the gateway stream is
+        pumped from a task owned by the turn, which a newer utterance from
+        the same source can cancel.
+        """
         chunks: list[str] = []
+        queue: asyncio.Queue[str | None] = asyncio.Queue()
+
+        async def _pump() -> None:
+            try:
+                async for chunk in self._stream_chunks(user_message, turn):
+                    queue.put_nowait(chunk)
+            finally:
+                queue.put_nowait(None)
+
+        pump = asyncio.ensure_future(_pump())
+        turn.attach(pump)
+        try:
+            while (chunk := await queue.get()) is not None:
+                chunks.append(chunk)
+                yield chunk
+        finally:
+            pump.cancel()
+            self._end_turn(turn)
+            # A superseded turn leaves its partial reply out of the chat log
+            if not turn.cancelled:
+                self._finalize_response(
+                    user_input, chat_log, "".join(chunks), intent_response
+                )
+
+    async def _stream_chunks(
+        self, user_message: str, turn: _Turn
+    ) -> AsyncIterator[str]:
+        """Stream response chunks from the Gateway within the turn deadline.
+
+        Errors before any content are replaced by a user-facing message.
+        Once a voice turn's spoken budget is filled the stream is closed,
+        which aborts the rest of the generation.
+        """
+        stream = self._gateway_client.stream_agent_request(
+            user_message,
+            timeout=turn.deadline - time.monotonic(),
+            session_key=turn.session_key,
+            max_chars=turn.max_chars,
+        )
         had_content = False
+        spoken = 0
         try:
-            async for chunk in self._gateway_client.stream_agent_request(
-                user_message
-            ):
+            async for chunk in stream:
                 if chunk:
-                    chunks.append(chunk)
                     had_content = True
                     yield chunk
+                    spoken += len(chunk)
+                    if turn.max_chars and spoken >= turn.max_chars:
+                        _LOGGER.debug(
+                            "Spoken budget of %d chars filled", turn.max_chars
+                        )
+                        break
         except GatewayAuthenticationError as err:
             _LOGGER.error("Gateway authentication error: %s", err)
             if not had_content:
@@ -299,7 +532,6 @@ class OpenClawConversationEntity(conversation.ConversationEntity):
                     "The gateway token is no longer valid. Please update it in "
                     "Settings, Devices and Services, OpenClaw, Configure."
                 )
-                chunks = [message]
                 yield message
         except GatewayConnectionError as err:
             _LOGGER.error("Gateway connection error: %s", err)
@@ -308,13 +540,16 @@ class OpenClawConversationEntity(conversation.ConversationEntity):
                     "I'm having trouble connecting to the Gateway. "
                     "Please check your configuration."
                 )
-                chunks = [message]
+                yield message
+        except GatewayStalledError as err:
+            _LOGGER.warning("Gateway stalled: %s", err)
+            if not had_content:
+                message = "The assistant stopped responding. Please try again."
                 yield message
         except GatewayTimeoutError as err:
             _LOGGER.warning("Gateway timeout: %s", err)
             if not had_content:
                 message = "The response took too long. Please try again."
-                chunks = [message]
                 yield message
         except AgentExecutionError as err:
             _LOGGER.error("Agent execution error: %s", err)
@@ -323,19 +558,132 @@ class OpenClawConversationEntity(conversation.ConversationEntity):
                     "I encountered an error while processing your request. "
                     "Please try again."
                 )
-                chunks = [message]
                 yield message
         except Exception:  # pylint: disable=broad-except
             _LOGGER.exception("Unexpected error in streaming response")
             if not had_content:
                 message = "An unexpected error occurred. Please try again."
-                chunks = [message]
                 yield message
         finally:
-            response_text = "".join(chunks)
-            self._finalize_response(
-                user_input, chat_log, response_text, intent_response
+            await stream.aclose()
+
+    def _begin_turn(self, turn: _Turn) -> _Turn:
+        """Start a turn, preempting the one still in flight from its source.
+
+        Cancelling the old turn's task releases its agent run, which the
+        client then aborts on the gateway unless another caller shares it.
+        """
+        if turn.source is None:
+            return turn
+        previous = self._active_turns.get(turn.source)
+        if previous is not None:
+            _LOGGER.debug("Preempting the previous turn from %s", turn.source)
+            previous.cancel()
+        self._active_turns[turn.source] = turn
+        return turn
+
+    def _spoken_budget(self, device_id: str | None) -> int | None:
+        """Return the TTS length budget for a voice-origin turn, if any.
+
+        Utterances from a device come through a voice pipeline; typed
+        ones keep the full response.
+        """
+        if device_id is None:
+            return None
+        config = {**self._config_entry.data, **self._config_entry.options}
+        max_chars = config.get(CONF_TTS_MAX_CHARS, DEFAULT_TTS_MAX_CHARS)
+        return max_chars if max_chars > 0 else None
+
+    def _end_turn(self, turn: _Turn) -> None:
+        """Forget a finished turn unless a newer one replaced it."""
+        if self._active_turns.get(turn.source) is turn:
+            del self._active_turns[turn.source]
+
+    async def _run_turn(self, turn: _Turn, work: Awaitable[Any]) -> Any | None:
+        """Run a turn's gateway work in its own task; None if preempted."""
+        task = asyncio.ensure_future(work)
+        turn.attach(task)
+        try:
+            return await task
+        except asyncio.CancelledError:
+            current = asyncio.current_task()
+            if not turn.cancelled or (current is not None and current.cancelling()):
+                raise
+            _LOGGER.debug("Turn from %s was superseded by a newer one", turn.source)
+            return None
+        finally:
+            self._end_turn(turn)
+
+    def _preempted_result(
+        self, user_input: conversation.ConversationInput
+    ) -> conversation.ConversationResult:
+        """Return a silent result for a turn replaced by a newer utterance."""
+        return conversation.ConversationResult(
+            response=intent.IntentResponse(language=user_input.language),
+            conversation_id=user_input.conversation_id,
+        )
+
+    async def _async_handle_locally(
+        self,
+        user_input: conversation.ConversationInput,
+        chat_log: conversation.ChatLog,
+    ) -> conversation.ConversationResult | None:
+        """Answer with Home Assistant's own intents, if one matches.
+
+        Returns None for utterances that should go to the agent. Hits and
+        misses are counted on the client together with the time saved.
+        """
+        started = time.monotonic()
+        try:
+            intent_response = await self._async_match_local_intent(user_input)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Local intent handling failed")
+            intent_response = None
+        elapsed = time.monotonic() - started
+        self._gateway_client.record_local_intent(intent_response is not None, elapsed)
+        if intent_response is None:
+            return None
+
+        _LOGGER.debug("Handled locally in %.3fs: %s", elapsed, user_input.text)
+        speech = intent_response.speech.get("plain", {}).get("speech", "")
+        chat_log.async_add_assistant_content_without_tools(
+            conversation.AssistantContent(
+                agent_id=user_input.agent_id,
+                content=speech,
             )
+        )
+        return conversation.ConversationResult(
+            response=intent_response,
+            conversation_id=user_input.conversation_id,
+        )
+
+    async def _async_match_local_intent(
+        self, user_input: conversation.ConversationInput
+    ) -> intent.IntentResponse | None:
+        """Run sentence triggers, then built-in intents, on the utterance.
+
+        Failed intents (an unknown device, say) fall through to the agent,
+        which may still make sense of them. HA versions without these
+        helpers never match.
+        """
+        handle_triggers = getattr(conversation, "async_handle_sentence_triggers", None)
+        if handle_triggers is not None:
+            trigger_text = await handle_triggers(self.hass, user_input)
+            if trigger_text is not None:
+                intent_response = intent.IntentResponse(language=user_input.language)
+                intent_response.async_set_speech(trigger_text)
+                return intent_response
+
+        handle_intents = getattr(conversation, "async_handle_intents", None)
+        if handle_intents is None:
+            return None
+        intent_response = await handle_intents(self.hass, user_input)
+        if (
+            intent_response is None
+            or intent_response.response_type == intent.IntentResponseType.ERROR
+        ):
+            return None
+        return intent_response
 
     def _finalize_response(
         self,
@@ -351,7 +699,12 @@ class OpenClawConversationEntity(conversation.ConversationEntity):
                 content=response_text,
             )
         )
+        self._set_speech(intent_response, response_text)
 
+    def _set_speech(
+        self, intent_response: intent.IntentResponse, response_text: str
+    ) -> None:
+        """Set TTS speech from the response text."""
         config = {**self._config_entry.data, **self._config_entry.options}
         should_strip = config.get(CONF_STRIP_EMOJIS, DEFAULT_STRIP_EMOJIS)
         speech_text = (
@@ -0,0 +1,144 @@
+"""Shared gateway state coordinator for OpenClaw diagnostic sensors."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+import logging
+from typing import Any, Callable
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import (
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
+
+from .const import DOMAIN, STATE_POLL_INTERVAL
+from .gateway_client import OpenClawGatewayClient
+
+_LOGGER = logging.getLogger(__name__)
+
+# hass.data key for coordinators shared by entries on the same gateway
+_COORDINATORS = f"{DOMAIN}_state_coordinators"
+
+# Slow safety net; status and health normally arrive as gateway pushes
+_UPDATE_INTERVAL = timedelta(seconds=STATE_POLL_INTERVAL)
+
+STATE_KINDS = ("status", "health")
+
+
+class GatewayStateCoordinator(DataUpdateCoordinator):
+    """Fetch status and health in one cycle for every entry on a gateway.
+
+    Data is a dict with "status" and "health" payloads. A payload whose
+    request failed is left out, so only its sensors lose their reading.
+    """
+
+    def __init__(self, hass: HomeAssistant, endpoint: str) -> None:
+        """Initialize the coordinator for a gateway host:port."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_state_{endpoint}",
+            update_interval=_UPDATE_INTERVAL,
+        )
+        self.endpoint = endpoint
+        self._clients: dict[str, OpenClawGatewayClient] = {}
+        self._unsubscribers: dict[str, Callable[[], None]] = {}
+
+    def attach(self, entry_id: str, client: OpenClawGatewayClient) -> None:
+        """Share this coordinator with an entry and follow its pushes."""
+        self.detach(entry_id)
+        self._clients[entry_id] = client
+        self._unsubscribers[entry_id] = client.add_state_listener(
+            self._handle_state_push
+        )
+
+    def detach(self, entry_id: str) -> bool:
+        """Stop serving an entry; return True once no entry is left."""
+        self._clients.pop(entry_id, None)
+        unsubscribe = self._unsubscribers.pop(entry_id, None)
+        if unsubscribe is not None:
+            unsubscribe()
+        return not self._clients
+
+    @callback
+    def _handle_state_push(self, kind: str, payload: dict[str, Any] | None) -> None:
+        """Take pushed state, or refetch when the gateway only signalled it.
+
+        Setting data also reschedules the next poll, so polling only
+        happens while the gateway stays quiet.
+        """
+        if kind not in STATE_KINDS:
+            return
+        if payload is None:
+            self.hass.async_create_task(self.async_request_refresh())
+            return
+        self.async_set_updated_data({**(self.data or {}), kind: payload})
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch status and health concurrently over one connected client."""
+        client = next(
+            (client for client in self._clients.values() if client.connected),
+            None,
+        )
+        if client is None:
+            raise UpdateFailed("Gateway not connected")
+
+        results = await asyncio.gather(
+            client.status(), client.health(), return_exceptions=True
+        )
+        data: dict[str, Any] = {}
+        errors: list[str] = []
+        for kind, result in zip(STATE_KINDS, results):
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+            if isinstance(result, Exception):
+                errors.append(f"{kind}: {result}")
+            else:
+                data[kind] = result
+        if not data:
+            raise UpdateFailed(f"State requests failed ({'; '.join(errors)})")
+        if errors:
+            _LOGGER.debug("Partial gateway state refresh: %s", "; ".join(errors))
+        return data
+
+
+async def async_get_state_coordinator(
+    hass: HomeAssistant, entry_id: str, client: OpenClawGatewayClient
+) -> GatewayStateCoordinator:
+    """Return the coordinator for the client's gateway, creating it once.
+
+    Only the entry that creates the coordinator waits for a first refresh;
+    later entries on the same gateway reuse its data.
+    """
+    coordinators: dict[str, GatewayStateCoordinator] = hass.data.setdefault(
+        _COORDINATORS, {}
+    )
+    coordinator = coordinators.get(client.endpoint)
+    if coordinator is not None:
+        coordinator.attach(entry_id, client)
+        return coordinator
+
+    coordinator = coordinators[client.endpoint] = GatewayStateCoordinator(
+        hass, client.endpoint
+    )
+    coordinator.attach(entry_id, client)
+    # Best-effort initial fetch — sensors will retry on next cycle
+    try:
+        await coordinator.async_refresh()
+    except Exception:  # noqa: BLE001
+        _LOGGER.debug("Initial %s refresh failed, will retry", coordinator.name)
+    return coordinator
+
+
+def async_release_state_coordinator(
+    hass: HomeAssistant, entry_id: str, endpoint: str
+) -> None:
+    """Detach an entry, dropping the coordinator after its last entry."""
+    coordinators: dict[str, GatewayStateCoordinator] = hass.data.get(
+        _COORDINATORS, {}
+    )
+    coordinator = coordinators.get(endpoint)
+    if coordinator is not None and coordinator.detach(entry_id):
+        coordinators.pop(endpoint, None)
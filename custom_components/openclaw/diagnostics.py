@@ -34,9 +34,26 @@ async def async_get_config_entry_diagnostics(
     }
 
     if gateway_client:
+        diagnostics["stats"] = gateway_client.stats
+        diagnostics["connection"] = gateway_client.connection_stats
+        diagnostics["latency"] = gateway_client.latency_stats
+        diagnostics["latency_quantiles"] = gateway_client.latency_quantiles
+        diagnostics["tiers"] = gateway_client.tier_stats
+        diagnostics["requests"] = gateway_client.request_stats
+        diagnostics["usage"] = gateway_client.usage_stats
+        # Full presence and sessions; sensors only carry a short summary
+        presence = gateway_client.presence
+        diagnostics["presence"] = {
+            "count": presence.count,
+            "clients": dict(presence.clients),
+        }
         try:
             diagnostics["health"] = await gateway_client.health()
         except Exception as err:  # pragma: no cover - best-effort diagnostics
             diagnostics["health_error"] = str(err)
+        try:
+            diagnostics["status"] = await gateway_client.status()
+        except Exception as err:  # pragma: no cover - best-effort diagnostics
+            diagnostics["status_error"] = str(err)
 
     return diagnostics
@@ -21,6 +21,10 @@ class GatewayTimeoutError(OpenClawError):
     """Request timeout - Gateway or agent took too long."""
 
 
+class GatewayStalledError(GatewayTimeoutError):
+    """Agent run stopped reporting progress before completing."""
+
+
 class AgentExecutionError(OpenClawError):
     """Agent execution failed."""
 
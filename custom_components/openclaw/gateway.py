@@ -17,6 +17,7 @@ from .const import (
     CLIENT_MODE,
     CLIENT_PLATFORM,
     CLIENT_VERSION,
+    CONNECTION_SHORT_SESSION,
     DEVICE_ROLE,
     DEVICE_SCOPES,
     PROTOCOL_MAX_VERSION,
@@ -32,6 +33,9 @@ from .exceptions import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Close codes with a known cause; anything else is reported by number
+_CLOSE_REASONS = {1000: "normal", 1001: "going_away", 1012: "restart"}
+
 
 class GatewayProtocol:
     """Low-level OpenClaw Gateway WebSocket protocol implementation."""
@@ -77,6 +81,28 @@ class GatewayProtocol:
         self._fatal_error: Exception | None = None
         self._on_fatal_error: Callable[[Exception], None] | None = None
 
+        # Subscribers to connection state transitions
+        self._connection_listeners: list[Callable[[bool], None]] = []
+
+        # Connection history and traffic, for flapping and bandwidth checks
+        self._connection_stats: dict[str, Any] = {
+            "connect_attempts": 0,
+            "connects": 0,
+            "reconnects": 0,
+            "short_sessions": 0,
+            "close_reasons": {},
+            "last_close_code": None,
+            "last_close_reason": None,
+            "last_connected": None,
+            "last_disconnected": None,
+            "last_session_seconds": None,
+            "messages_sent": 0,
+            "messages_received": 0,
+            "bytes_sent": 0,
+            "bytes_received": 0,
+        }
+        self._connected_since: float | None = None
+
         # Build WebSocket URI (include token as query param for gateway auth)
         protocol = "wss" if use_ssl else "ws"
         if token:
@@ -99,6 +125,23 @@ class GatewayProtocol:
         """Return the latest presence data."""
         return self._presence
 
+    @property
+    def connection_stats(self) -> dict[str, Any]:
+        """Return reconnect counts, session timing and traffic totals.
+
+        Timestamps are Unix times; session_seconds is the age of the
+        current connection, or None while disconnected.
+        """
+        stats = dict(self._connection_stats)
+        stats["close_reasons"] = dict(stats["close_reasons"])
+        stats["connect_failures"] = stats["connect_attempts"] - stats["connects"]
+        stats["session_seconds"] = (
+            None
+            if self._connected_since is None
+            else round(time.monotonic() - self._connected_since, 1)
+        )
+        return stats
+
     async def connect(self) -> None:
         """Connect to the Gateway and perform handshake."""
         if self._connect_task is not None:
@@ -109,8 +152,7 @@ class GatewayProtocol:
     async def disconnect(self) -> None:
         """Disconnect from the Gateway."""
         _LOGGER.info("Disconnecting from Gateway")
-        self._connected = False
-        self._connected_event.clear()
+        self._set_connected(False)
 
         # Cancel tasks
         if self._receive_task:
@@ -153,6 +195,7 @@ class GatewayProtocol:
         while True:
             try:
                 _LOGGER.info("Connecting to Gateway at %s", self._uri)
+                self._connection_stats["connect_attempts"] += 1
                 headers = {}
                 if self._token:
                     headers["Authorization"] = f"Bearer {self._token}"
@@ -166,8 +209,8 @@ class GatewayProtocol:
                     self._websocket = websocket
                     try:
                         await self._handshake()
-                        self._connected = True
-                        self._connected_event.set()
+                        self._record_session_start()
+                        self._set_connected(True)
                         _LOGGER.info("Connected to Gateway successfully")
                         self._last_pong = time.monotonic()
 
@@ -221,8 +264,8 @@ class GatewayProtocol:
                         return
 
                     finally:
-                        self._connected = False
-                        self._connected_event.clear()
+                        self._record_session_end(websocket)
+                        self._set_connected(False)
                         if self._receive_task:
                             self._receive_task.cancel()
                             try:
@@ -307,6 +350,7 @@ class GatewayProtocol:
             challenge_text = await asyncio.wait_for(
                 self._websocket.recv(), timeout=CHALLENGE_TIMEOUT
             )
+            self._count_received(challenge_text)
             challenge = json.loads(challenge_text)
             if (
                 challenge.get("type") == "event"
@@ -386,7 +430,7 @@ class GatewayProtocol:
         }
 
         _LOGGER.debug("Sending connect request")
-        await self._websocket.send(json.dumps(connect_request))
+        await self._send_json(connect_request)
 
         # Step 3: Wait for response
         try:
@@ -399,6 +443,7 @@ class GatewayProtocol:
                     response_text = await asyncio.wait_for(
                         self._websocket.recv(), timeout=10.0
                     )
+                    self._count_received(response_text)
                     response = json.loads(response_text)
 
                 if response.get("type") == "event":
@@ -471,6 +516,7 @@ class GatewayProtocol:
 
         try:
             async for message_text in self._websocket:
+                self._count_received(message_text)
                 try:
                     message = json.loads(message_text)
                     await self._handle_message(message)
@@ -551,7 +597,7 @@ class GatewayProtocol:
         if not self._websocket:
             return
         try:
-            await self._websocket.send(json.dumps({"type": "pong"}))
+            await self._send_json({"type": "pong"})
         except Exception as err:  # pylint: disable=broad-except
             _LOGGER.debug("Failed to send pong: %s", err)
 
@@ -562,7 +608,7 @@ class GatewayProtocol:
                 await asyncio.sleep(self._heartbeat_interval)
                 if not self._connected or not self._websocket:
                     break
-                await self._websocket.send(json.dumps({"type": "ping"}))
+                await self._send_json({"type": "ping"})
             except asyncio.CancelledError:
                 raise
             except Exception as err:  # pylint: disable=broad-except
@@ -591,6 +637,77 @@ class GatewayProtocol:
                     exc_info=True,
                 )
 
+    async def _send_json(self, message: dict[str, Any]) -> None:
+        """Send a message, counting it towards the traffic totals."""
+        text = json.dumps(message)
+        await self._websocket.send(text)
+        # json.dumps escapes non-ASCII, so characters equal bytes
+        self._connection_stats["messages_sent"] += 1
+        self._connection_stats["bytes_sent"] += len(text)
+
+    def _count_received(self, message: str | bytes) -> None:
+        """Count a received message towards the traffic totals."""
+        size = len(message) if isinstance(message, bytes) else len(message.encode())
+        self._connection_stats["messages_received"] += 1
+        self._connection_stats["bytes_received"] += size
+
+    def _record_session_start(self) -> None:
+        """Record a completed handshake."""
+        stats = self._connection_stats
+        if stats["connects"]:
+            stats["reconnects"] += 1
+        stats["connects"] += 1
+        stats["last_connected"] = time.time()
+        self._connected_since = time.monotonic()
+
+    def _record_session_end(self, websocket: Any) -> None:
+        """Record how long a connection lived and why it closed.
+
+        A connection that ends without a close frame (dropped, timed out
+        or cancelled) has no close code and is reported as "dropped".
+        """
+        if self._connected_since is None:
+            return
+        duration = time.monotonic() - self._connected_since
+        self._connected_since = None
+        code = getattr(websocket, "close_code", None)
+        reason = "dropped" if code is None else _CLOSE_REASONS.get(code, str(code))
+        stats = self._connection_stats
+        stats["last_session_seconds"] = round(duration, 1)
+        stats["last_disconnected"] = time.time()
+        stats["last_close_code"] = code
+        stats["last_close_reason"] = reason
+        stats["close_reasons"][reason] = stats["close_reasons"].get(reason, 0) + 1
+        if duration < CONNECTION_SHORT_SESSION:
+            stats["short_sessions"] += 1
+
+    def add_connection_listener(
+        self, listener: Callable[[bool], None]
+    ) -> Callable[[], None]:
+        """Subscribe to connection state changes; returns an unsubscribe callable."""
+        self._connection_listeners.append(listener)
+
+        def _remove() -> None:
+            if listener in self._connection_listeners:
+                self._connection_listeners.remove(listener)
+
+        return _remove
+
+    def _set_connected(self, connected: bool) -> None:
+        """Record the connection state and publish transitions."""
+        if connected:
+            self._connected_event.set()
+        else:
+            self._connected_event.clear()
+        if connected == self._connected:
+            return
+        self._connected = connected
+        for listener in list(self._connection_listeners):
+            try:
+                listener(connected)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error in connection state listener")
+
     def on_event(self, event_name: str, handler: Callable) -> None:
         """Register an event handler."""
         if event_name not in self._event_handlers:
@@ -634,7 +751,7 @@ class GatewayProtocol:
         try:
             # Send request
             _LOGGER.debug("Sending request: %s %s", method, request_id)
-            await self._websocket.send(json.dumps(request))
+            await self._send_json(request)
 
             # Wait for response
             response = await asyncio.wait_for(future, timeout=timeout)
@@ -1,43 +1,256 @@
 """High-level OpenClaw Gateway API client."""
 
 import asyncio
+from collections import OrderedDict, deque
+from datetime import date
+import functools
 import logging
 import time
 import uuid
-from typing import Any, AsyncIterator
-
+from typing import Any, AsyncGenerator, AsyncIterator, Awaitable, Callable
+
+from .const import (
+    ADAPTIVE_ACK_MIN_TIMEOUT,
+    ADAPTIVE_DEVIATIONS,
+    ADAPTIVE_MIN_FRACTION,
+    ADAPTIVE_MIN_SAMPLES,
+    AGENT_ABORT_METHOD,
+    AGENT_ABORT_TIMEOUT,
+    AGENT_ACK_TIMEOUT,
+    BREVITY_HINT,
+    DEFAULT_ADAPTIVE_TIMEOUTS,
+    DEFAULT_AUTO_TIER,
+    DEFAULT_CACHE_MAX_ENTRIES,
+    DEFAULT_CACHE_TTL,
+    DEFAULT_COALESCE_WINDOW,
+    DEFAULT_FAST_MAX_WORDS,
+    DEFAULT_FAST_MODEL,
+    DEFAULT_FAST_THINKING,
+    DEFAULT_HEDGE_DELAY,
+    DEFAULT_HEDGE_MODEL,
+    DEFAULT_HEDGE_REQUESTS,
+    DEFAULT_MAX_QUEUED_CHARS,
+    DEFAULT_MAX_RESPONSE_CHARS,
+    DEFAULT_STALL_TIMEOUT,
+    DEFAULT_STREAM_OVERFLOW_POLICY,
+    HEDGE_BURST,
+    HEDGE_MAX_RATIO,
+    HEDGE_SESSION_SUFFIX,
+    ORPHAN_EVENT_MAX_RUNS,
+    ORPHAN_EVENT_TTL,
+    QUERY_TIER_FAST,
+    STREAM_OVERFLOW_FAIL,
+)
 from .exceptions import (
     AgentExecutionError,
     GatewayAuthenticationError,
     GatewayConnectionError,
+    GatewayStalledError,
     GatewayTimeoutError,
     ProtocolError,
 )
 from .gateway import GatewayProtocol
+from .latency import (
+    METRIC_ACK,
+    METRIC_FIRST_TOKEN,
+    METRIC_GAP,
+    METRIC_TOTAL,
+    LatencyTracker,
+    RollingQuantiles,
+    target_key,
+)
+from .presence import PresenceModel
+from .query_tier import QueryClassifier
+from .throughput import (
+    OUTCOME_COMPLETED,
+    REQUESTS,
+    RequestMeter,
+    failure_outcome,
+)
+from .usage import UsageTracker, parse_usage
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def normalize_message(message: str) -> str:
+    """Normalize a user message for request matching."""
+    return " ".join(message.split()).casefold()
+
+
+class _StreamBuffer:
+    """Pending stream chunks for one subscriber, with size accounting."""
+
+    def __init__(self) -> None:
+        """Initialize the stream buffer."""
+        self._chunks: deque[str] = deque()
+        self._closed = False
+        self._ready = asyncio.Event()
+        self.queued_chars = 0
+
+    def put(self, chunk: str) -> None:
+        """Queue a chunk for the consumer."""
+        self._chunks.append(chunk)
+        self.queued_chars += len(chunk)
+        self._ready.set()
+
+    def merge(self, limit: int) -> None:
+        """Collapse the backlog into one chunk of at most limit characters.
+
+        The oldest text goes first, so the consumer skips ahead to the
+        newest output instead of the backlog growing without bound.
+        """
+        merged = "".join(self._chunks)
+        merged = merged[max(len(merged) - limit, 0) :]
+        self.discard()
+        if merged:
+            self.put(merged)
+
+    def discard(self) -> None:
+        """Drop the queued chunks, e.g. text a newer update superseded."""
+        self._chunks.clear()
+        self.queued_chars = 0
+
+    def close(self) -> None:
+        """Signal the end of the stream after any queued chunks."""
+        self._closed = True
+        self._ready.set()
+
+    async def get(self) -> str | None:
+        """Return the next chunk, or None once the stream has ended."""
+        while not self._chunks:
+            if self._closed:
+                return None
+            self._ready.clear()
+            await self._ready.wait()
+        chunk = self._chunks.popleft()
+        self.queued_chars -= len(chunk)
+        return chunk
+
+
 class AgentRun:
     """Tracks an agent run and buffers its events."""
 
-    def __init__(self, run_id: str, stream: bool = False) -> None:
+    def __init__(
+        self,
+        run_id: str,
+        stream: bool = False,
+        session_key: str | None = None,
+        max_text_chars: int = DEFAULT_MAX_RESPONSE_CHARS,
+        max_queued_chars: int = DEFAULT_MAX_QUEUED_CHARS,
+        overflow_policy: str = DEFAULT_STREAM_OVERFLOW_POLICY,
+    ) -> None:
         """Initialize agent run tracker."""
         self.run_id = run_id
+        self.session_key = session_key
         self.status: str | None = None
         self.summary: str | None = None
         self.complete_event = asyncio.Event()
+        # Request timing, used for stall detection and latency learning
+        self.latency_keys: tuple[str, ...] = ()
+        self.tier: str | None = None
+        self.model: str | None = None
+        # Latest token usage reported for the run, until it is recorded
+        self.usage: dict[str, float] | None = None
+        self.started = time.monotonic()
+        self.last_activity = self.started
+        self.first_output: float | None = None
+        self.max_gap = 0.0
         # Gateway sends cumulative text, not incremental
         self._full_text: str = ""
-        self._stream_queue: asyncio.Queue[str | None] | None = (
-            asyncio.Queue() if stream else None
+        self._max_text_chars = max_text_chars
+        self._max_queued_chars = max_queued_chars
+        self._overflow_policy = overflow_policy
+        self.truncated = False
+        self.overflowed = False
+        # Times a text or backlog cap was exceeded, whatever the policy
+        self.overflows = 0
+        self._peak_text_chars = 0
+        self._peak_queued_chars = 0
+        self._subscribers: list[_StreamBuffer] = []
+        self._stream_queue: _StreamBuffer | None = (
+            self.subscribe() if stream else None
         )
-        self._streamed_any = False
+
+    @property
+    def buffer_usage(self) -> dict[str, int]:
+        """Return current and peak buffered characters for this run."""
+        return {
+            "text_chars": len(self._full_text),
+            "peak_text_chars": self._peak_text_chars,
+            "queued_chars": sum(
+                buffer.queued_chars for buffer in self._subscribers
+            ),
+            "peak_queued_chars": self._peak_queued_chars,
+        }
+
+    def touch(self) -> None:
+        """Record that the gateway reported progress on this run."""
+        now = time.monotonic()
+        self.max_gap = max(self.max_gap, now - self.last_activity)
+        self.last_activity = now
+
+    def _next_wait(self, deadline: float, stall_timeout: float | None) -> float:
+        """Return how long to wait for progress, raising once out of time."""
+        now = time.monotonic()
+        remaining = deadline - now
+        if remaining <= 0:
+            raise GatewayTimeoutError("Agent response timeout")
+        if stall_timeout is None:
+            return remaining
+        idle_left = self.last_activity + stall_timeout - now
+        if idle_left <= 0:
+            raise GatewayStalledError(
+                f"Agent run stalled: no events for {stall_timeout:.1f}s"
+            )
+        return min(remaining, idle_left)
+
+    async def wait_complete(
+        self, timeout: float, stall_timeout: float | None = None
+    ) -> None:
+        """Wait for completion, failing on timeout or prolonged inactivity."""
+        deadline = time.monotonic() + timeout
+        while not self.complete_event.is_set():
+            wait = self._next_wait(deadline, stall_timeout)
+            try:
+                await asyncio.wait_for(self.complete_event.wait(), timeout=wait)
+            except asyncio.TimeoutError:
+                continue
+
+    def subscribe(self) -> _StreamBuffer:
+        """Return a new stream buffer primed with the output received so far.
+
+        Coalesced callers attach to a run that may already be underway, so
+        the buffer starts with the text received up to this point.
+        """
+        buffer = _StreamBuffer()
+        if self._full_text:
+            buffer.put(self._full_text)
+        if self.complete_event.is_set():
+            if self.summary and not self._full_text:
+                buffer.put(self.summary)
+            buffer.close()
+        self._subscribers.append(buffer)
+        return buffer
+
+    def unsubscribe(self, buffer: _StreamBuffer) -> None:
+        """Stop delivering chunks to a stream buffer."""
+        if buffer in self._subscribers:
+            self._subscribers.remove(buffer)
 
     def add_output(self, output: str) -> None:
         """Add output to buffer. Gateway sends cumulative text, extract only new chars."""
-        if not output:
+        if not output or self.overflowed:
             return
+        if self.first_output is None:
+            self.first_output = time.monotonic()
+
+        if len(output) > self._max_text_chars:
+            self._overflow(
+                f"Agent response exceeded {self._max_text_chars} characters"
+            )
+            if self.overflowed:
+                return
+            output = output[: self._max_text_chars]
 
         # Gateway sends full text each time, only append what's new
         if output.startswith(self._full_text):
@@ -61,21 +274,53 @@ class AgentRun:
             )
             new_text = output
             self._full_text = output
+            # Unread text from the replaced output is stale
+            for buffer in self._subscribers:
+                buffer.discard()
+
+        self._peak_text_chars = max(self._peak_text_chars, len(self._full_text))
+        if new_text:
+            for buffer in list(self._subscribers):
+                buffer.put(new_text)
+                self._peak_queued_chars = max(
+                    self._peak_queued_chars, buffer.queued_chars
+                )
+                if buffer.queued_chars > self._max_queued_chars:
+                    self._overflow(
+                        f"Stream consumer fell behind by "
+                        f"{buffer.queued_chars} characters",
+                        buffer,
+                    )
+                    if self.overflowed:
+                        return
+
+    def _overflow(self, reason: str, buffer: _StreamBuffer | None = None) -> None:
+        """Apply the overflow policy after a buffer cap was exceeded."""
+        self.overflows += 1
+        if self._overflow_policy == STREAM_OVERFLOW_FAIL:
+            _LOGGER.warning("Failing agent run %s: %s", self.run_id, reason)
+            self.overflowed = True
+            self.set_complete("error", reason)
+            return
 
-        if new_text and self._stream_queue is not None:
-            self._stream_queue.put_nowait(new_text)
-            self._streamed_any = True
+        if buffer is not None:
+            # A slow consumer skips to the newest output, one catch-up read
+            buffer.merge(self._max_queued_chars)
+        elif not self.truncated:
+            _LOGGER.warning("Truncating agent run %s: %s", self.run_id, reason)
+            self.truncated = True
 
     def set_complete(self, status: str, summary: str | None = None) -> None:
         """Mark run as complete."""
+        if self.overflowed and self.complete_event.is_set():
+            return
         self.status = status
         self.summary = summary
         self.complete_event.set()
-        if self._stream_queue is not None:
-            if summary and not self._streamed_any:
-                self._stream_queue.put_nowait(summary)
-                self._streamed_any = True
-            self._stream_queue.put_nowait(None)
+        for buffer in self._subscribers:
+            if summary and not self._full_text:
+                buffer.put(summary)
+            buffer.close()
 
     def get_response(self) -> str:
         """Get assembled response."""
@@ -83,29 +328,216 @@ class AgentRun:
             return self.summary
         return self._full_text
 
-    async def iter_stream(self, timeout: float) -> AsyncIterator[str]:
-        """Yield output chunks until completion or timeout."""
-        if self._stream_queue is None:
-            self._stream_queue = asyncio.Queue()
+    async def iter_stream(
+        self,
+        timeout: float,
+        queue: _StreamBuffer | None = None,
+        stall_timeout: float | None = None,
+    ) -> AsyncIterator[str]:
+        """Yield output chunks until completion, timeout or a stall."""
+        if queue is None:
+            if self._stream_queue is None:
+                self._stream_queue = self.subscribe()
+            queue = self._stream_queue
 
         deadline = time.monotonic() + timeout
         while True:
-            remaining = deadline - time.monotonic()
-            if remaining <= 0:
-                raise GatewayTimeoutError("Agent response timeout")
+            wait = self._next_wait(deadline, stall_timeout)
             try:
-                chunk = await asyncio.wait_for(
-                    self._stream_queue.get(), timeout=remaining
-                )
-            except asyncio.TimeoutError as err:
-                raise GatewayTimeoutError(
-                    "Agent response timeout"
-                ) from err
+                chunk = await asyncio.wait_for(queue.get(), timeout=wait)
+            except asyncio.TimeoutError:
+                continue
             if chunk is None:
                 break
             yield chunk
 
 
+class _ResponseCache:
+    """TTL-bounded LRU cache of completed agent responses."""
+
+    def __init__(self, ttl: float, max_entries: int) -> None:
+        """Initialize the response cache."""
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[Any, ...], tuple[float, str]] = (
+            OrderedDict()
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether responses are cached at all."""
+        return self._ttl > 0 and self._max_entries > 0
+
+    def __len__(self) -> int:
+        """Return the number of cached responses, including expired ones."""
+        return len(self._entries)
+
+    def get(self, key: tuple[Any, ...]) -> str | None:
+        """Return a fresh cached response, evicting it if expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, response = entry
+        if time.monotonic() >= expires:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return response
+
+    def put(self, key: tuple[Any, ...], response: str) -> None:
+        """Store a response, evicting the least recently used overflow."""
+        self._entries[key] = (time.monotonic() + self._ttl, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
+
+
+class _InflightAgentRequest:
+    """An agent request that identical requests can attach to."""
+
+    def __init__(self, key: tuple[Any, ...]) -> None:
+        """Initialize the in-flight request."""
+        self.key = key
+        self.started = time.monotonic()
+        self.subscribers = 1
+        self.run_future: asyncio.Future[AgentRun] = (
+            asyncio.get_running_loop().create_future()
+        )
+        # Mark failures as retrieved when nobody else attached
+        self.run_future.add_done_callback(
+            lambda fut: fut.cancelled() or fut.exception()
+        )
+
+    def joinable(self, window: float) -> bool:
+        """Return whether a new request may still attach to this one."""
+        if time.monotonic() - self.started > window:
+            return False
+        if self.run_future.done() and self.run_future.exception() is not None:
+            return False
+        return True
+
+    def fail(self, err: BaseException) -> None:
+        """Propagate an acknowledgement failure to attached callers."""
+        if not self.run_future.done():
+            self.run_future.set_exception(err)
+
+
+class _OrphanRun:
+    """Events held for a run whose ack hasn't been processed, folded into one.
+
+    The gateway sends cumulative text, so only the latest output is kept,
+    along with the status, phase, summary, model and usage last reported.
+    """
+
+    __slots__ = ("first_seen", "payload", "events")
+
+    def __init__(self, run_id: str, first_seen: float) -> None:
+        """Initialize the held run."""
+        self.first_seen = first_seen
+        self.payload: dict[str, Any] = {"runId": run_id}
+        self.events = 0
+
+    def fold(self, payload: dict[str, Any]) -> None:
+        """Merge an agent event into the held payload."""
+        self.events += 1
+        held = self.payload
+        data = payload.get("data")
+        if not isinstance(data, dict):
+            data = {}
+        output = payload.get("output") or data.get("text")
+        if output:
+            held["output"] = output
+        # A terminal status is final; later events can't reopen the run
+        if payload.get("status") and held.get("status") not in ("ok", "error"):
+            held["status"] = payload["status"]
+        for field in ("summary", "usage", "model"):
+            if payload.get(field):
+                held[field] = payload[field]
+        for field in ("phase", "usage", "model"):
+            if data.get(field):
+                held.setdefault("data", {})[field] = data[field]
+
+
+class _AgentTarget:
+    """The session and agent options a request runs with."""
+
+    __slots__ = ("session_key", "model", "thinking", "max_chars", "tier")
+
+    def __init__(
+        self,
+        session_key: str,
+        model: str | None,
+        thinking: str | None,
+        max_chars: int | None = None,
+        tier: str | None = None,
+    ) -> None:
+        """Initialize the target."""
+        self.session_key = session_key
+        self.model = model
+        self.thinking = thinking
+        self.max_chars = max_chars
+        # Complexity tier that chose model and thinking, if tiering is on
+        self.tier = tier
+
+    @property
+    def key(self) -> tuple[Any, ...]:
+        """Return the part of a request key that identifies the target."""
+        return (self.session_key, self.model, self.thinking, self.max_chars)
+
+    def options(self) -> dict[str, Any]:
+        """Return the agent request options for this target."""
+        options: dict[str, Any] = {}
+        if self.model:
+            options["model"] = self.model
+        if self.thinking:
+            options["thinking"] = self.thinking
+        return options
+
+    def message(self, message: str) -> str:
+        """Return the message text sent, with the length budget as a hint."""
+        if not self.max_chars:
+            return message
+        return message + BREVITY_HINT.format(max_chars=self.max_chars)
+
+
+def _local_today(hass: Any | None) -> Callable[[], date]:
+    """Return a callable for today's date in the HA time zone, if running in HA."""
+    if hass is None:
+        return date.today
+
+    from homeassistant.util import dt as dt_util
+
+    return lambda: dt_util.now().date()
+
+
+async def _close_hedge_streams(
+    first_chunks: list[asyncio.Future], streams: list[AsyncGenerator[str, None]]
+) -> None:
+    """Cancel pending first-chunk reads, then close their streams.
+
+    The reads must unwind before their streams can be closed; closing a
+    stream releases its run, which aborts it on the gateway.
+    """
+    unfinished = [task for task in first_chunks if not task.done()]
+    for task in unfinished:
+        task.cancel()
+    if unfinished:
+        await asyncio.wait(unfinished)
+    for stream in streams:
+        await stream.aclose()
+
+
+def _hedge_task(awaitable: Awaitable[Any]) -> asyncio.Future:
+    """Schedule a hedged attempt whose failure may go unobserved."""
+    task = asyncio.ensure_future(awaitable)
+    task.add_done_callback(lambda fut: fut.cancelled() or fut.exception())
+    return task
+
+
 class OpenClawGatewayClient:
     """High-level Gateway API client with event buffering."""
 
@@ -120,6 +552,21 @@ class OpenClawGatewayClient:
         model: str | None = None,
         thinking: str | None = None,
         hass: Any | None = None,
+        coalesce_window: float = DEFAULT_COALESCE_WINDOW,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+        cache_max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        max_response_chars: int = DEFAULT_MAX_RESPONSE_CHARS,
+        max_queued_chars: int = DEFAULT_MAX_QUEUED_CHARS,
+        stream_overflow_policy: str = DEFAULT_STREAM_OVERFLOW_POLICY,
+        adaptive_timeouts: bool = DEFAULT_ADAPTIVE_TIMEOUTS,
+        stall_timeout: float = DEFAULT_STALL_TIMEOUT,
+        hedge_requests: bool = DEFAULT_HEDGE_REQUESTS,
+        hedge_model: str | None = DEFAULT_HEDGE_MODEL,
+        hedge_delay: float = DEFAULT_HEDGE_DELAY,
+        auto_tier: bool = DEFAULT_AUTO_TIER,
+        fast_model: str | None = DEFAULT_FAST_MODEL,
+        fast_thinking: str | None = DEFAULT_FAST_THINKING,
+        fast_max_words: int = DEFAULT_FAST_MAX_WORDS,
     ) -> None:
         """Initialize the Gateway client."""
         self._gateway = GatewayProtocol(
@@ -130,10 +577,84 @@ class OpenClawGatewayClient:
         self._model = model
         self._thinking = thinking
         self._agent_runs: dict[str, AgentRun] = {}
+        self._adaptive_timeouts = adaptive_timeouts
+        self._stall_timeout = stall_timeout
+        self._hedge_requests = hedge_requests
+        self._hedge_model = hedge_model or None
+        self._hedge_delay = hedge_delay
+        self._hedge_tokens = float(HEDGE_BURST)
+        self._classifier = QueryClassifier(fast_max_words) if auto_tier else None
+        self._fast_model = fast_model or None
+        self._fast_thinking = fast_thinking or None
+        # Completion latency per chosen tier, for tuning the classifier
+        self._tier_latency: dict[str, RollingQuantiles] = {}
+        self._latency = LatencyTracker(hass, f"{host}_{port}")
+        # Recent latency distribution across all targets, for sensors
+        self._quantiles = {
+            metric: RollingQuantiles()
+            for metric in (METRIC_ACK, METRIC_FIRST_TOKEN, METRIC_TOTAL)
+        }
+        self._requests = RequestMeter(_local_today(hass))
+        self._usage = UsageTracker(_local_today(hass))
+        self._coalesce_window = coalesce_window
+        self._inflight_requests: dict[tuple[Any, ...], _InflightAgentRequest] = {}
+        self._response_cache = _ResponseCache(cache_ttl, cache_max_entries)
+        self._run_limits: dict[str, Any] = {
+            "max_text_chars": max_response_chars,
+            "max_queued_chars": max_queued_chars,
+            "overflow_policy": stream_overflow_policy,
+        }
+        self._stats: dict[str, int] = {
+            "coalesced_requests": 0,
+            "cache_hits": 0,
+            "cache_misses": 0,
+            "orphan_events_buffered": 0,
+            "orphan_events_replayed": 0,
+            "orphan_events_dropped": 0,
+            "early_event_runs": 0,
+            "aborts_requested": 0,
+            "aborts_succeeded": 0,
+            "aborts_failed": 0,
+            "last_abort_latency_ms": 0,
+            "stalled_runs": 0,
+            "hedged_requests": 0,
+            "hedges_skipped": 0,
+            "hedge_primary_wins": 0,
+            "hedge_backup_wins": 0,
+            "local_intent_hits": 0,
+            "local_intent_misses": 0,
+            "local_intent_saved_ms": 0,
+            "local_intent_overhead_ms": 0,
+            "fast_tier_requests": 0,
+            "full_tier_requests": 0,
+            "peak_response_chars": 0,
+            "peak_queued_chars": 0,
+            "buffer_overflows": 0,
+            "truncated_runs": 0,
+            "overflowed_runs": 0,
+        }
+        # Run starts and aborts outliving the caller that began them
+        self._background_tasks: set[asyncio.Task] = set()
+        # Events for runs whose ack hasn't been processed yet, by runId
+        self._orphan_events: OrderedDict[str, _OrphanRun] = OrderedDict()
+        # Agent requests sent whose run isn't registered yet
+        self._pending_acks = 0
 
         # Register event handlers
         self._gateway.on_event("agent", self._handle_agent_event)
         self._gateway.on_event("presence", self._handle_presence_event)
+        self._gateway.on_event("health", self._handle_health_event)
+        self._gateway.on_event("status", self._handle_status_event)
+
+        # Subscribers to pushed gateway state, called with (kind, payload)
+        self._state_listeners: list[
+            Callable[[str, dict[str, Any] | None], None]
+        ] = []
+        self._state_versions: dict[str, Any] = {}
+
+        # Connected clients by id, seeded from each handshake snapshot
+        self._presence = PresenceModel()
+        self._gateway.add_connection_listener(self._handle_connection_change)
 
     @property
     def fatal_error(self) -> Exception | None:
@@ -147,6 +668,7 @@ class OpenClawGatewayClient:
             GatewayAuthenticationError: If authentication fails.
             GatewayConnectionError: If connection fails or times out.
         """
+        await self._latency.async_load()
         await self._gateway.connect()
 
         # Wait for connection to be established (event-based, no polling)
@@ -169,6 +691,8 @@ class OpenClawGatewayClient:
 
     async def disconnect(self) -> None:
         """Disconnect from Gateway."""
+        for task in list(self._background_tasks):
+            task.cancel()
         await self._gateway.disconnect()
 
     @property
@@ -176,6 +700,88 @@ class OpenClawGatewayClient:
         """Return whether connected to Gateway."""
         return self._gateway.connected
 
+    def add_connection_listener(
+        self, listener: Callable[[bool], None]
+    ) -> Callable[[], None]:
+        """Subscribe to connect/disconnect transitions of the gateway."""
+        return self._gateway.add_connection_listener(listener)
+
+    @property
+    def connection_stats(self) -> dict[str, Any]:
+        """Return reconnect counts, session timing and traffic totals."""
+        return self._gateway.connection_stats
+
+    @property
+    def endpoint(self) -> str:
+        """Return the gateway host:port, shared by entries on one gateway."""
+        return f"{self._gateway._host}:{self._gateway._port}"
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return a snapshot of the client's request counters."""
+        return dict(self._stats)
+
+    @property
+    def latency_stats(self) -> dict[str, Any]:
+        """Return learned latency estimates per session/model/thinking."""
+        return self._latency.as_dict()
+
+    @property
+    def latency_quantiles(self) -> dict[str, dict[str, Any]]:
+        """Return recent p50/p95 ack, first-token and total latency."""
+        return {
+            metric: quantiles.as_dict()
+            for metric, quantiles in self._quantiles.items()
+        }
+
+    @property
+    def request_stats(self) -> dict[str, Any]:
+        """Return request and outcome counts, daily and per minute."""
+        return self._requests.as_dict()
+
+    @property
+    def usage_stats(self) -> dict[str, Any]:
+        """Return token usage and cost, daily, rolling and per session/model."""
+        return self._usage.as_dict()
+
+    @property
+    def tier_stats(self) -> dict[str, Any]:
+        """Return p50/p95 completion latency per chosen model tier."""
+        return {
+            tier: quantiles.as_dict()
+            for tier, quantiles in self._tier_latency.items()
+        }
+
+    def agent_budget(
+        self, message: str | None = None, session_key: str | None = None
+    ) -> float:
+        """Return the end-to-end budget in seconds for a request starting now.
+
+        Given the message and session, the budget is the one learned for the
+        model tier and session the request will run with.
+        """
+        if message is None:
+            return self._agent_deadlines()[1]
+        target = self._agent_target(message, session_key, None, peek=True)
+        return self._agent_deadlines(target)[1]
+
+    def record_local_intent(self, handled: bool, elapsed: float) -> None:
+        """Count an utterance tried against local intents before the agent.
+
+        A hit saves about the learned agent latency, less the local matching
+        time; a miss adds its matching time to the agent round trip.
+        """
+        elapsed_ms = round(elapsed * 1000)
+        if not handled:
+            self._stats["local_intent_misses"] += 1
+            self._stats["local_intent_overhead_ms"] += elapsed_ms
+            return
+        self._stats["local_intent_hits"] += 1
+        estimator = self._latency.get(self._latency_target(), METRIC_TOTAL)
+        if estimator is not None:
+            saved_ms = round(estimator.mean * 1000) - elapsed_ms
+            self._stats["local_intent_saved_ms"] += max(saved_ms, 0)
+
     @property
     def session_key(self) -> str:
         """Return the active session key."""
@@ -183,8 +789,14 @@ class OpenClawGatewayClient:
 
     def set_session_key(self, session_key: str) -> None:
         """Set the active session key for new requests."""
+        if session_key != self._session_key:
+            self._response_cache.clear()
         self._session_key = session_key
 
+    def clear_response_cache(self) -> None:
+        """Drop all cached agent responses."""
+        self._response_cache.clear()
+
     @property
     def model(self) -> str | None:
         """Return the configured model override."""
@@ -204,16 +816,31 @@ class OpenClawGatewayClient:
         self._thinking = thinking
 
     async def send_agent_request(
-        self, message: str, idempotency_key: str | None = None
+        self,
+        message: str,
+        idempotency_key: str | None = None,
+        use_cache: bool = True,
+        timeout: float | None = None,
+        session_key: str | None = None,
+        max_chars: int | None = None,
     ) -> str:
         """
         Send agent request and return complete response.
 
-        Handles event buffering automatically.
+        Handles event buffering automatically. Identical requests arriving
+        within the coalescing window share a single agent run. With hedging
+        enabled, a slow request is raced against a backup target.
 
         Args:
             message: User message to send to agent
             idempotency_key: Optional idempotency key for safe retries
+            use_cache: Whether the response cache may answer this request
+            timeout: Remaining end-to-end budget in seconds, covering the
+                ack and the whole response; defaults to agent_budget()
+            session_key: Gateway session for this request; defaults to the
+                active session
+            max_chars: Response length budget appended to the message as
+                a brevity hint, e.g. what will actually be spoken
 
         Returns:
             Complete response from agent
@@ -222,46 +849,90 @@ class OpenClawGatewayClient:
             GatewayTimeoutError: If request times out
             AgentExecutionError: If agent execution fails
         """
+        self._requests.record(REQUESTS)
+        try:
+            response_text = await self._send_agent_request(
+                message, idempotency_key, use_cache, timeout, session_key, max_chars
+            )
+        except BaseException as err:
+            self._requests.record(failure_outcome(err))
+            raise
+        self._requests.record(OUTCOME_COMPLETED)
+        return response_text
+
+    async def _send_agent_request(
+        self,
+        message: str,
+        idempotency_key: str | None,
+        use_cache: bool,
+        timeout: float | None,
+        session_key: str | None,
+        max_chars: int | None,
+    ) -> str:
+        """Answer one agent request from the cache or the gateway."""
         if idempotency_key is None:
             idempotency_key = str(uuid.uuid4())
 
         _LOGGER.debug("Sending agent request with key: %s", idempotency_key)
 
-        # Send agent request
-        try:
-            options: dict[str, Any] = {}
-            if self._model:
-                options["model"] = self._model
-            if self._thinking:
-                options["thinking"] = self._thinking
-            response = await self._gateway.send_request(
-                method="agent",
-                params={
-                    "message": message,
-                    "sessionKey": self._session_key,
-                    "idempotencyKey": idempotency_key,
-                    **({"options": options} if options else {}),
-                },
-                timeout=10.0,  # Initial ack should be quick
-            )
+        target = self._agent_target(message, session_key, max_chars)
+        cache_key = self._request_key(message, target)
+        cached = self._cache_lookup(cache_key, use_cache)
+        if cached is not None:
+            return cached
 
-            # Extract runId from acknowledgment
-            payload = response.get("payload", {})
-            run_id = payload.get("runId")
+        deadline, ack_timeout, stall_timeout = self._turn_deadline(timeout, target)
 
-            if not run_id:
-                raise AgentExecutionError("No runId in agent response")
+        def _run(key: str, target: _AgentTarget) -> Awaitable[str]:
+            return self._run_agent_request(
+                message, key, deadline, ack_timeout, stall_timeout, target
+            )
 
-            _LOGGER.debug("Agent run started: %s", run_id)
+        if not self._hedge_requests:
+            response_text = await _run(idempotency_key, target)
+            self._cache_store(cache_key, response_text, use_cache)
+            return response_text
 
-            # Create run tracker
-            agent_run = AgentRun(run_id)
-            self._agent_runs[run_id] = agent_run
+        primary = _hedge_task(_run(idempotency_key, target))
+        backup: asyncio.Future[str] | None = None
+        try:
+            await asyncio.wait({primary}, timeout=self._hedge_delay)
+            if not primary.done() and self._take_hedge_token():
+                backup = _hedge_task(
+                    _run(str(uuid.uuid4()), self._hedge_target(target))
+                )
+            winner = primary
+            if backup is not None:
+                winner = await self._race_hedge(primary, backup)
+            response_text = await winner
+        finally:
+            # The loser's release aborts its run on the gateway
+            for task in (primary, backup):
+                if task is not None and not task.done():
+                    task.cancel()
+
+        self._cache_store(cache_key, response_text, use_cache)
+        return response_text
+
+    async def _run_agent_request(
+        self,
+        message: str,
+        idempotency_key: str,
+        deadline: float,
+        ack_timeout: float,
+        stall_timeout: float | None,
+        target: _AgentTarget,
+    ) -> str:
+        """Run one agent request against a target."""
+        try:
+            agent_run, inflight = await self._acquire_agent_run(
+                message, idempotency_key, ack_timeout, target
+            )
 
             try:
                 # Wait for completion
-                await asyncio.wait_for(
-                    agent_run.complete_event.wait(), timeout=self._timeout
+                await agent_run.wait_complete(
+                    deadline - time.monotonic(), stall_timeout
                 )
 
                 # Check status
@@ -282,17 +953,19 @@ class OpenClawGatewayClient:
                     f"Unknown agent status: {agent_run.status}"
                 )
 
-            except asyncio.TimeoutError as err:
+            except GatewayTimeoutError as err:
+                if isinstance(err, GatewayStalledError):
+                    self._stats["stalled_runs"] += 1
                 _LOGGER.warning(
-                    "Agent request timeout after %s seconds", self._timeout
+                    "Agent request failed after %.1f seconds: %s",
+                    time.monotonic() - agent_run.started,
+                    err,
                 )
-                raise GatewayTimeoutError(
-                    "Agent response timeout"
-                ) from err
+                raise
 
             finally:
                 # Clean up run tracker
-                self._agent_runs.pop(run_id, None)
+                self._release_agent_run(agent_run, inflight)
 
         except (GatewayConnectionError, GatewayTimeoutError):
             raise
@@ -307,14 +980,33 @@ class OpenClawGatewayClient:
             raise AgentExecutionError(str(err)) from err
 
     async def stream_agent_request(
-        self, message: str, idempotency_key: str | None = None
+        self,
+        message: str,
+        idempotency_key: str | None = None,
+        use_cache: bool = True,
+        timeout: float | None = None,
+        session_key: str | None = None,
+        max_chars: int | None = None,
     ) -> AsyncIterator[str]:
         """
         Send agent request and stream response chunks.
 
+        Identical requests arriving within the coalescing window share a
+        single agent run; each caller receives the full stream. A cached
+        response is yielded as a single chunk. With hedging enabled, a
+        request slow to produce its first chunk is raced against a backup
+        target and the first to speak is streamed.
+
         Args:
             message: User message to send to agent
             idempotency_key: Optional idempotency key for safe retries
+            use_cache: Whether the response cache may answer this request
+            timeout: Remaining end-to-end budget in seconds, covering the
+                ack and the whole response; defaults to agent_budget()
+            session_key: Gateway session for this request; defaults to the
+                active session
+            max_chars: Response length budget appended to the message as
+                a brevity hint, e.g. what will actually be spoken
 
         Yields:
             Text chunks from the agent response
@@ -323,44 +1015,139 @@ class OpenClawGatewayClient:
             GatewayTimeoutError: If request times out
             AgentExecutionError: If agent execution fails
         """
+        self._requests.record(REQUESTS)
+        stream = self._stream_agent_request(
+            message, idempotency_key, use_cache, timeout, session_key, max_chars
+        )
+        spoke = False
+        try:
+            async for chunk in stream:
+                spoke = True
+                yield chunk
+        except BaseException as err:
+            # A caller that stops reading after some output got its answer
+            if spoke and isinstance(err, GeneratorExit):
+                self._requests.record(OUTCOME_COMPLETED)
+            else:
+                self._requests.record(failure_outcome(err))
+            raise
+        else:
+            self._requests.record(OUTCOME_COMPLETED)
+        finally:
+            await stream.aclose()
+
+    async def _stream_agent_request(
+        self,
+        message: str,
+        idempotency_key: str | None,
+        use_cache: bool,
+        timeout: float | None,
+        session_key: str | None,
+        max_chars: int | None,
+    ) -> AsyncGenerator[str, None]:
+        """Stream one agent request from the cache or the gateway."""
         if idempotency_key is None:
             idempotency_key = str(uuid.uuid4())
 
         _LOGGER.debug("Streaming agent request with key: %s", idempotency_key)
 
-        try:
-            options: dict[str, Any] = {}
-            if self._model:
-                options["model"] = self._model
-            if self._thinking:
-                options["thinking"] = self._thinking
-            response = await self._gateway.send_request(
-                method="agent",
-                params={
-                    "message": message,
-                    "sessionKey": self._session_key,
-                    "idempotencyKey": idempotency_key,
-                    **({"options": options} if options else {}),
-                },
-                timeout=10.0,
+        target = self._agent_target(message, session_key, max_chars)
+        cache_key = self._request_key(message, target)
+        cached = self._cache_lookup(cache_key, use_cache)
+        if cached is not None:
+            yield cached
+            return
+
+        deadline, ack_timeout, stall_timeout = self._turn_deadline(timeout, target)
+        if not use_cache:
+            cache_key = None
+
+        def _stream(key: str, target: _AgentTarget) -> AsyncGenerator[str, None]:
+            return self._stream_agent_run(
+                message,
+                key,
+                deadline,
+                ack_timeout,
+                stall_timeout,
+                target,
+                cache_key=cache_key,
             )
 
-            payload = response.get("payload", {})
-            run_id = payload.get("runId")
+        primary = _stream(idempotency_key, target)
+        if not self._hedge_requests:
+            try:
+                async for chunk in primary:
+                    yield chunk
+            finally:
+                await primary.aclose()
+            return
 
-            if not run_id:
-                raise AgentExecutionError("No runId in agent response")
+        streams = [primary]
+        first = _hedge_task(anext(primary))
+        pending: list[asyncio.Future[str]] = [first]
+        try:
+            winner, winner_first = primary, first
+            await asyncio.wait({first}, timeout=self._hedge_delay)
+            if not first.done() and self._take_hedge_token():
+                backup = _stream(str(uuid.uuid4()), self._hedge_target(target))
+                streams.append(backup)
+                backup_first = _hedge_task(anext(backup))
+                pending.append(backup_first)
+                winner_first = await self._race_hedge(first, backup_first)
+                if winner_first is backup_first:
+                    winner = backup
+                # Stop the loser now rather than after the winner has
+                # streamed; closing it releases its run, aborting it
+                await _close_hedge_streams(
+                    [task for task in pending if task is not winner_first],
+                    [stream for stream in streams if stream is not winner],
+                )
+                pending, streams = [winner_first], [winner]
 
-            _LOGGER.debug("Agent run started: %s", run_id)
+            try:
+                chunk = await winner_first
+            except StopAsyncIteration:
+                return
+            yield chunk
+            async for chunk in winner:
+                yield chunk
 
-            agent_run = AgentRun(run_id, stream=True)
-            self._agent_runs[run_id] = agent_run
+        finally:
+            await _close_hedge_streams(pending, streams)
+
+    async def _stream_agent_run(
+        self,
+        message: str,
+        idempotency_key: str,
+        deadline: float,
+        ack_timeout: float,
+        stall_timeout: float | None,
+        target: _AgentTarget,
+        cache_key: tuple[Any, ...] | None = None,
+    ) -> AsyncGenerator[str, None]:
+        """Stream one agent request against a target."""
+        try:
+            agent_run, inflight = await self._acquire_agent_run(
+                message, idempotency_key, ack_timeout, target
+            )
+            queue = agent_run.subscribe()
 
             try:
-                async for chunk in agent_run.iter_stream(self._timeout):
-                    yield chunk
+                try:
+                    async for chunk in agent_run.iter_stream(
+                        deadline - time.monotonic(), queue, stall_timeout
+                    ):
+                        yield chunk
+                except GatewayStalledError as err:
+                    self._stats["stalled_runs"] += 1
+                    _LOGGER.warning("Streaming agent request failed: %s", err)
+                    raise
 
                 if agent_run.status == "ok":
+                    if cache_key is not None:
+                        self._cache_store(
+                            cache_key, agent_run.get_response(), True
+                        )
                     return
 
                 if agent_run.status == "error":
@@ -373,7 +1160,8 @@ class OpenClawGatewayClient:
                 )
 
             finally:
-                self._agent_runs.pop(run_id, None)
+                agent_run.unsubscribe(queue)
+                self._release_agent_run(agent_run, inflight)
 
         except (GatewayConnectionError, GatewayTimeoutError):
             raise
@@ -387,6 +1175,483 @@ class OpenClawGatewayClient:
             )
             raise AgentExecutionError(str(err)) from err
 
+    def _hedge_target(self, target: _AgentTarget) -> _AgentTarget:
+        """Return the target a backup request is sent to.
+
+        The backup runs in a sibling session so the two runs never write
+        into the same conversation history.
+        """
+        return _AgentTarget(
+            f"{target.session_key}{HEDGE_SESSION_SUFFIX}",
+            self._hedge_model or target.model,
+            target.thinking,
+            target.max_chars,
+        )
+
+    def _take_hedge_token(self) -> bool:
+        """Spend a hedging token for a request slow enough to hedge.
+
+        Each request that is considered for hedging refills the bucket by
+        HEDGE_MAX_RATIO, so backups stay under that share of the slow
+        requests, with a small burst allowance; requests answered before
+        the hedge delay neither refill nor spend tokens.
+        """
+        self._hedge_tokens = min(
+            HEDGE_BURST, self._hedge_tokens + HEDGE_MAX_RATIO
+        )
+        if self._hedge_tokens < 1:
+            self._stats["hedges_skipped"] += 1
+            return False
+        self._hedge_tokens -= 1
+        self._stats["hedged_requests"] += 1
+        return True
+
+    async def _race_hedge(
+        self, primary: asyncio.Future, backup: asyncio.Future
+    ) -> asyncio.Future:
+        """Return whichever of two hedged attempts succeeds first.
+
+        If both fail, the primary is returned so its error is reported.
+        """
+        pending = {primary, backup}
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in (primary, backup):
+                if task not in done or task.cancelled():
+                    continue
+                err = task.exception()
+                if err is None or isinstance(err, StopAsyncIteration):
+                    if task is primary:
+                        self._stats["hedge_primary_wins"] += 1
+                    else:
+                        self._stats["hedge_backup_wins"] += 1
+                    return task
+        return primary
+
+    async def _start_agent_run(
+        self,
+        message: str,
+        idempotency_key: str,
+        ack_timeout: float,
+        target: _AgentTarget,
+    ) -> AgentRun:
+        """Send the agent request and register a run tracker from its ack."""
+        options = target.options()
+        latency_keys = self._latency_keys(target)
+        sent_at = time.monotonic()
+        self._pending_acks += 1
+        try:
+            response = await self._gateway.send_request(
+                method="agent",
+                params={
+                    "message": target.message(message),
+                    "sessionKey": target.session_key,
+                    "idempotencyKey": idempotency_key,
+                    **({"options": options} if options else {}),
+                },
+                timeout=ack_timeout,  # Initial ack should be quick
+            )
+            return self._register_agent_run(
+                response, target, latency_keys, sent_at
+            )
+        finally:
+            self._pending_acks -= 1
+            if not self._pending_acks:
+                # Nobody is waiting for an ack the held events could match
+                self._drop_orphan_events()
+
+    def _register_agent_run(
+        self,
+        response: dict[str, Any],
+        target: _AgentTarget,
+        latency_keys: tuple[str, ...],
+        sent_at: float,
+    ) -> AgentRun:
+        """Register a run tracker from an agent ack."""
+        # Extract runId from acknowledgment
+        payload = response.get("payload", {})
+        run_id = payload.get("runId")
+
+        if not run_id:
+            raise AgentExecutionError("No runId in agent response")
+
+        _LOGGER.debug("Agent run started: %s", run_id)
+
+        agent_run = AgentRun(
+            run_id, session_key=target.session_key, **self._run_limits
+        )
+        agent_run.latency_keys = latency_keys
+        agent_run.tier = target.tier
+        agent_run.model = target.model
+        agent_run.started = sent_at
+        ack_latency = agent_run.last_activity - sent_at
+        for latency_key in latency_keys:
+            self._latency.record(latency_key, METRIC_ACK, ack_latency)
+        self._quantiles[METRIC_ACK].add(ack_latency)
+        self._agent_runs[run_id] = agent_run
+        self._replay_orphan_events(agent_run)
+        return agent_run
+
+    def _turn_deadline(
+        self, budget: float | None, target: _AgentTarget
+    ) -> tuple[float, float, float | None]:
+        """Return the absolute deadline, ack timeout and stall timeout.
+
+        A single monotonic deadline covers the ack and the whole response,
+        so waiting for the ack eats into the time left for generation
+        instead of extending it. A hedged backup shares the deadline
+        learned for the primary target.
+        """
+        ack_timeout, run_timeout, stall_timeout = self._agent_deadlines(target)
+        if budget is None:
+            budget = run_timeout
+        if budget <= 0:
+            raise GatewayTimeoutError("Agent response timeout")
+        deadline = time.monotonic() + budget
+        return deadline, min(ack_timeout, budget), stall_timeout
+
+    def _latency_target(self, target: _AgentTarget | None = None) -> str:
+        """Return the latency statistics key for a target's settings."""
+        if target is None:
+            return target_key(self._session_key, self._model, self._thinking)
+        return target_key(target.session_key, target.model, target.thinking)
+
+    def _latency_keys(self, target: _AgentTarget | None) -> tuple[str, ...]:
+        """Return the latency keys a target learns under, most specific first.
+
+        A routed or hedge session also learns under the active session with
+        the same model and thinking: routed sessions rarely live long enough
+        to learn deadlines of their own, and fall back to the shared ones.
+        """
+        own = self._latency_target(target)
+        shared = self._latency_target(
+            None
+            if target is None
+            else _AgentTarget(self._session_key, target.model, target.thinking)
+        )
+        return (own,) if own == shared else (own, shared)
+
+    def _agent_deadlines(
+        self, target: _AgentTarget | None = None
+    ) -> tuple[float, float, float | None]:
+        """Return ack, completion and stall timeouts for a request's target.
+
+        With adaptive timeouts, each bound is learned from earlier runs with
+        the same session, model and thinking mode. The configured timeouts
+        stay the ceiling: quick targets get tighter deadlines, but never
+        below ADAPTIVE_MIN_FRACTION of the configured ones, since a long
+        answer can follow a run of short ones. Until enough samples exist
+        the static timeouts apply. The stall timeout is the longest silence
+        tolerated between agent events.
+        """
+        static_stall = self._stall_timeout if self._stall_timeout > 0 else None
+        if not self._adaptive_timeouts:
+            return AGENT_ACK_TIMEOUT, self._timeout, static_stall
+
+        latency_keys = self._latency_keys(target)
+        ack_timeout = self._learned_deadline(
+            latency_keys,
+            METRIC_ACK,
+            minimum=ADAPTIVE_ACK_MIN_TIMEOUT,
+            maximum=AGENT_ACK_TIMEOUT,
+        )
+        timeout = self._learned_deadline(
+            latency_keys,
+            METRIC_TOTAL,
+            minimum=self._timeout * ADAPTIVE_MIN_FRACTION,
+            maximum=self._timeout,
+        ) or self._timeout
+        # A stall timeout of 0 turns the watchdog off, whatever was learned
+        stall_timeout = None
+        if static_stall is not None:
+            stall_timeout = self._learned_deadline(
+                latency_keys,
+                METRIC_GAP,
+                minimum=static_stall * ADAPTIVE_MIN_FRACTION,
+                maximum=static_stall,
+            ) or static_stall
+        return ack_timeout or AGENT_ACK_TIMEOUT, timeout, stall_timeout
+
+    def _learned_deadline(
+        self,
+        latency_keys: tuple[str, ...],
+        metric: str,
+        minimum: float,
+        maximum: float,
+    ) -> float | None:
+        """Return a clamped deadline from the first trustworthy estimate."""
+        for latency_key in latency_keys:
+            estimator = self._latency.get(latency_key, metric)
+            if estimator is not None and estimator.samples >= ADAPTIVE_MIN_SAMPLES:
+                bound = estimator.bound(ADAPTIVE_DEVIATIONS)
+                return min(max(bound, minimum), maximum)
+        return None
+
+    def _record_run_latency(self, agent_run: AgentRun) -> None:
+        """Learn from a successfully completed run."""
+        if not agent_run.latency_keys:
+            return
+        total = agent_run.last_activity - agent_run.started
+        for latency_key in agent_run.latency_keys:
+            self._latency.record(latency_key, METRIC_TOTAL, total)
+            self._latency.record(latency_key, METRIC_GAP, agent_run.max_gap)
+        if agent_run.tier is not None:
+            quantiles = self._tier_latency.setdefault(
+                agent_run.tier, RollingQuantiles()
+            )
+            quantiles.add(total)
+        self._quantiles[METRIC_TOTAL].add(total)
+        if agent_run.first_output is not None:
+            self._quantiles[METRIC_FIRST_TOKEN].add(
+                agent_run.first_output - agent_run.started
+            )
+        self._notify_state("latency", None)
+
+    def _record_run_usage(self, agent_run: AgentRun) -> None:
+        """Add a finished run's token usage, once, including failed runs."""
+        if agent_run.usage is None:
+            return
+        usage, agent_run.usage = agent_run.usage, None
+        self._usage.record(agent_run.session_key, agent_run.model, usage)
+
+    def _agent_target(
+        self,
+        message: str,
+        session_key: str | None,
+        max_chars: int | None,
+        peek: bool = False,
+    ) -> _AgentTarget:
+        """Return the target for a request, tiered by prompt complexity.
+
+        With auto tiering, simple prompts go to the fast model and thinking
+        level; anything else keeps the configured ones. A peek neither
+        counts the request nor updates the session's tier history.
+        """
+        session_key = session_key or self._session_key
+        if self._classifier is None:
+            return _AgentTarget(session_key, self._model, self._thinking, max_chars)
+
+        if peek:
+            tier = self._classifier.peek(message, session_key)
+        else:
+            tier = self._classifier.classify(message, session_key)
+            self._stats[f"{tier}_tier_requests"] += 1
+        if tier != QUERY_TIER_FAST:
+            return _AgentTarget(
+                session_key, self._model, self._thinking, max_chars, tier
+            )
+        return _AgentTarget(
+            session_key,
+            self._fast_model or self._model,
+            self._fast_thinking or self._thinking,
+            max_chars,
+            tier,
+        )
+
+    def _request_key(self, message: str, target: _AgentTarget) -> tuple[Any, ...]:
+        """Return the key identifying equivalent agent requests."""
+        return (*target.key, normalize_message(message))
+
+    def _cache_lookup(self, key: tuple[Any, ...], use_cache: bool) -> str | None:
+        """Return a cached response for the request, counting hits and misses."""
+        if not use_cache or not self._response_cache.enabled:
+            return None
+        cached = self._response_cache.get(key)
+        if cached is None:
+            self._stats["cache_misses"] += 1
+            return None
+        self._stats["cache_hits"] += 1
+        _LOGGER.debug("Serving agent response from cache")
+        return cached
+
+    def _cache_store(
+        self, key: tuple[Any, ...], response: str, use_cache: bool
+    ) -> None:
+        """Cache a completed response if caching applies to the request."""
+        if use_cache and response and self._response_cache.enabled:
+            self._response_cache.put(key, response)
+
+    async def _acquire_agent_run(
+        self,
+        message: str,
+        idempotency_key: str,
+        ack_timeout: float,
+        target: _AgentTarget,
+    ) -> tuple[AgentRun, "_InflightAgentRequest | None"]:
+        """Start an agent run, or attach to an identical in-flight one.
+
+        The gateway may start the run before a cancelled caller sees its
+        ack, so the ack is awaited shielded: attached callers still receive
+        the run, and it is aborted once acked if nobody is left for it.
+        """
+        if self._coalesce_window <= 0:
+            return await self._await_agent_start(
+                message, idempotency_key, ack_timeout, target, None
+            ), None
+
+        key = self._request_key(message, target)
+
+        inflight = self._inflight_requests.get(key)
+        if inflight is not None and inflight.joinable(self._coalesce_window):
+            inflight.subscribers += 1
+            self._stats["coalesced_requests"] += 1
+            _LOGGER.debug("Coalescing agent request with an in-flight run")
+            try:
+                agent_run = await asyncio.wait_for(
+                    asyncio.shield(inflight.run_future), timeout=ack_timeout
+                )
+            except asyncio.TimeoutError as err:
+                self._release_agent_run(None, inflight)
+                raise GatewayTimeoutError("Agent response timeout") from err
+            except BaseException:
+                self._release_agent_run(None, inflight)
+                raise
+            return agent_run, inflight
+
+        inflight = _InflightAgentRequest(key)
+        self._inflight_requests[key] = inflight
+        agent_run = await self._await_agent_start(
+            message, idempotency_key, ack_timeout, target, inflight
+        )
+        return agent_run, inflight
+
+    async def _await_agent_start(
+        self,
+        message: str,
+        idempotency_key: str,
+        ack_timeout: float,
+        target: _AgentTarget,
+        inflight: "_InflightAgentRequest | None",
+    ) -> AgentRun:
+        """Start an agent run in a task that outlives a cancelled caller."""
+        start = asyncio.get_running_loop().create_task(
+            self._start_agent_run(message, idempotency_key, ack_timeout, target)
+        )
+        settle = functools.partial(self._settle_agent_start, inflight)
+        if inflight is not None:
+            start.add_done_callback(settle)
+        try:
+            return await asyncio.shield(start)
+        except asyncio.CancelledError:
+            self._release_agent_run(None, inflight)
+            if inflight is None:
+                start.add_done_callback(settle)
+            elif start.done() and inflight.subscribers <= 0:
+                # Acked just as the caller left, with nobody attached
+                self._settle_agent_start(None, start)
+            if not start.done():
+                self._background_tasks.add(start)
+                start.add_done_callback(self._background_tasks.discard)
+            raise
+        except Exception:
+            self._release_agent_run(None, inflight)
+            raise
+
+    def _settle_agent_start(
+        self,
+        inflight: "_InflightAgentRequest | None",
+        start: "asyncio.Task[AgentRun]",
+    ) -> None:
+        """Hand an acked run to attached callers, or abort it if none are left."""
+        if start.cancelled():
+            if inflight is not None:
+                inflight.fail(GatewayConnectionError("Agent request was cancelled"))
+            return
+        err = start.exception()
+        if err is not None:
+            if inflight is not None:
+                inflight.fail(err)
+            return
+        agent_run = start.result()
+        if inflight is not None and inflight.subscribers > 0:
+            if not inflight.run_future.done():
+                inflight.run_future.set_result(agent_run)
+            return
+        _LOGGER.debug("Agent run %s acked after its caller left", agent_run.run_id)
+        self._agent_runs.pop(agent_run.run_id, None)
+        self._schedule_abort(agent_run)
+
+    def _release_agent_run(
+        self,
+        agent_run: AgentRun | None,
+        inflight: "_InflightAgentRequest | None",
+    ) -> None:
+        """Drop a caller's interest in a run, cleaning up after the last one.
+
+        When nobody is left waiting on a run the gateway is still working on
+        (timeout, cancellation, abandoned stream, overflow), ask the gateway
+        to abort it so it stops spending model capacity on the session.
+        """
+        if inflight is not None:
+            inflight.subscribers -= 1
+            if inflight.subscribers > 0:
+                return
+            if self._inflight_requests.get(inflight.key) is inflight:
+                del self._inflight_requests[inflight.key]
+        if agent_run is not None:
+            self._agent_runs.pop(agent_run.run_id, None)
+            self._record_buffer_usage(agent_run)
+            if not agent_run.complete_event.is_set() or agent_run.overflowed:
+                self._schedule_abort(agent_run)
+
+    def _record_buffer_usage(self, agent_run: AgentRun) -> None:
+        """Add a released run's buffer pressure to the client stats."""
+        usage = agent_run.buffer_usage
+        self._stats["peak_response_chars"] = max(
+            self._stats["peak_response_chars"], usage["peak_text_chars"]
+        )
+        self._stats["peak_queued_chars"] = max(
+            self._stats["peak_queued_chars"], usage["peak_queued_chars"]
+        )
+        self._stats["buffer_overflows"] += agent_run.overflows
+        self._stats["truncated_runs"] += agent_run.truncated
+        self._stats["overflowed_runs"] += agent_run.overflowed
+
+    def _schedule_abort(self, agent_run: AgentRun) -> None:
+        """Abort a run in the background; callers may be unwinding a cancel."""
+        task = asyncio.get_running_loop().create_task(
+            self.abort_agent_run(agent_run.run_id, agent_run.session_key)
+        )
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def abort_agent_run(
+        self, run_id: str, session_key: str | None = None
+    ) -> bool:
+        """
+        Ask the Gateway to stop an agent run.
+
+        Args:
+            run_id: Run to abort
+            session_key: Session the run belongs to (defaults to the active one)
+
+        Returns:
+            True if the Gateway acknowledged the abort
+        """
+        self._stats["aborts_requested"] += 1
+        started = time.monotonic()
+        try:
+            await self._gateway.send_request(
+                method=AGENT_ABORT_METHOD,
+                params={
+                    "sessionKey": session_key or self._session_key,
+                    "runId": run_id,
+                },
+                timeout=AGENT_ABORT_TIMEOUT,
+            )
+        except Exception as err:  # pylint: disable=broad-except
+            self._stats["aborts_failed"] += 1
+            _LOGGER.debug("Abort of agent run %s failed: %s", run_id, err)
+            return False
+
+        latency_ms = round((time.monotonic() - started) * 1000)
+        self._stats["aborts_succeeded"] += 1
+        self._stats["last_abort_latency_ms"] = latency_ms
+        _LOGGER.debug("Aborted agent run %s in %d ms", run_id, latency_ms)
+        return True
+
     def _handle_agent_event(self, event: dict[str, Any]) -> None:
         """Handle agent event and buffer output."""
         payload = event.get("payload", {})
@@ -398,10 +1663,21 @@ class OpenClawGatewayClient:
 
         agent_run = self._agent_runs.get(run_id)
         if not agent_run:
-            # Event for unknown run, might be from previous session
-            _LOGGER.debug("Agent event for unknown run: %s", run_id)
+            # Event may precede the ack for this run, or belong to a run
+            # from a previous session; hold it briefly in case it's ours.
+            if self._pending_acks:
+                self._buffer_orphan_event(run_id, payload)
             return
 
+        self._apply_agent_event(agent_run, payload)
+
+    def _apply_agent_event(
+        self, agent_run: AgentRun, payload: dict[str, Any]
+    ) -> None:
+        """Apply an agent event payload to its run tracker."""
+        run_id = agent_run.run_id
+        agent_run.touch()
+
         # Log event details for debugging
         data = payload.get("data", {})
         _LOGGER.debug(
@@ -421,6 +1697,14 @@ class OpenClawGatewayClient:
         if output:
             agent_run.add_output(output)
 
+        # Usage may be reported along the way; the latest report counts
+        usage = parse_usage(payload)
+        if usage is not None:
+            agent_run.usage = usage
+            model = payload.get("model") or data.get("model")
+            if model:
+                agent_run.model = model
+
         # Check for completion - either via status field or phase field
         status = payload.get("status")
         phase = data.get("phase")
@@ -429,33 +1713,164 @@ class OpenClawGatewayClient:
             # Old-style completion
             summary = payload.get("summary")
             agent_run.set_complete(status, summary)
+            self._record_run_usage(agent_run)
+            if status == "ok":
+                self._record_run_latency(agent_run)
             _LOGGER.info("Agent run %s completed with status: %s", run_id, status)
         elif phase == "end" or phase == "complete":
             # New-style completion via phase
             agent_run.set_complete("ok", None)
+            self._record_run_usage(agent_run)
+            self._record_run_latency(agent_run)
             _LOGGER.info("Agent run %s completed (phase: %s)", run_id, phase)
         elif status:
             _LOGGER.debug("Agent run %s status: %s (not complete)", run_id, status)
         elif phase:
             _LOGGER.debug("Agent run %s phase: %s", run_id, phase)
 
+    def _buffer_orphan_event(self, run_id: str, payload: dict[str, Any]) -> None:
+        """Hold an event for an unregistered run until its ack is processed."""
+        now = time.monotonic()
+        self._prune_orphan_events(now)
+
+        held = self._orphan_events.get(run_id)
+        if held is None:
+            if len(self._orphan_events) >= ORPHAN_EVENT_MAX_RUNS:
+                _, dropped = self._orphan_events.popitem(last=False)
+                self._stats["orphan_events_dropped"] += dropped.events
+            held = _OrphanRun(run_id, now)
+            self._orphan_events[run_id] = held
+
+        held.fold(payload)
+        self._stats["orphan_events_buffered"] += 1
+        _LOGGER.debug("Buffered agent event for unregistered run: %s", run_id)
+
+    def _prune_orphan_events(self, now: float) -> None:
+        """Drop buffered events older than the orphan event TTL."""
+        while self._orphan_events:
+            run_id, held = next(iter(self._orphan_events.items()))
+            if now - held.first_seen < ORPHAN_EVENT_TTL:
+                break
+            del self._orphan_events[run_id]
+            self._stats["orphan_events_dropped"] += held.events
+
+    def _drop_orphan_events(self) -> None:
+        """Drop all buffered events once no ack is outstanding."""
+        for held in self._orphan_events.values():
+            self._stats["orphan_events_dropped"] += held.events
+        self._orphan_events.clear()
+
+    def _replay_orphan_events(self, agent_run: AgentRun) -> None:
+        """Apply events that arrived before the run was registered."""
+        self._prune_orphan_events(time.monotonic())
+        held = self._orphan_events.pop(agent_run.run_id, None)
+        if held is None:
+            return
+
+        self._stats["early_event_runs"] += 1
+        self._stats["orphan_events_replayed"] += held.events
+        _LOGGER.debug(
+            "Replaying %d early event(s) for run %s",
+            held.events,
+            agent_run.run_id,
+        )
+        self._apply_agent_event(agent_run, held.payload)
+
     @property
     def connect_snapshot(self) -> dict[str, Any]:
         """Return the snapshot received during the connect handshake."""
         return self._gateway.connect_snapshot
 
     @property
-    def presence(self) -> dict[str, Any]:
-        """Return the latest presence data."""
-        return self._gateway.presence
+    def presence(self) -> PresenceModel:
+        """Return the connected clients, indexed by client id."""
+        return self._presence
+
+    def _handle_connection_change(self, connected: bool) -> None:
+        """Reseed presence from the snapshot of a new connection."""
+        if connected:
+            self._apply_presence(self._gateway.presence)
 
     def _handle_presence_event(self, event: dict[str, Any]) -> None:
         """Handle presence event and update state."""
+        self._track_state_version(event)
         payload = event.get("payload", {})
         if payload:
-            if isinstance(payload, list):
-                payload = {"clients": payload}
-            self._gateway._presence = payload
+            self._apply_presence(payload)
+
+    def _apply_presence(self, payload: Any) -> None:
+        """Apply a presence update and publish the clients it changed."""
+        change = self._presence.apply(payload)
+        if change:
+            self._notify_state("presence", change.as_dict())
+
+    def add_state_listener(
+        self, listener: Callable[[str, dict[str, Any] | None], None]
+    ) -> Callable[[], None]:
+        """Subscribe to pushed gateway state; returns an unsubscribe callable.
+
+        The listener is called with "health" or "status" and the pushed
+        payload, or None when the gateway only signalled that the state
+        changed and it has to be fetched. Presence changes arrive as
+        "presence" with the joined, left and updated client ids, and
+        "latency" (without payload) follows every completed agent run.
+        """
+        self._state_listeners.append(listener)
+
+        def _remove() -> None:
+            if listener in self._state_listeners:
+                self._state_listeners.remove(listener)
+
+        return _remove
+
+    def _handle_health_event(self, event: dict[str, Any]) -> None:
+        """Handle a pushed health snapshot."""
+        self._track_state_version(event, pushed="health")
+        payload = event.get("payload")
+        if isinstance(payload, dict) and payload:
+            self._notify_state("health", payload)
+
+    def _handle_status_event(self, event: dict[str, Any]) -> None:
+        """Handle a pushed status snapshot."""
+        self._track_state_version(event, pushed="status")
+        payload = event.get("payload")
+        if isinstance(payload, dict) and payload:
+            self._notify_state("status", payload)
+
+    def _track_state_version(
+        self, event: dict[str, Any], pushed: str | None = None
+    ) -> None:
+        """Ask listeners to refetch state whose stateVersion moved on.
+
+        The gateway stamps events with a version per state area (or a
+        single counter, taken as the status version). The first version
+        seen is only recorded, and the area whose payload the event itself
+        carries needs no refetch. Presence arrives as deltas and other
+        areas have no fetchable state, so only health and status refetch.
+        """
+        versions = event.get("stateVersion")
+        if versions is None:
+            return
+        if not isinstance(versions, dict):
+            versions = {"status": versions}
+        stale: set[str] = set()
+        for area, version in versions.items():
+            previous = self._state_versions.get(area)
+            self._state_versions[area] = version
+            if previous is None or previous == version:
+                continue
+            if area in ("health", "status"):
+                stale.add(area)
+        for kind in sorted(stale - {pushed}):
+            self._notify_state(kind, None)
+
+    def _notify_state(self, kind: str, payload: dict[str, Any] | None) -> None:
+        """Call state listeners, isolating their failures."""
+        for listener in list(self._state_listeners):
+            try:
+                listener(kind, payload)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error in gateway state listener")
 
     async def health(self) -> dict[str, Any]:
         """Get Gateway health status."""
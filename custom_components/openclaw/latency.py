@@ -0,0 +1,307 @@
+"""Latency learning for adaptive OpenClaw agent deadlines."""
+
+import logging
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_KEY_PREFIX = "openclaw.latency"
+STORAGE_VERSION = 1
+SAVE_DELAY = 60  # seconds; coalesces writes after bursts of requests
+LATENCY_MAX_TARGETS = 64  # targets kept, least recently used dropped
+
+# Smoothing gains from the classic RTT estimator (RFC 6298)
+_MEAN_GAIN = 0.125
+_DEVIATION_GAIN = 0.25
+
+# Metrics learned per target
+METRIC_ACK = "ack"  # request sent -> runId acknowledged
+METRIC_TOTAL = "total"  # request sent -> run complete
+METRIC_GAP = "gap"  # longest silence between events within a run
+METRIC_FIRST_TOKEN = "first_token"  # request sent -> first output received
+
+# Reported latency quantiles, by attribute name
+QUANTILES = {"p50": 0.5, "p95": 0.95}
+QUANTILE_WINDOW = 3600  # seconds per rolling window
+QUANTILE_MIN_SAMPLES = 10  # before a window replaces the previous one
+
+
+class LatencyEstimator:
+    """Smoothed mean and mean deviation of a latency, in constant memory."""
+
+    __slots__ = ("mean", "deviation", "samples")
+
+    def __init__(
+        self, mean: float = 0.0, deviation: float = 0.0, samples: int = 0
+    ) -> None:
+        """Initialize the estimator."""
+        self.mean = mean
+        self.deviation = deviation
+        self.samples = samples
+
+    def add(self, value: float) -> None:
+        """Fold a new observation into the estimate."""
+        if self.samples == 0:
+            self.mean = value
+            self.deviation = value / 2
+        else:
+            error = value - self.mean
+            self.mean += _MEAN_GAIN * error
+            self.deviation += _DEVIATION_GAIN * (abs(error) - self.deviation)
+        self.samples += 1
+
+    def bound(self, deviations: float) -> float:
+        """Return an upper bound of mean plus the given deviations."""
+        return self.mean + deviations * self.deviation
+
+    def as_dict(self) -> dict[str, Any]:
+        """Serialize for storage."""
+        return {
+            "mean": round(self.mean, 4),
+            "deviation": round(self.deviation, 4),
+            "samples": self.samples,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "LatencyEstimator":
+        """Deserialize from storage."""
+        return cls(
+            float(data.get("mean", 0.0)),
+            float(data.get("deviation", 0.0)),
+            int(data.get("samples", 0)),
+        )
+
+
+class QuantileEstimator:
+    """Streaming estimate of one quantile with the P-square algorithm.
+
+    Five markers track the minimum, the quantile, the maximum and two
+    points in between; their heights are adjusted with a parabolic
+    formula as observations arrive, so memory stays constant.
+    """
+
+    __slots__ = ("quantile", "samples", "_heights", "_positions", "_desired")
+
+    def __init__(self, quantile: float) -> None:
+        """Initialize the estimator for a quantile between 0 and 1."""
+        self.quantile = quantile
+        self.samples = 0
+        self._heights: list[float] = []
+        self._positions = [1.0, 2.0, 3.0, 4.0, 5.0]
+        self._desired = [
+            1.0,
+            1 + 2 * quantile,
+            1 + 4 * quantile,
+            3 + 2 * quantile,
+            5.0,
+        ]
+
+    def add(self, value: float) -> None:
+        """Fold a new observation into the estimate."""
+        self.samples += 1
+        heights = self._heights
+        if self.samples <= 5:
+            heights.append(value)
+            heights.sort()
+            return
+
+        if value < heights[0]:
+            heights[0] = value
+            cell = 0
+        elif value >= heights[4]:
+            heights[4] = value
+            cell = 3
+        else:
+            cell = next(i for i in range(4) if value < heights[i + 1])
+        positions = self._positions
+        for i in range(cell + 1, 5):
+            positions[i] += 1
+        quantile = self.quantile
+        steps = (0.0, quantile / 2, quantile, (1 + quantile) / 2, 1.0)
+        for i, step in enumerate(steps):
+            self._desired[i] += step
+
+        for i in (1, 2, 3):
+            offset = self._desired[i] - positions[i]
+            if (offset >= 1 and positions[i + 1] - positions[i] > 1) or (
+                offset <= -1 and positions[i - 1] - positions[i] < -1
+            ):
+                direction = 1 if offset > 0 else -1
+                height = self._parabolic(i, direction)
+                if not heights[i - 1] < height < heights[i + 1]:
+                    height = heights[i] + direction * (
+                        heights[i + direction] - heights[i]
+                    ) / (positions[i + direction] - positions[i])
+                heights[i] = height
+                positions[i] += direction
+
+    def _parabolic(self, i: int, direction: int) -> float:
+        heights, positions = self._heights, self._positions
+        return heights[i] + direction / (positions[i + 1] - positions[i - 1]) * (
+            (positions[i] - positions[i - 1] + direction)
+            * (heights[i + 1] - heights[i])
+            / (positions[i + 1] - positions[i])
+            + (positions[i + 1] - positions[i] - direction)
+            * (heights[i] - heights[i - 1])
+            / (positions[i] - positions[i - 1])
+        )
+
+    @property
+    def value(self) -> float | None:
+        """Return the estimated quantile, exact for up to five samples."""
+        if self.samples == 0:
+            return None
+        if self.samples <= 5:
+            index = min(int(self.quantile * self.samples), self.samples - 1)
+            return self._heights[index]
+        return self._heights[2]
+
+
+class RollingQuantiles:
+    """Latency quantiles over a rolling window, in constant memory.
+
+    Observations go into the current window. Readings come from the
+    current window once it has enough samples, and from the window
+    before it until then, so they neither reset abruptly nor hold
+    data older than two windows.
+    """
+
+    def __init__(
+        self,
+        window: float = QUANTILE_WINDOW,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize empty windows."""
+        self._window = window
+        self._clock = clock
+        self._started = clock()
+        self._current = self._new_window()
+        self._previous = self._new_window()
+
+    @staticmethod
+    def _new_window() -> dict[str, QuantileEstimator]:
+        return {name: QuantileEstimator(q) for name, q in QUANTILES.items()}
+
+    def _roll(self) -> None:
+        now = self._clock()
+        elapsed = now - self._started
+        if elapsed < self._window:
+            return
+        # A gap of two windows or more leaves nothing recent to fall back on
+        self._previous = (
+            self._current if elapsed < 2 * self._window else self._new_window()
+        )
+        self._current = self._new_window()
+        self._started = now
+
+    def add(self, value: float) -> None:
+        """Record an observation in the current window."""
+        self._roll()
+        for estimator in self._current.values():
+            estimator.add(value)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the quantiles in seconds and the samples behind them."""
+        self._roll()
+        window = self._current
+        samples = window["p50"].samples
+        if samples < QUANTILE_MIN_SAMPLES and self._previous["p50"].samples:
+            window = self._previous
+        result: dict[str, Any] = {
+            name: None if estimator.value is None else round(estimator.value, 4)
+            for name, estimator in window.items()
+        }
+        result["samples"] = window["p50"].samples
+        return result
+
+
+def target_key(session_key: str, model: str | None, thinking: str | None) -> str:
+    """Return the storage key for a session/model/thinking combination."""
+    return f"{session_key}|{model or ''}|{thinking or ''}"
+
+
+class LatencyTracker:
+    """Per-target latency estimators, optionally persisted in HA storage.
+
+    Targets are bounded, dropping the least recently used, since routed
+    sessions come and go.
+    """
+
+    def __init__(self, hass: Any | None = None, name: str | None = None) -> None:
+        """Initialize the tracker.
+
+        Args:
+            hass: Home Assistant instance used for persistence, if any
+            name: Suffix identifying the gateway in the storage key
+        """
+        self._hass = hass
+        self._name = re.sub(r"[^A-Za-z0-9_.-]", "_", name or "default")
+        self._store: Any | None = None
+        self._loaded = False
+        self._targets: OrderedDict[str, dict[str, LatencyEstimator]] = (
+            OrderedDict()
+        )
+
+    def get(self, target: str, metric: str) -> LatencyEstimator | None:
+        """Return the estimator for a target metric, if any samples exist."""
+        return self._targets.get(target, {}).get(metric)
+
+    def record(self, target: str, metric: str, seconds: float) -> None:
+        """Record an observed latency and schedule a save."""
+        if seconds < 0:
+            return
+        metrics = self._targets.setdefault(target, {})
+        self._targets.move_to_end(target)
+        while len(self._targets) > LATENCY_MAX_TARGETS:
+            self._targets.popitem(last=False)
+        estimator = metrics.get(metric)
+        if estimator is None:
+            estimator = metrics[metric] = LatencyEstimator()
+        estimator.add(seconds)
+        if self._store is not None:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return all learned estimates."""
+        return {
+            target: {
+                metric: estimator.as_dict()
+                for metric, estimator in metrics.items()
+            }
+            for target, metrics in self._targets.items()
+        }
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {"targets": self.as_dict()}
+
+    async def async_load(self) -> None:
+        """Load persisted estimates once, when running inside HA."""
+        if self._loaded or self._hass is None:
+            return
+        self._loaded = True
+
+        from homeassistant.helpers.storage import Store
+
+        self._store = Store(
+            self._hass, STORAGE_VERSION, f"{STORAGE_KEY_PREFIX}.{self._name}"
+        )
+        data = await self._store.async_load()
+        if not data:
+            return
+
+        try:
+            for target, metrics in data.get("targets", {}).items():
+                loaded = self._targets.setdefault(target, {})
+                for metric, values in metrics.items():
+                    loaded.setdefault(metric, LatencyEstimator.from_dict(values))
+        except (AttributeError, TypeError, ValueError):
+            _LOGGER.warning("Ignoring malformed stored latency statistics")
+            self._targets.clear()
+            return
+        # Stores written before targets were bounded may hold many more
+        while len(self._targets) > LATENCY_MAX_TARGETS:
+            self._targets.popitem(last=False)
+        _LOGGER.debug("Loaded latency statistics for %d target(s)", len(self._targets))
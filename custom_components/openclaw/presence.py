@@ -0,0 +1,138 @@
+"""Incremental presence model for OpenClaw gateway clients."""
+
+from types import MappingProxyType
+from typing import Any, Mapping
+
+# Fields that identify a presence entry, in order of preference
+_ID_FIELDS = ("id", "instanceId", "clientId", "deviceId", "host")
+
+# Payload keys of an incremental presence update
+DELTA_KEYS = ("joined", "left", "updated")
+
+
+def client_id(entry: Any) -> str | None:
+    """Return the id of a presence entry, if it has one."""
+    if isinstance(entry, str):
+        return entry or None
+    if isinstance(entry, dict):
+        for field in _ID_FIELDS:
+            value = entry.get(field)
+            if value:
+                return str(value)
+    return None
+
+
+class PresenceChange:
+    """Client ids that joined, left or changed in one presence update."""
+
+    __slots__ = ("joined", "left", "updated", "recounted")
+
+    def __init__(self) -> None:
+        """Initialize an empty change set."""
+        self.joined: list[str] = []
+        self.left: list[str] = []
+        self.updated: list[str] = []
+        # A count-only presence report changed the client count
+        self.recounted = False
+
+    def __bool__(self) -> bool:
+        return bool(self.joined or self.left or self.updated or self.recounted)
+
+    def as_dict(self) -> dict[str, list[str]]:
+        """Return the change set as lists of client ids."""
+        return {"joined": self.joined, "left": self.left, "updated": self.updated}
+
+
+class PresenceModel:
+    """Connected gateway clients indexed by id, updated in place.
+
+    Full snapshots are diffed against the current clients; incremental
+    updates with joined, left and updated entries are applied directly.
+    Every update returns the change set it caused.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty model."""
+        self._clients: dict[str, Any] = {}
+        self._known = False
+        # Client count from gateways that report a number, not entries
+        self._reported_count: int | None = None
+
+    @property
+    def clients(self) -> Mapping[str, Any]:
+        """Return a read-only view of the clients by id."""
+        return MappingProxyType(self._clients)
+
+    @property
+    def count(self) -> int | None:
+        """Return the number of connected clients, if presence is known."""
+        if self._reported_count is not None:
+            return self._reported_count
+        return len(self._clients) if self._known else None
+
+    def apply(self, payload: Any) -> PresenceChange:
+        """Apply a presence snapshot or incremental update."""
+        if isinstance(payload, list):
+            return self._replace(payload)
+        if not isinstance(payload, dict):
+            return PresenceChange()
+        if any(key in payload for key in DELTA_KEYS):
+            return self._apply_delta(payload)
+        clients = payload.get("clients", payload.get("presence"))
+        if isinstance(clients, list):
+            return self._replace(clients)
+        if isinstance(clients, int) and not isinstance(clients, bool):
+            return self._recount(clients)
+        return PresenceChange()
+
+    def _replace(self, entries: list[Any]) -> PresenceChange:
+        """Diff a full snapshot against the current clients."""
+        change = PresenceChange()
+        seen: set[str] = set()
+        for index, entry in enumerate(entries):
+            entry_id = client_id(entry) or f"#{index}"
+            seen.add(entry_id)
+            self._upsert(entry_id, entry, change)
+        for entry_id in [key for key in self._clients if key not in seen]:
+            del self._clients[entry_id]
+            change.left.append(entry_id)
+        change.recounted = self._reported_count is not None
+        self._reported_count = None
+        self._known = True
+        return change
+
+    def _apply_delta(self, payload: dict[str, Any]) -> PresenceChange:
+        """Apply joined, updated and left entries in place."""
+        change = PresenceChange()
+        for key in ("joined", "updated"):
+            for entry in payload.get(key) or ():
+                entry_id = client_id(entry)
+                if entry_id is not None:
+                    self._upsert(entry_id, entry, change)
+        for entry in payload.get("left") or ():
+            entry_id = client_id(entry)
+            if entry_id is not None and self._clients.pop(entry_id, None) is not None:
+                change.left.append(entry_id)
+        self._known = True
+        return change
+
+    def _recount(self, count: int) -> PresenceChange:
+        """Record a count-only presence report."""
+        change = PresenceChange()
+        change.recounted = count != self._reported_count
+        change.left.extend(self._clients)
+        self._clients.clear()
+        self._reported_count = count
+        self._known = True
+        return change
+
+    def _upsert(self, entry_id: str, entry: Any, change: PresenceChange) -> None:
+        """Insert or update one client, noting the change."""
+        previous = self._clients.get(entry_id)
+        if previous is None:
+            change.joined.append(entry_id)
+        elif previous != entry:
+            change.updated.append(entry_id)
+        else:
+            return
+        self._clients[entry_id] = entry
@@ -0,0 +1,87 @@
+"""Local query complexity classification for OpenClaw model tiers."""
+
+import re
+from collections import OrderedDict
+
+from .const import (
+    DEFAULT_FAST_MAX_WORDS,
+    QUERY_TIER_FAST,
+    QUERY_TIER_FULL,
+    SESSION_ROUTE_MAX_ENTRIES,
+)
+
+_WORD_PATTERN = re.compile(r"\w+", re.UNICODE)
+_SENTENCE_PATTERN = re.compile(r"[.!?]+\s+\S")
+
+# Words that signal reasoning, writing or multi-step work
+COMPLEX_KEYWORDS = frozenset(
+    {
+        "analyze",
+        "analyse",
+        "compare",
+        "debug",
+        "draft",
+        "explain",
+        "plan",
+        "recommend",
+        "research",
+        "summarize",
+        "summarise",
+        "translate",
+        "why",
+        "write",
+    }
+)
+
+# Openings that lean on the previous turn for their meaning
+FOLLOW_UP_WORDS = frozenset({"and", "also", "but", "it", "that", "this", "then"})
+
+
+class QueryClassifier:
+    """Pick the fast tier for short, simple prompts and the full tier otherwise.
+
+    A prompt is complex if it is long, spans several sentences or contains a
+    reasoning keyword. A short follow-up to a complex turn in the same
+    session stays on the full tier, since it inherits that turn's context.
+    """
+
+    def __init__(
+        self,
+        max_words: int = DEFAULT_FAST_MAX_WORDS,
+        max_sessions: int = SESSION_ROUTE_MAX_ENTRIES,
+    ) -> None:
+        """Initialize the classifier.
+
+        Args:
+            max_words: Longest prompt, in words, eligible for the fast tier
+            max_sessions: Sessions whose last tier is remembered
+        """
+        self._max_words = max_words
+        self._max_sessions = max_sessions
+        # Last tier chosen per session, least recently used first
+        self._history: OrderedDict[str, str] = OrderedDict()
+
+    def classify(self, message: str, session_key: str) -> str:
+        """Return the tier for a prompt and remember it for the session."""
+        tier = self._tier_for(message, self._history.get(session_key))
+        self._history[session_key] = tier
+        self._history.move_to_end(session_key)
+        while len(self._history) > self._max_sessions:
+            self._history.popitem(last=False)
+        return tier
+
+    def peek(self, message: str, session_key: str) -> str:
+        """Return the tier classify() would pick, without remembering it."""
+        return self._tier_for(message, self._history.get(session_key))
+
+    def _tier_for(self, message: str, previous: str | None) -> str:
+        words = [word.lower() for word in _WORD_PATTERN.findall(message)]
+        if not words or len(words) > self._max_words:
+            return QUERY_TIER_FULL
+        if _SENTENCE_PATTERN.search(message.strip()):
+            return QUERY_TIER_FULL
+        if COMPLEX_KEYWORDS.intersection(words):
+            return QUERY_TIER_FULL
+        if previous == QUERY_TIER_FULL and words[0] in FOLLOW_UP_WORDS:
+            return QUERY_TIER_FULL
+        return QUERY_TIER_FAST
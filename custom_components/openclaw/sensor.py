@@ -2,27 +2,198 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
 import logging
-from typing import Any
+from typing import Any, Callable
 
-from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
-    DataUpdateCoordinator,
-    UpdateFailed,
-)
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import (
+    CONF_PRESENCE_INTERVAL,
+    DEFAULT_PRESENCE_INTERVAL,
+    DOMAIN,
+    SENSOR_ATTR_MAX_ITEMS,
+)
+from .coordinator import (
+    GatewayStateCoordinator,
+    async_get_state_coordinator,
+    async_release_state_coordinator,
+)
 from .gateway_client import OpenClawGatewayClient
+from .latency import METRIC_ACK, METRIC_FIRST_TOKEN, METRIC_TOTAL, QUANTILES
+from .throughput import REQUESTS
 
 _LOGGER = logging.getLogger(__name__)
 
-_UPDATE_INTERVAL = timedelta(seconds=60)
+# Request counters are read from memory; rates decay between requests
+SCAN_INTERVAL = timedelta(seconds=60)
+
+# Request sensors: name, unit, state class, icon and value from request stats
+_REQUEST_SENSORS: dict[
+    str, tuple[str, str, str, str, Callable[[dict[str, Any]], Any]]
+] = {
+    "requests_today": (
+        "Requests Today",
+        "requests",
+        SensorStateClass.TOTAL_INCREASING,
+        "mdi:message-processing-outline",
+        lambda stats: stats["today"][REQUESTS],
+    ),
+    "errors_today": (
+        "Errors Today",
+        "errors",
+        SensorStateClass.TOTAL_INCREASING,
+        "mdi:message-alert-outline",
+        lambda stats: stats["errors_today"],
+    ),
+    "request_rate": (
+        "Request Rate",
+        "requests/min",
+        SensorStateClass.MEASUREMENT,
+        "mdi:speedometer",
+        lambda stats: stats["per_minute"][REQUESTS],
+    ),
+    "error_rate": (
+        "Error Rate",
+        "%",
+        SensorStateClass.MEASUREMENT,
+        "mdi:alert-decagram-outline",
+        lambda stats: stats["error_rate"],
+    ),
+}
+
+# Connection sensors: name, unit, device class, state class, icon and
+# value from connection stats
+_CONNECTION_SENSORS: dict[
+    str,
+    tuple[
+        str, str | None, str | None, str | None, str, Callable[[dict[str, Any]], Any]
+    ],
+] = {
+    "connected_since": (
+        "Connected Since",
+        None,
+        SensorDeviceClass.TIMESTAMP,
+        None,
+        "mdi:lan-connect",
+        lambda stats: (
+            None
+            if stats["session_seconds"] is None or stats["last_connected"] is None
+            else datetime.fromtimestamp(stats["last_connected"], timezone.utc)
+        ),
+    ),
+    "reconnects": (
+        "Reconnects",
+        "reconnects",
+        None,
+        SensorStateClass.TOTAL_INCREASING,
+        "mdi:lan-pending",
+        lambda stats: stats["reconnects"],
+    ),
+    "bytes_received": (
+        "Data Received",
+        "B",
+        SensorDeviceClass.DATA_SIZE,
+        SensorStateClass.TOTAL_INCREASING,
+        "mdi:download-network-outline",
+        lambda stats: stats["bytes_received"],
+    ),
+    "bytes_sent": (
+        "Data Sent",
+        "B",
+        SensorDeviceClass.DATA_SIZE,
+        SensorStateClass.TOTAL_INCREASING,
+        "mdi:upload-network-outline",
+        lambda stats: stats["bytes_sent"],
+    ),
+}
+
+# Reconnect sensor attributes, enough to tell a restart from flapping
+_RECONNECT_ATTRIBUTES = (
+    "connect_failures",
+    "short_sessions",
+    "last_session_seconds",
+    "last_close_code",
+    "last_close_reason",
+)
+
+# Usage sensors: name, unit, state class, icon and value from usage stats
+_USAGE_SENSORS: dict[
+    str, tuple[str, str | None, str, str, Callable[[dict[str, Any]], Any]]
+] = {
+    "tokens_today": (
+        "Tokens Today",
+        "tokens",
+        SensorStateClass.TOTAL_INCREASING,
+        "mdi:counter",
+        lambda stats: stats["today"]["total_tokens"],
+    ),
+    "cost_today": (
+        "Estimated Cost Today",
+        None,
+        SensorStateClass.TOTAL_INCREASING,
+        "mdi:cash",
+        lambda stats: round(stats["today"]["cost"], 4),
+    ),
+    "tokens_rolling": (
+        "Tokens Last Hour",
+        "tokens",
+        SensorStateClass.MEASUREMENT,
+        "mdi:counter",
+        lambda stats: stats["rolling"]["total_tokens"],
+    ),
+    "cost_rolling": (
+        "Estimated Cost Last Hour",
+        None,
+        SensorStateClass.MEASUREMENT,
+        "mdi:cash-clock",
+        lambda stats: round(stats["rolling"]["cost"], 4),
+    ),
+}
+
+# Latency sensor names by client metric
+_LATENCY_NAMES = {
+    METRIC_TOTAL: "Response Time",
+    METRIC_FIRST_TOKEN: "Time to First Token",
+    METRIC_ACK: "Ack Latency",
+}
+
+
+def _session_summary(sessions: Any) -> tuple[int | None, list[str]]:
+    """Reduce a status sessions payload to a count and the first few keys."""
+    if isinstance(sessions, bool):
+        return None, []
+    if isinstance(sessions, int):
+        return sessions, []
+    if isinstance(sessions, dict):
+        # Either {"count": n, ...} or a mapping of session key to details
+        count = sessions.get("count")
+        if isinstance(count, int) and not isinstance(count, bool):
+            return count, []
+        return len(sessions), list(sessions)[:SENSOR_ATTR_MAX_ITEMS]
+    if isinstance(sessions, list):
+        keys: list[str] = []
+        for item in sessions:
+            if len(keys) == SENSOR_ATTR_MAX_ITEMS:
+                break
+            if isinstance(item, str):
+                keys.append(item)
+            elif isinstance(item, dict):
+                key = item.get("sessionKey") or item.get("session_key") or item.get("key")
+                if key:
+                    keys.append(str(key))
+        return len(sessions), keys
+    return None, []
 
 
 async def async_setup_entry(
@@ -33,49 +204,36 @@ async def async_setup_entry(
     """Set up OpenClaw diagnostic sensors."""
     client: OpenClawGatewayClient = hass.data[DOMAIN][entry.entry_id]
 
-    async def _async_update_status() -> dict[str, Any]:
-        if not client.connected:
-            raise UpdateFailed("Gateway not connected")
-        try:
-            return await client.status()
-        except Exception as err:
-            raise UpdateFailed(f"Status request failed: {err}") from err
-
-    async def _async_update_health() -> dict[str, Any]:
-        if not client.connected:
-            raise UpdateFailed("Gateway not connected")
-        try:
-            return await client.health()
-        except Exception as err:
-            raise UpdateFailed(f"Health request failed: {err}") from err
-
-    status_coordinator = DataUpdateCoordinator(
-        hass,
-        _LOGGER,
-        name=f"{DOMAIN}_status_{entry.entry_id}",
-        update_method=_async_update_status,
-        update_interval=_UPDATE_INTERVAL,
-    )
-
-    health_coordinator = DataUpdateCoordinator(
-        hass,
-        _LOGGER,
-        name=f"{DOMAIN}_health_{entry.entry_id}",
-        update_method=_async_update_health,
-        update_interval=_UPDATE_INTERVAL,
+    # One status+health cycle per gateway, shared by all its entries
+    coordinator = await async_get_state_coordinator(hass, entry.entry_id, client)
+    endpoint = client.endpoint
+    entry.async_on_unload(
+        lambda: async_release_state_coordinator(hass, entry.entry_id, endpoint)
     )
-
-    # Best-effort initial fetch — sensors will retry on next cycle
-    for coordinator in (status_coordinator, health_coordinator):
-        try:
-            await coordinator.async_refresh()
-        except Exception:  # noqa: BLE001
-            _LOGGER.debug("Initial %s refresh failed, will retry", coordinator.name)
+    config = {**entry.data, **entry.options}
+    presence_interval = config.get(CONF_PRESENCE_INTERVAL, DEFAULT_PRESENCE_INTERVAL)
 
     async_add_entities([
-        OpenClawUptimeSensor(status_coordinator, entry.entry_id, client),
-        OpenClawConnectedClientsSensor(entry.entry_id, client),
-        OpenClawHealthSensor(health_coordinator, entry.entry_id),
+        OpenClawUptimeSensor(coordinator, entry.entry_id, client),
+        OpenClawConnectedClientsSensor(entry.entry_id, client, presence_interval),
+        OpenClawHealthSensor(coordinator, entry.entry_id),
+        *(
+            OpenClawLatencySensor(entry.entry_id, client, metric, quantile)
+            for metric in _LATENCY_NAMES
+            for quantile in QUANTILES
+        ),
+        *(
+            OpenClawRequestSensor(entry.entry_id, client, key)
+            for key in _REQUEST_SENSORS
+        ),
+        *(
+            OpenClawConnectionSensor(entry.entry_id, client, key)
+            for key in _CONNECTION_SENSORS
+        ),
+        *(
+            OpenClawUsageSensor(entry.entry_id, client, key)
+            for key in _USAGE_SENSORS
+        ),
     ])
 
 
@@ -86,10 +244,12 @@ class OpenClawUptimeSensor(CoordinatorEntity, SensorEntity):
     _attr_native_unit_of_measurement = "s"
     _attr_state_class = SensorStateClass.TOTAL_INCREASING
     _attr_icon = "mdi:timer-outline"
+    # Changes on every push, so recording it would defeat attribute dedup
+    _unrecorded_attributes = frozenset({"state_version", "session_keys"})
 
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator,
+        coordinator: GatewayStateCoordinator,
         entry_id: str,
         client: OpenClawGatewayClient,
     ) -> None:
@@ -110,7 +270,7 @@ class OpenClawUptimeSensor(CoordinatorEntity, SensorEntity):
 
     @property
     def native_value(self) -> float | None:
-        data = self.coordinator.data or {}
+        data = (self.coordinator.data or {}).get("status") or {}
         uptime_ms = data.get("uptimeMs")
         if uptime_ms is not None:
             return round(uptime_ms / 1000, 1)
@@ -123,11 +283,15 @@ class OpenClawUptimeSensor(CoordinatorEntity, SensorEntity):
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        data = self.coordinator.data or {}
-        return {
+        data = (self.coordinator.data or {}).get("status") or {}
+        sessions, session_keys = _session_summary(data.get("sessions"))
+        attrs: dict[str, Any] = {
             "state_version": data.get("stateVersion"),
-            "sessions": data.get("sessions"),
+            "sessions": sessions,
         }
+        if session_keys:
+            attrs["session_keys"] = session_keys
+        return attrs
 
 
 class OpenClawConnectedClientsSensor(SensorEntity):
@@ -137,13 +301,50 @@ class OpenClawConnectedClientsSensor(SensorEntity):
     _attr_native_unit_of_measurement = "clients"
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_icon = "mdi:account-multiple"
+    _attr_should_poll = False
+    _unrecorded_attributes = frozenset({"client_ids"})
 
-    def __init__(self, entry_id: str, client: OpenClawGatewayClient) -> None:
+    def __init__(
+        self,
+        entry_id: str,
+        client: OpenClawGatewayClient,
+        min_interval: float = DEFAULT_PRESENCE_INTERVAL,
+    ) -> None:
         self._client = client
         self._entry_id = entry_id
+        self._min_interval = min_interval
+        self._debouncer: Debouncer | None = None
         self._attr_name = "OpenClaw Connected Clients"
         self._attr_unique_id = f"{entry_id}_connected_clients"
 
+    async def async_added_to_hass(self) -> None:
+        """Follow presence pushes, writing at most once per min interval."""
+        await super().async_added_to_hass()
+        if self._min_interval > 0:
+            # The first change is written at once; churn within the
+            # cooldown collapses into one write at its end
+            self._debouncer = Debouncer(
+                self.hass,
+                _LOGGER,
+                cooldown=self._min_interval,
+                immediate=True,
+                function=self.async_write_ha_state,
+            )
+            self.async_on_remove(self._debouncer.async_cancel)
+        self.async_on_remove(
+            self._client.add_state_listener(self._handle_state_push)
+        )
+
+    @callback
+    def _handle_state_push(self, kind: str, _payload: dict[str, Any] | None) -> None:
+        """Schedule a state write when presence changes."""
+        if kind != "presence":
+            return
+        if self._debouncer is None:
+            self.async_write_ha_state()
+        else:
+            self._debouncer.async_schedule_call()
+
     @property
     def device_info(self) -> dict[str, Any]:
         return {
@@ -155,24 +356,12 @@ class OpenClawConnectedClientsSensor(SensorEntity):
 
     @property
     def native_value(self) -> int | None:
-        presence = self._client.presence
-        if not presence:
-            return None
-        clients = presence.get("clients")
-        if isinstance(clients, list):
-            return len(clients)
-        if isinstance(clients, int):
-            return clients
-        return None
+        return self._client.presence.count
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        presence = self._client.presence
-        attrs: dict[str, Any] = {}
-        clients = presence.get("clients")
-        if isinstance(clients, list):
-            attrs["client_list"] = clients
-        return attrs
+        client_ids = list(self._client.presence.clients)[:SENSOR_ATTR_MAX_ITEMS]
+        return {"client_ids": client_ids} if client_ids else {}
 
 
 class OpenClawHealthSensor(CoordinatorEntity, SensorEntity):
@@ -183,7 +372,7 @@ class OpenClawHealthSensor(CoordinatorEntity, SensorEntity):
 
     def __init__(
         self,
-        coordinator: DataUpdateCoordinator,
+        coordinator: GatewayStateCoordinator,
         entry_id: str,
     ) -> None:
         super().__init__(coordinator)
@@ -202,7 +391,7 @@ class OpenClawHealthSensor(CoordinatorEntity, SensorEntity):
 
     @property
     def native_value(self) -> str | None:
-        data = self.coordinator.data or {}
+        data = (self.coordinator.data or {}).get("health") or {}
         if not data:
             return None
         # Try explicit status/healthy fields
@@ -217,10 +406,220 @@ class OpenClawHealthSensor(CoordinatorEntity, SensorEntity):
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        data = self.coordinator.data or {}
+        data = (self.coordinator.data or {}).get("health") or {}
         attrs: dict[str, Any] = {}
         for key in ("version", "uptimeMs", "memoryUsage", "cpuUsage"):
             val = data.get(key)
             if val is not None:
                 attrs[key] = val
         return attrs
+
+
+class OpenClawLatencySensor(SensorEntity):
+    """Recent median or p95 of one agent latency, in milliseconds."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = "ms"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_icon = "mdi:timer-sand"
+    _attr_should_poll = False
+    _unrecorded_attributes = frozenset({"samples"})
+
+    def __init__(
+        self,
+        entry_id: str,
+        client: OpenClawGatewayClient,
+        metric: str,
+        quantile: str,
+    ) -> None:
+        self._client = client
+        self._entry_id = entry_id
+        self._metric = metric
+        self._quantile = quantile
+        self._attr_name = f"OpenClaw {_LATENCY_NAMES[metric]} {quantile}"
+        self._attr_unique_id = f"{entry_id}_{metric}_latency_{quantile}"
+
+    async def async_added_to_hass(self) -> None:
+        """Follow the latency updates after each completed agent run."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._client.add_state_listener(self._handle_state_push)
+        )
+
+    @callback
+    def _handle_state_push(self, kind: str, _payload: dict[str, Any] | None) -> None:
+        """Write state when new latency samples were recorded."""
+        if kind == "latency":
+            self.async_write_ha_state()
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        return {
+            "identifiers": {(DOMAIN, self._entry_id)},
+            "name": "OpenClaw Gateway",
+            "manufacturer": "OpenClaw",
+            "model": "Gateway",
+        }
+
+    @property
+    def _window(self) -> dict[str, Any]:
+        return self._client.latency_quantiles.get(self._metric, {})
+
+    @property
+    def native_value(self) -> int | None:
+        seconds = self._window.get(self._quantile)
+        return None if seconds is None else round(seconds * 1000)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        return {"samples": self._window.get("samples", 0)}
+
+
+class OpenClawRequestSensor(SensorEntity):
+    """Agent request totals for today, or recent request and error rates.
+
+    Polled, since rates fall back towards zero while no requests arrive.
+    """
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self,
+        entry_id: str,
+        client: OpenClawGatewayClient,
+        key: str,
+    ) -> None:
+        self._client = client
+        self._entry_id = entry_id
+        self._key = key
+        name, unit, state_class, icon, self._value = _REQUEST_SENSORS[key]
+        self._attr_name = f"OpenClaw {name}"
+        self._attr_unique_id = f"{entry_id}_{key}"
+        self._attr_native_unit_of_measurement = unit
+        self._attr_state_class = state_class
+        self._attr_icon = icon
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        return {
+            "identifiers": {(DOMAIN, self._entry_id)},
+            "name": "OpenClaw Gateway",
+            "manufacturer": "OpenClaw",
+            "model": "Gateway",
+        }
+
+    @property
+    def native_value(self) -> float | None:
+        return self._value(self._client.request_stats)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        if self._key != "requests_today":
+            return {}
+        # Outcome breakdown, a handful of small counters
+        today = self._client.request_stats["today"]
+        return {key: count for key, count in today.items() if key != REQUESTS}
+
+
+class OpenClawConnectionSensor(SensorEntity):
+    """Gateway connection history and traffic, polled from the protocol."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self,
+        entry_id: str,
+        client: OpenClawGatewayClient,
+        key: str,
+    ) -> None:
+        self._client = client
+        self._entry_id = entry_id
+        self._key = key
+        name, unit, device_class, state_class, icon, self._value = _CONNECTION_SENSORS[key]
+        self._attr_name = f"OpenClaw {name}"
+        self._attr_unique_id = f"{entry_id}_{key}"
+        self._attr_native_unit_of_measurement = unit
+        self._attr_device_class = device_class
+        self._attr_state_class = state_class
+        self._attr_icon = icon
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        return {
+            "identifiers": {(DOMAIN, self._entry_id)},
+            "name": "OpenClaw Gateway",
+            "manufacturer": "OpenClaw",
+            "model": "Gateway",
+        }
+
+    @property
+    def native_value(self) -> Any:
+        return self._value(self._client.connection_stats)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        if self._key != "reconnects":
+            return {}
+        stats = self._client.connection_stats
+        return {key: stats[key] for key in _RECONNECT_ATTRIBUTES}
+
+
+class OpenClawUsageSensor(SensorEntity):
+    """Agent token usage and estimated cost, today or over the last hour."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _unrecorded_attributes = frozenset({"top_today"})
+
+    def __init__(
+        self,
+        entry_id: str,
+        client: OpenClawGatewayClient,
+        key: str,
+    ) -> None:
+        self._client = client
+        self._entry_id = entry_id
+        self._key = key
+        name, unit, state_class, icon, self._value = _USAGE_SENSORS[key]
+        self._attr_name = f"OpenClaw {name}"
+        self._attr_unique_id = f"{entry_id}_{key}"
+        self._attr_native_unit_of_measurement = unit
+        self._attr_state_class = state_class
+        self._attr_icon = icon
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        return {
+            "identifiers": {(DOMAIN, self._entry_id)},
+            "name": "OpenClaw Gateway",
+            "manufacturer": "OpenClaw",
+            "model": "Gateway",
+        }
+
+    @property
+    def native_value(self) -> float:
+        return self._value(self._client.usage_stats)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        if self._key != "tokens_today":
+            return {}
+        stats = self._client.usage_stats
+        today = stats["today"]
+        attrs: dict[str, Any] = {
+            key: today[key]
+            for key in ("input_tokens", "output_tokens", "runs")
+        }
+        # Busiest session|model groups; the full breakdown is in diagnostics
+        top = sorted(
+            (
+                (group, usage["today"]["total_tokens"])
+                for group, usage in stats["groups"].items()
+                if usage["today"]["total_tokens"]
+            ),
+            key=lambda item: item[1],
+            reverse=True,
+        )[:SENSOR_ATTR_MAX_ITEMS]
+        if top:
+            attrs["top_today"] = dict(top)
+        return attrs
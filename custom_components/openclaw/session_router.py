@@ -0,0 +1,94 @@
+"""Per-conversation and per-device session routing for OpenClaw."""
+
+import time
+import uuid
+from collections import OrderedDict
+
+from .const import (
+    SESSION_ROUTE_IDLE_TIMEOUT,
+    SESSION_ROUTE_MAX_ENTRIES,
+    SESSION_ROUTING_CONVERSATION,
+    SESSION_ROUTING_DEVICE,
+)
+
+
+class SessionRouter:
+    """Map conversations or satellites to their own gateway sessions.
+
+    Routes are kept in a bounded LRU. A route left idle for longer than the
+    idle timeout is forgotten, so the next utterance starts a fresh session.
+    """
+
+    def __init__(
+        self,
+        mode: str,
+        max_entries: int = SESSION_ROUTE_MAX_ENTRIES,
+        idle_timeout: float = SESSION_ROUTE_IDLE_TIMEOUT,
+    ) -> None:
+        """Initialize the router."""
+        self._mode = mode
+        self._max_entries = max_entries
+        self._idle_timeout = idle_timeout
+        # (base session, kind, id) -> (routed session, last used)
+        self._routes: OrderedDict[tuple[str, str, str], tuple[str, float]] = (
+            OrderedDict()
+        )
+
+    @property
+    def mode(self) -> str:
+        """Return the routing mode."""
+        return self._mode
+
+    def __len__(self) -> int:
+        return len(self._routes)
+
+    def resolve(
+        self,
+        base_session: str,
+        conversation_id: str | None = None,
+        device_id: str | None = None,
+    ) -> str:
+        """Return the gateway session key for an utterance."""
+        route = self._route_for(conversation_id, device_id)
+        if route is None:
+            return base_session
+
+        now = time.monotonic()
+        self._prune(now)
+
+        key = (base_session, *route)
+        entry = self._routes.get(key)
+        if entry is None:
+            session_key = f"{base_session}-{route[0]}-{uuid.uuid4().hex[:8]}"
+        else:
+            session_key = entry[0]
+            self._routes.move_to_end(key)
+        self._routes[key] = (session_key, now)
+
+        while len(self._routes) > self._max_entries:
+            self._routes.popitem(last=False)
+        return session_key
+
+    def clear(self) -> None:
+        """Forget all routes."""
+        self._routes.clear()
+
+    def _route_for(
+        self, conversation_id: str | None, device_id: str | None
+    ) -> tuple[str, str] | None:
+        if self._mode == SESSION_ROUTING_DEVICE and device_id:
+            return ("device", device_id)
+        if (
+            self._mode in (SESSION_ROUTING_DEVICE, SESSION_ROUTING_CONVERSATION)
+            and conversation_id
+        ):
+            return ("conversation", conversation_id)
+        return None
+
+    def _prune(self, now: float) -> None:
+        """Drop idle routes; the oldest entries are the least recently used."""
+        while self._routes:
+            _, last_used = next(iter(self._routes.values()))
+            if now - last_used <= self._idle_timeout:
+                return
+            self._routes.popitem(last=False)
@@ -0,0 +1,133 @@
+"""Agent request throughput and error counters for OpenClaw sensors."""
+
+import asyncio
+import time
+from collections import deque
+from datetime import date
+from typing import Any, Callable
+
+from .exceptions import (
+    GatewayAuthenticationError,
+    GatewayConnectionError,
+    GatewayStalledError,
+    GatewayTimeoutError,
+)
+
+RATE_WINDOW = 15  # minutes averaged into per-minute rates
+
+# Counted events: every request, then exactly one outcome per request
+REQUESTS = "requests"
+OUTCOME_COMPLETED = "completed"
+OUTCOME_CANCELLED = "cancelled"
+OUTCOME_TIMEOUT = "timeouts"
+OUTCOME_STALL = "stalls"
+OUTCOME_AUTH_FAILURE = "auth_failures"
+OUTCOME_CONNECTION_ERROR = "connection_errors"
+OUTCOME_EXECUTION_ERROR = "execution_errors"
+
+FAILURE_OUTCOMES = (
+    OUTCOME_TIMEOUT,
+    OUTCOME_STALL,
+    OUTCOME_AUTH_FAILURE,
+    OUTCOME_CONNECTION_ERROR,
+    OUTCOME_EXECUTION_ERROR,
+)
+COUNTERS = (REQUESTS, OUTCOME_COMPLETED, OUTCOME_CANCELLED, *FAILURE_OUTCOMES)
+
+
+def failure_outcome(err: BaseException) -> str:
+    """Return the outcome counted for a request that raised an error."""
+    if isinstance(err, (asyncio.CancelledError, GeneratorExit)):
+        return OUTCOME_CANCELLED
+    # Request-level auth errors reach callers wrapped in AgentExecutionError
+    if isinstance(err, GatewayAuthenticationError) or isinstance(
+        err.__cause__, GatewayAuthenticationError
+    ):
+        return OUTCOME_AUTH_FAILURE
+    if isinstance(err, GatewayStalledError):
+        return OUTCOME_STALL
+    if isinstance(err, GatewayTimeoutError):
+        return OUTCOME_TIMEOUT
+    if isinstance(err, GatewayConnectionError):
+        return OUTCOME_CONNECTION_ERROR
+    return OUTCOME_EXECUTION_ERROR
+
+
+class RequestMeter:
+    """Request and outcome counts as daily totals and recent rates.
+
+    Rates come from one bucket per minute over the last RATE_WINDOW
+    minutes and daily totals reset when the date changes, so memory
+    stays constant however many requests are made.
+    """
+
+    def __init__(
+        self,
+        today: Callable[[], date] = date.today,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the meter.
+
+        Args:
+            today: Returns the current local date, for daily totals
+            clock: Monotonic clock in seconds, for rate buckets
+        """
+        self._today = today
+        self._clock = clock
+        self._day = today()
+        self._daily = dict.fromkeys(COUNTERS, 0)
+        self._totals = dict.fromkeys(COUNTERS, 0)
+        self._minutes: deque[tuple[int, dict[str, int]]] = deque(
+            maxlen=RATE_WINDOW
+        )
+
+    def record(self, counter: str) -> None:
+        """Count a request or a request outcome."""
+        self._roll_day()
+        self._daily[counter] += 1
+        self._totals[counter] += 1
+        minute = int(self._clock() // 60)
+        if not self._minutes or self._minutes[-1][0] != minute:
+            self._minutes.append((minute, dict.fromkeys(COUNTERS, 0)))
+        self._minutes[-1][1][counter] += 1
+
+    def _roll_day(self) -> None:
+        today = self._today()
+        if today != self._day:
+            self._day = today
+            self._daily = dict.fromkeys(COUNTERS, 0)
+
+    def _recent(self) -> dict[str, int]:
+        """Return the counts of the last RATE_WINDOW minutes."""
+        oldest = int(self._clock() // 60) - RATE_WINDOW
+        recent = dict.fromkeys(COUNTERS, 0)
+        for minute, counts in self._minutes:
+            if minute > oldest:
+                for counter, count in counts.items():
+                    recent[counter] += count
+        return recent
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return daily totals, per-minute rates and the recent error rate.
+
+        The error rate is the percentage of requests finished within the
+        rate window that failed, or None if none finished.
+        """
+        self._roll_day()
+        recent = self._recent()
+        failures = sum(recent[outcome] for outcome in FAILURE_OUTCOMES)
+        finished = failures + recent[OUTCOME_COMPLETED]
+        return {
+            "today": dict(self._daily),
+            "errors_today": sum(
+                self._daily[outcome] for outcome in FAILURE_OUTCOMES
+            ),
+            "per_minute": {
+                counter: round(count / RATE_WINDOW, 3)
+                for counter, count in recent.items()
+            },
+            "error_rate": (
+                round(100 * failures / finished, 1) if finished else None
+            ),
+            "totals": dict(self._totals),
+        }
@@ -0,0 +1,145 @@
+"""Token usage and cost aggregation for OpenClaw agent runs."""
+
+import time
+from collections import OrderedDict, deque
+from datetime import date
+from typing import Any, Callable
+
+USAGE_WINDOW = 60  # minutes in the rolling usage window
+USAGE_MAX_GROUPS = 64  # session/model pairs kept, least recently used dropped
+
+# Gateway usage fields, camelCase or snake_case, by reported metric
+_USAGE_FIELDS = {
+    "input_tokens": ("inputTokens", "input_tokens", "promptTokens"),
+    "output_tokens": ("outputTokens", "output_tokens", "completionTokens"),
+    "cache_read_tokens": ("cacheReadTokens", "cache_read_tokens"),
+    "cache_write_tokens": ("cacheWriteTokens", "cache_write_tokens"),
+    "total_tokens": ("totalTokens", "total_tokens"),
+    "cost": ("cost", "estimatedCost", "costUsd"),
+}
+METRICS = (*_USAGE_FIELDS, "runs")
+
+
+def parse_usage(payload: dict[str, Any]) -> dict[str, float] | None:
+    """Return the usage reported in an agent event payload, if any.
+
+    Usage may sit at the top of the payload or under its data. Missing
+    totals are derived from the input and output tokens.
+    """
+    usage = payload.get("usage")
+    if not isinstance(usage, dict):
+        data = payload.get("data")
+        usage = data.get("usage") if isinstance(data, dict) else None
+    if not isinstance(usage, dict):
+        return None
+
+    parsed: dict[str, float] = {}
+    for metric, fields in _USAGE_FIELDS.items():
+        for field in fields:
+            value = usage.get(field)
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                parsed[metric] = value
+                break
+    if not parsed:
+        return None
+    if "total_tokens" not in parsed:
+        parsed["total_tokens"] = parsed.get("input_tokens", 0) + parsed.get(
+            "output_tokens", 0
+        )
+    return parsed
+
+
+def _empty() -> dict[str, float]:
+    return dict.fromkeys(METRICS, 0)
+
+
+def _add(totals: dict[str, float], usage: dict[str, float]) -> None:
+    for metric, value in usage.items():
+        totals[metric] += value
+    totals["runs"] += 1
+
+
+class UsageTracker:
+    """Token and cost totals per session and model, daily and rolling.
+
+    The rolling window keeps one bucket per minute and daily totals reset
+    when the date changes. Session/model groups are bounded, dropping the
+    least recently used, since routed sessions come and go.
+    """
+
+    def __init__(
+        self,
+        today: Callable[[], date] = date.today,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the tracker.
+
+        Args:
+            today: Returns the current local date, for daily totals
+            clock: Monotonic clock in seconds, for rolling buckets
+        """
+        self._today = today
+        self._clock = clock
+        self._day = today()
+        self._daily = _empty()
+        self._totals = _empty()
+        # Per "session|model" group: (totals today, totals since start)
+        self._groups: OrderedDict[str, tuple[dict[str, float], dict[str, float]]] = (
+            OrderedDict()
+        )
+        self._minutes: deque[tuple[int, dict[str, float]]] = deque(
+            maxlen=USAGE_WINDOW
+        )
+
+    def record(
+        self, session_key: str | None, model: str | None, usage: dict[str, float]
+    ) -> None:
+        """Add the usage of one completed agent run."""
+        self._roll_day()
+        _add(self._daily, usage)
+        _add(self._totals, usage)
+
+        group = f"{session_key or ''}|{model or ''}"
+        if group not in self._groups:
+            self._groups[group] = (_empty(), _empty())
+        self._groups.move_to_end(group)
+        for totals in self._groups[group]:
+            _add(totals, usage)
+        while len(self._groups) > USAGE_MAX_GROUPS:
+            self._groups.popitem(last=False)
+
+        minute = int(self._clock() // 60)
+        if not self._minutes or self._minutes[-1][0] != minute:
+            self._minutes.append((minute, _empty()))
+        _add(self._minutes[-1][1], usage)
+
+    def _roll_day(self) -> None:
+        today = self._today()
+        if today != self._day:
+            self._day = today
+            self._daily = _empty()
+            for daily, _ in self._groups.values():
+                daily.update(_empty())
+
+    def _recent(self) -> dict[str, float]:
+        """Return the usage of the last USAGE_WINDOW minutes."""
+        oldest = int(self._clock() // 60) - USAGE_WINDOW
+        recent = _empty()
+        for minute, usage in self._minutes:
+            if minute > oldest:
+                for metric, value in usage.items():
+                    recent[metric] += value
+        return recent
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return usage today, in the rolling window, since start and by group."""
+        self._roll_day()
+        return {
+            "today": dict(self._daily),
+            "rolling": self._recent(),
+            "totals": dict(self._totals),
+            "groups": {
+                group: {"today": dict(daily), "totals": dict(totals)}
+                for group, (daily, totals) in self._groups.items()
+            },
+        }
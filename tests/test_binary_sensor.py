@@ -22,6 +22,7 @@ def _load_module(name: str, path: Path):
 # ── stub out homeassistant packages ──
 
 _ha = MagicMock()
+_ha.callback = lambda func: func
 
 _bs_mod = ModuleType("homeassistant.components.binary_sensor")
 
@@ -60,6 +61,11 @@ _const = _load_module("custom_components.openclaw.const", _BASE / "const.py")
 _exceptions = _load_module("custom_components.openclaw.exceptions", _BASE / "exceptions.py")
 _device_auth = _load_module("custom_components.openclaw.device_auth", _BASE / "device_auth.py")
 _gateway = _load_module("custom_components.openclaw.gateway", _BASE / "gateway.py")
+_latency = _load_module("custom_components.openclaw.latency", _BASE / "latency.py")
+_load_module("custom_components.openclaw.presence", _BASE / "presence.py")
+_load_module("custom_components.openclaw.query_tier", _BASE / "query_tier.py")
+_load_module("custom_components.openclaw.throughput", _BASE / "throughput.py")
+_load_module("custom_components.openclaw.usage", _BASE / "usage.py")
 _gateway_client = _load_module(
     "custom_components.openclaw.gateway_client", _BASE / "gateway_client.py"
 )
@@ -105,6 +111,24 @@ class TestOpenClawGatewayConnectivitySensor:
         sensor = self._make_sensor(False)
         assert sensor._attr_entity_category == "diagnostic"
 
-    def test_should_poll(self) -> None:
+    def test_should_not_poll(self) -> None:
         sensor = self._make_sensor(False)
-        assert sensor._attr_should_poll is True
+        assert sensor._attr_should_poll is False
+
+    def test_state_written_on_connection_transitions_only(self) -> None:
+        sensor = self._make_sensor(False)
+        sensor.async_write_ha_state = MagicMock()
+        gateway = sensor._gateway_client._gateway
+        remove = sensor._gateway_client.add_connection_listener(
+            sensor._handle_connection_change
+        )
+
+        gateway._set_connected(True)
+        gateway._set_connected(True)
+        assert sensor.is_on is True
+        gateway._set_connected(False)
+        assert sensor.async_write_ha_state.call_count == 2
+
+        remove()
+        gateway._set_connected(True)
+        assert sensor.async_write_ha_state.call_count == 2
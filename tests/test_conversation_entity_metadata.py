@@ -1,7 +1,9 @@
 """Tests for conversation entity metadata without HA runtime."""
 
+import asyncio
 import importlib.util
 import sys
+import time
 from pathlib import Path
 from types import ModuleType
 from unittest.mock import MagicMock
@@ -65,6 +67,7 @@ def _load_conversation_module():
     conversation_mod.ConversationResult = ConversationResult
     config_entries_mod.ConfigEntry = object
     core_mod.HomeAssistant = object
+    core_mod.callback = lambda func: func
     intent_mod.IntentResponse = IntentResponse
     entity_platform_mod.AddEntitiesCallback = object
 
@@ -75,7 +78,13 @@ def _load_conversation_module():
     _load_module("custom_components.openclaw.const", base / "const.py")
     _load_module("custom_components.openclaw.exceptions", base / "exceptions.py")
     _load_module("custom_components.openclaw.gateway", base / "gateway.py")
+    _load_module("custom_components.openclaw.latency", base / "latency.py")
+    _load_module("custom_components.openclaw.presence", base / "presence.py")
+    _load_module("custom_components.openclaw.query_tier", base / "query_tier.py")
+    _load_module("custom_components.openclaw.throughput", base / "throughput.py")
+    _load_module("custom_components.openclaw.usage", base / "usage.py")
     _load_module("custom_components.openclaw.gateway_client", base / "gateway_client.py")
+    _load_module("custom_components.openclaw.session_router", base / "session_router.py")
     return _load_module(
         "custom_components.openclaw.conversation", base / "conversation.py"
     )
@@ -119,6 +128,24 @@ def test_trim_tts_text() -> None:
     assert conversation.trim_tts_text("1234567890", 6) == "123..."
 
 
+def test_availability_written_on_connection_change() -> None:
+    conversation = _load_conversation_module()
+    client_mod = sys.modules["custom_components.openclaw.gateway_client"]
+    client = client_mod.OpenClawGatewayClient("localhost", 1, None)
+    entry = MagicMock()
+    entry.entry_id = "entry-1"
+    entry.data = {}
+    entry.options = {}
+    entity = conversation.OpenClawConversationEntity(entry, client)
+    entity.async_write_ha_state = MagicMock()
+    client.add_connection_listener(entity._handle_connection_change)
+
+    client._gateway._set_connected(True)
+
+    assert entity.available is True
+    entity.async_write_ha_state.assert_called_once_with()
+
+
 def test_error_message_added_to_chat_log() -> None:
     conversation = _load_conversation_module()
 
@@ -146,3 +173,353 @@ def test_error_message_added_to_chat_log() -> None:
     assert result.conversation_id == "conv-1"
     assert len(chat_log.contents) == 1
     assert chat_log.contents[0].content == "Error"
+
+
+class _DeltaChatLog:
+    def __init__(self) -> None:
+        self.deltas = []
+
+    def async_add_assistant_content_without_tools(self, _content) -> None:
+        raise AssertionError("delta streaming must not add content separately")
+
+    async def async_add_delta_content_stream(self, agent_id, stream):
+        async for delta in stream:
+            self.deltas.append(delta)
+            yield delta
+
+
+def _delta_entity(conversation, chunks=(), error=None, options=None, calls=None):
+    conversation.conversation.ChatLog = _DeltaChatLog
+    calls = [] if calls is None else calls
+
+    async def _stream(_message, **kwargs):
+        calls.append(kwargs)
+        for chunk in chunks:
+            yield chunk
+        if error is not None:
+            raise error
+
+    client = MagicMock()
+    client.agent_budget.return_value = 30
+    client.session_key = "main"
+    client.stream_agent_request = _stream
+
+    entry = MagicMock()
+    entry.entry_id = "entry-1"
+    entry.data = {}
+    entry.options = options or {}
+
+    user_input = MagicMock()
+    user_input.text = "hello"
+    user_input.language = "en"
+    user_input.conversation_id = "conv-1"
+    user_input.agent_id = "agent-1"
+    user_input.device_id = "satellite-1"
+    return conversation.OpenClawConversationEntity(entry, client), user_input
+
+
+def test_stream_written_to_chat_log_as_deltas() -> None:
+    conversation = _load_conversation_module()
+    entity, user_input = _delta_entity(conversation, ["Hel", "", "lo"])
+    chat_log = _DeltaChatLog()
+
+    result = asyncio.run(entity._async_handle_message(user_input, chat_log))
+
+    assert entity._attr_supports_streaming is True
+    assert result.conversation_id == "conv-1"
+    assert chat_log.deltas == [
+        {"role": "assistant"},
+        {"content": "Hel"},
+        {"content": "lo"},
+    ]
+
+
+def test_delta_stream_error_before_content_becomes_message() -> None:
+    conversation = _load_conversation_module()
+    exceptions = sys.modules["custom_components.openclaw.exceptions"]
+    entity, user_input = _delta_entity(
+        conversation, error=exceptions.GatewayStalledError("stalled")
+    )
+    chat_log = _DeltaChatLog()
+
+    asyncio.run(entity._async_handle_message(user_input, chat_log))
+
+    assert chat_log.deltas[1:] == [
+        {"content": "The assistant stopped responding. Please try again."}
+    ]
+
+
+def test_streaming_probe_runs_once_per_class() -> None:
+    conversation = _load_conversation_module()
+    entity_cls = conversation.OpenClawConversationEntity
+    calls = []
+    original = entity_cls._probe_streaming_result
+
+    def _probe() -> bool:
+        calls.append(True)
+        return original()
+
+    entity_cls._probe_streaming_result = staticmethod(_probe)
+    entry = MagicMock()
+    for _ in range(3):
+        entity_cls(entry, MagicMock())
+
+    assert len(calls) == 1
+
+
+def test_device_routing_gives_each_satellite_its_own_session() -> None:
+    conversation = _load_conversation_module()
+    calls = []
+    entity, user_input = _delta_entity(
+        conversation, ["ok"], options={"session_routing": "device"}, calls=calls
+    )
+
+    asyncio.run(entity._async_handle_message(user_input, _DeltaChatLog()))
+    asyncio.run(entity._async_handle_message(user_input, _DeltaChatLog()))
+    user_input.device_id = "satellite-2"
+    asyncio.run(entity._async_handle_message(user_input, _DeltaChatLog()))
+
+    sessions = [call["session_key"] for call in calls]
+    assert sessions[0] == sessions[1]
+    assert sessions[0].startswith("main-device-")
+    assert sessions[2] != sessions[0]
+    # The turn budget is looked up for the routed session, not the base one
+    budgets = entity._gateway_client.agent_budget.call_args_list
+    assert [call.args for call in budgets] == [
+        ("hello", session) for session in sessions
+    ]
+
+
+def test_shared_session_by_default() -> None:
+    conversation = _load_conversation_module()
+    calls = []
+    entity, user_input = _delta_entity(conversation, ["ok"], calls=calls)
+
+    asyncio.run(entity._async_handle_message(user_input, _DeltaChatLog()))
+
+    assert calls[0]["session_key"] == "main"
+
+
+def test_voice_turn_stops_streaming_once_spoken_budget_is_filled() -> None:
+    conversation = _load_conversation_module()
+    calls = []
+    entity, user_input = _delta_entity(
+        conversation,
+        ["Hel", "lo the", "re, and more"],
+        options={"tts_max_chars": 5},
+        calls=calls,
+    )
+    chat_log = _DeltaChatLog()
+
+    asyncio.run(entity._async_handle_message(user_input, chat_log))
+
+    assert calls[0]["max_chars"] == 5
+    assert chat_log.deltas == [
+        {"role": "assistant"},
+        {"content": "Hel"},
+        {"content": "lo the"},
+    ]
+
+
+def test_typed_turn_has_no_spoken_budget() -> None:
+    conversation = _load_conversation_module()
+    calls = []
+    entity, user_input = _delta_entity(
+        conversation, ["ok"], options={"tts_max_chars": 5}, calls=calls
+    )
+    user_input.device_id = None
+
+    asyncio.run(entity._async_handle_message(user_input, _DeltaChatLog()))
+
+    assert calls[0]["max_chars"] is None
+
+
+def _local_intents(conversation, response):
+    handled = []
+
+    async def _handle_intents(hass, user_input):
+        handled.append(user_input.text)
+        return response
+
+    conversation.intent.IntentResponseType = type(
+        "IntentResponseType", (), {"ERROR": "error"}
+    )
+    conversation.conversation.async_handle_intents = _handle_intents
+    return handled
+
+
+def test_matched_intent_is_handled_without_the_agent() -> None:
+    conversation = _load_conversation_module()
+    response = MagicMock()
+    response.response_type = "action_done"
+    response.speech = {"plain": {"speech": "Turned off the light"}}
+    handled = _local_intents(conversation, response)
+    calls = []
+    entity, user_input = _delta_entity(
+        conversation, ["agent"], options={"local_intents": True}, calls=calls
+    )
+    entity.hass = MagicMock()
+    chat_log = _ChatLog()
+
+    result = asyncio.run(entity._async_handle_message(user_input, chat_log))
+
+    assert handled == ["hello"]
+    assert calls == []
+    assert result.response is response
+    assert [content.content for content in chat_log.contents] == [
+        "Turned off the light"
+    ]
+    assert entity._gateway_client.record_local_intent.call_args.args[0] is True
+
+
+def test_unmatched_or_failed_intent_goes_to_the_agent() -> None:
+    conversation = _load_conversation_module()
+    failed = MagicMock()
+    failed.response_type = "error"
+    for response in (None, failed):
+        _local_intents(conversation, response)
+        calls = []
+        entity, user_input = _delta_entity(
+            conversation, ["agent"], options={"local_intents": True}, calls=calls
+        )
+        entity.hass = MagicMock()
+        chat_log = _DeltaChatLog()
+
+        asyncio.run(entity._async_handle_message(user_input, chat_log))
+
+        assert len(calls) == 1
+        assert chat_log.deltas[1:] == [{"content": "agent"}]
+        assert entity._gateway_client.record_local_intent.call_args.args[0] is False
+
+
+def test_local_intents_off_by_default() -> None:
+    conversation = _load_conversation_module()
+    handled = _local_intents(conversation, None)
+    entity, user_input = _delta_entity(conversation, ["agent"])
+
+    asyncio.run(entity._async_handle_message(user_input, _DeltaChatLog()))
+
+    assert handled == []
+
+
+def _blocking_entity(conversation):
+    started = []
+    cancelled = []
+
+    async def _send(message, **kwargs):
+        started.append(message)
+        if message == "slow":
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(message)
+                raise
+        return f"reply to {message}"
+
+    client = MagicMock()
+    client.agent_budget.return_value = 30
+    client.session_key = "main"
+    client.send_agent_request = _send
+
+    entry = MagicMock()
+    entry.entry_id = "entry-1"
+    entry.data = {}
+    entry.options = {}
+    return conversation.OpenClawConversationEntity(entry, client), cancelled
+
+
+def _user_input(text: str, device_id: str):
+    user_input = MagicMock()
+    user_input.text = text
+    user_input.language = "en"
+    user_input.conversation_id = None
+    user_input.agent_id = "agent-1"
+    user_input.device_id = device_id
+    return user_input
+
+
+class _ChatLog:
+    conversation_id = None
+
+    def __init__(self) -> None:
+        self.contents = []
+
+    def async_add_assistant_content_without_tools(self, content) -> None:
+        self.contents.append(content)
+
+
+def test_new_utterance_preempts_previous_turn_from_same_device() -> None:
+    conversation = _load_conversation_module()
+    entity, cancelled = _blocking_entity(conversation)
+    old_log, new_log = _ChatLog(), _ChatLog()
+
+    async def scenario():
+        old = asyncio.create_task(
+            entity._async_handle_message(_user_input("slow", "sat-1"), old_log)
+        )
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        await entity._async_handle_message(_user_input("fast", "sat-1"), new_log)
+        return await old
+
+    old_result = asyncio.run(scenario())
+
+    assert cancelled == ["slow"]
+    assert old_result.conversation_id is None
+    assert old_log.contents == []
+    assert [content.content for content in new_log.contents] == ["reply to fast"]
+    assert entity._active_turns == {}
+
+
+def test_preempted_streaming_turn_writes_nothing_to_chat_log() -> None:
+    conversation = _load_conversation_module()
+    entity, _ = _blocking_entity(conversation)
+    release = asyncio.Event()
+
+    async def _stream(message, **kwargs):
+        yield "partial "
+        await release.wait()
+        yield "rest"
+
+    entity._gateway_client.stream_agent_request = _stream
+    old_log = _ChatLog()
+
+    async def scenario():
+        turn = entity._begin_turn(
+            conversation._Turn("sat-1", time.monotonic() + 30, "main", None)
+        )
+        stream = entity._stream_response(
+            _user_input("slow", "sat-1"), old_log, "slow", MagicMock(), turn
+        )
+        assert await anext(stream) == "partial "
+        entity._begin_turn(
+            conversation._Turn("sat-1", time.monotonic() + 30, "main", None)
+        )
+        return [chunk async for chunk in stream]
+
+    assert asyncio.run(scenario()) == []
+    assert old_log.contents == []
+
+
+def test_other_devices_are_not_preempted() -> None:
+    conversation = _load_conversation_module()
+    entity, cancelled = _blocking_entity(conversation)
+
+    async def scenario():
+        old = asyncio.create_task(
+            entity._async_handle_message(_user_input("slow", "sat-1"), _ChatLog())
+        )
+        await asyncio.sleep(0)
+        await entity._async_handle_message(_user_input("fast", "sat-2"), _ChatLog())
+        assert cancelled == []
+        assert not old.done()
+        old.cancel()
+        try:
+            await old
+        except asyncio.CancelledError:
+            pass
+
+    asyncio.run(scenario())
+
+    assert cancelled == ["slow"]
+    assert entity._active_turns == {}
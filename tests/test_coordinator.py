@@ -0,0 +1,186 @@
+"""Tests for the shared gateway state coordinator (HA-free)."""
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+from unittest.mock import AsyncMock
+
+import pytest
+
+_BASE = Path(__file__).parent.parent / "custom_components" / "openclaw"
+
+
+class _UpdateFailed(Exception):
+    pass
+
+
+class _DataUpdateCoordinator:
+    def __init__(self, hass, logger, name=None, update_interval=None):
+        self.hass = hass
+        self.name = name
+        self.update_interval = update_interval
+        self.data = None
+        self.refreshes = 0
+
+    async def async_refresh(self):
+        self.refreshes += 1
+        self.data = await self._async_update_data()
+
+    async def async_request_refresh(self):
+        await self.async_refresh()
+
+    def async_set_updated_data(self, data):
+        self.data = data
+
+
+def _load_module(name: str, path: Path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _load_coordinator_module():
+    core_mod = ModuleType("homeassistant.core")
+    core_mod.HomeAssistant = object  # type: ignore[attr-defined]
+    core_mod.callback = lambda func: func  # type: ignore[attr-defined]
+    coordinator_mod = ModuleType("homeassistant.helpers.update_coordinator")
+    coordinator_mod.DataUpdateCoordinator = _DataUpdateCoordinator  # type: ignore[attr-defined]
+    coordinator_mod.UpdateFailed = _UpdateFailed  # type: ignore[attr-defined]
+
+    saved = {
+        name: sys.modules.get(name)
+        for name in ("homeassistant.core", "homeassistant.helpers.update_coordinator")
+    }
+    sys.modules["homeassistant.core"] = core_mod
+    sys.modules["homeassistant.helpers.update_coordinator"] = coordinator_mod
+    sys.modules.setdefault("homeassistant", ModuleType("homeassistant"))
+    sys.modules.setdefault("homeassistant.helpers", ModuleType("homeassistant.helpers"))
+    sys.modules.setdefault("custom_components", ModuleType("custom_components"))
+    sys.modules.setdefault(
+        "custom_components.openclaw", ModuleType("custom_components.openclaw")
+    )
+    try:
+        _load_module("custom_components.openclaw.const", _BASE / "const.py")
+        _load_module("custom_components.openclaw.exceptions", _BASE / "exceptions.py")
+        _load_module("custom_components.openclaw.gateway", _BASE / "gateway.py")
+        _load_module("custom_components.openclaw.latency", _BASE / "latency.py")
+        _load_module("custom_components.openclaw.presence", _BASE / "presence.py")
+        _load_module("custom_components.openclaw.query_tier", _BASE / "query_tier.py")
+        _load_module("custom_components.openclaw.throughput", _BASE / "throughput.py")
+        _load_module("custom_components.openclaw.usage", _BASE / "usage.py")
+        client_mod = _load_module(
+            "custom_components.openclaw.gateway_client", _BASE / "gateway_client.py"
+        )
+        coordinator = _load_module(
+            "custom_components.openclaw.coordinator", _BASE / "coordinator.py"
+        )
+    finally:
+        for name, module in saved.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
+    return coordinator, client_mod.OpenClawGatewayClient
+
+
+_coordinator, OpenClawGatewayClient = _load_coordinator_module()
+
+
+def _client(host: str = "gw", connected: bool = True):
+    client = OpenClawGatewayClient(host, 1, None)
+    client._gateway._connected = connected
+    client.status = AsyncMock(return_value={"uptimeMs": 1000})  # type: ignore[method-assign]
+    client.health = AsyncMock(return_value={"ok": True})  # type: ignore[method-assign]
+    return client
+
+
+class _Hass:
+    def __init__(self) -> None:
+        self.data = {}
+        self.tasks = []
+
+    def async_create_task(self, coro):
+        self.tasks.append(coro)
+
+
+@pytest.mark.asyncio
+async def test_entries_on_one_gateway_share_one_cycle() -> None:
+    hass = _Hass()
+    first, second, other = _client(), _client(), _client("other-gw")
+
+    coordinator = await _coordinator.async_get_state_coordinator(hass, "a", first)
+    shared = await _coordinator.async_get_state_coordinator(hass, "b", second)
+    separate = await _coordinator.async_get_state_coordinator(hass, "c", other)
+
+    assert shared is coordinator
+    assert separate is not coordinator
+    assert coordinator.refreshes == 1
+    assert coordinator.data == {"status": {"uptimeMs": 1000}, "health": {"ok": True}}
+    first.status.assert_awaited_once()
+    second.status.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_failed_half_is_left_out_and_total_failure_raises() -> None:
+    client = _client()
+    client.health.side_effect = RuntimeError("boom")
+    coordinator = _coordinator.GatewayStateCoordinator(_Hass(), client.endpoint)
+    coordinator.attach("a", client)
+
+    assert await coordinator._async_update_data() == {"status": {"uptimeMs": 1000}}
+
+    client.status.side_effect = RuntimeError("boom")
+    with pytest.raises(_UpdateFailed):
+        await coordinator._async_update_data()
+
+
+@pytest.mark.asyncio
+async def test_fetch_uses_a_connected_entry() -> None:
+    offline, online = _client(connected=False), _client()
+    coordinator = _coordinator.GatewayStateCoordinator(_Hass(), "gw:1")
+    coordinator.attach("a", offline)
+
+    with pytest.raises(_UpdateFailed):
+        await coordinator._async_update_data()
+
+    coordinator.attach("b", online)
+    await coordinator._async_update_data()
+    online.status.assert_awaited_once()
+    offline.status.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_pushes_from_any_entry_update_shared_data() -> None:
+    hass = _Hass()
+    first, second = _client(), _client()
+    coordinator = await _coordinator.async_get_state_coordinator(hass, "a", first)
+    await _coordinator.async_get_state_coordinator(hass, "b", second)
+
+    second._handle_health_event({"payload": {"ok": False}})
+    assert coordinator.data["health"] == {"ok": False}
+    assert coordinator.data["status"] == {"uptimeMs": 1000}
+
+    first._handle_presence_event({"payload": {}, "stateVersion": 1})
+    first._handle_presence_event({"payload": {}, "stateVersion": 2})
+    assert len(hass.tasks) == 1
+    await hass.tasks.pop()
+    assert coordinator.refreshes == 2
+
+
+@pytest.mark.asyncio
+async def test_last_release_drops_coordinator_and_listeners() -> None:
+    hass = _Hass()
+    first, second = _client(), _client()
+    coordinator = await _coordinator.async_get_state_coordinator(hass, "a", first)
+    await _coordinator.async_get_state_coordinator(hass, "b", second)
+
+    _coordinator.async_release_state_coordinator(hass, "a", first.endpoint)
+    assert hass.data[_coordinator._COORDINATORS] == {first.endpoint: coordinator}
+    first._handle_health_event({"payload": {"ok": False}})
+    assert coordinator.data["health"] == {"ok": True}
+
+    _coordinator.async_release_state_coordinator(hass, "b", second.endpoint)
+    assert hass.data[_coordinator._COORDINATORS] == {}
@@ -38,6 +38,11 @@ async def test_diagnostics_redacts_token_and_includes_health() -> None:
     _load_module("custom_components.openclaw.const", base / "const.py")
     _load_module("custom_components.openclaw.exceptions", base / "exceptions.py")
     _load_module("custom_components.openclaw.gateway", base / "gateway.py")
+    _load_module("custom_components.openclaw.latency", base / "latency.py")
+    _load_module("custom_components.openclaw.presence", base / "presence.py")
+    _load_module("custom_components.openclaw.query_tier", base / "query_tier.py")
+    _load_module("custom_components.openclaw.throughput", base / "throughput.py")
+    _load_module("custom_components.openclaw.usage", base / "usage.py")
     _load_module("custom_components.openclaw.gateway_client", base / "gateway_client.py")
     diagnostics = _load_module("custom_components.openclaw.diagnostics", base / "diagnostics.py")
 
@@ -49,6 +54,8 @@ async def test_diagnostics_redacts_token_and_includes_health() -> None:
     client = AsyncMock()
     client.connected = True
     client.health = AsyncMock(return_value={"status": "ok"})
+    client.status = AsyncMock(return_value={"sessions": [{"sessionKey": "main"}]})
+    client.presence = MagicMock(count=1, clients={"ha": {"id": "ha"}})
 
     hass = MagicMock()
     hass.data = {"openclaw": {"entry-1": client}}
@@ -59,3 +66,5 @@ async def test_diagnostics_redacts_token_and_includes_health() -> None:
     assert result["options"]["token"] == "REDACTED"
     assert result["connected"] is True
     assert result["health"] == {"status": "ok"}
+    assert result["status"] == {"sessions": [{"sessionKey": "main"}]}
+    assert result["presence"] == {"count": 1, "clients": {"ha": {"id": "ha"}}}
@@ -462,3 +462,108 @@ class TestChallengeHandshake:
         """Without a token, URI has no query params."""
         protocol = GatewayProtocol("localhost", 18789, None)
         assert protocol._uri == "ws://localhost:18789"
+
+
+class TestConnectionListeners:
+    def test_transitions_are_published_once(self) -> None:
+        protocol = GatewayProtocol("localhost", 1, None)
+        changes = []
+        protocol.add_connection_listener(changes.append)
+
+        protocol._set_connected(False)
+        protocol._set_connected(True)
+        protocol._set_connected(True)
+        protocol._set_connected(False)
+
+        assert changes == [True, False]
+        assert not protocol._connected_event.is_set()
+
+    @pytest.mark.asyncio
+    async def test_disconnect_publishes_and_failing_listener_is_isolated(
+        self,
+    ) -> None:
+        protocol = GatewayProtocol("localhost", 1, None)
+        changes = []
+
+        def _broken(_connected):
+            raise RuntimeError("boom")
+
+        protocol.add_connection_listener(_broken)
+        remove = protocol.add_connection_listener(changes.append)
+        protocol._set_connected(True)
+        await protocol.disconnect()
+        remove()
+        protocol._set_connected(True)
+
+        assert changes == [True, False]
+        assert protocol.connected is True
+
+
+class _ClosingWebSocket:
+    """Delivers its messages, then ends as if closed with a code."""
+
+    def __init__(self, messages, close_code):
+        self._messages = list(messages)
+        self.close_code = close_code
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._messages:
+            raise StopAsyncIteration
+        return self._messages.pop(0)
+
+
+class _Connect:
+    def __init__(self, websocket):
+        self._websocket = websocket
+
+    async def __aenter__(self):
+        return self._websocket
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class TestConnectionStats:
+    @pytest.mark.asyncio
+    async def test_sessions_reconnects_and_close_reasons(self, monkeypatch) -> None:
+        sockets = [
+            _ClosingWebSocket(['{"type": "pong"}'], 1012),
+            _ClosingWebSocket([], None),
+        ]
+
+        def fake_connect(*_args, **_kwargs):
+            if not sockets:
+                raise asyncio.CancelledError
+            return _Connect(sockets.pop(0))
+
+        monkeypatch.setattr(_gateway, "connect", fake_connect)
+        protocol = GatewayProtocol("localhost", 1, None)
+        protocol._handshake = AsyncMock()  # type: ignore[method-assign]
+
+        await protocol._connection_loop()
+
+        stats = protocol.connection_stats
+        assert stats["connect_attempts"] == 3
+        assert stats["connects"] == 2
+        assert stats["connect_failures"] == 1
+        assert stats["reconnects"] == 1
+        assert stats["short_sessions"] == 2
+        assert stats["close_reasons"] == {"restart": 1, "dropped": 1}
+        assert stats["last_close_reason"] == "dropped"
+        assert stats["session_seconds"] is None
+        assert stats["messages_received"] == 1
+        assert stats["bytes_received"] == len('{"type": "pong"}')
+
+    @pytest.mark.asyncio
+    async def test_sent_requests_are_counted(self) -> None:
+        protocol = GatewayProtocol("localhost", 1, None)
+        protocol._websocket = AsyncMock()
+
+        await protocol._send_pong()
+
+        stats = protocol.connection_stats
+        assert stats["messages_sent"] == 1
+        assert stats["bytes_sent"] == len(json.dumps({"type": "pong"}))
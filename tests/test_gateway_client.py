@@ -26,6 +26,11 @@ sys.modules.setdefault("custom_components.openclaw", ModuleType("custom_componen
 _const = _load_module("custom_components.openclaw.const", _BASE / "const.py")
 _exceptions = _load_module("custom_components.openclaw.exceptions", _BASE / "exceptions.py")
 _gateway = _load_module("custom_components.openclaw.gateway", _BASE / "gateway.py")
+_latency = _load_module("custom_components.openclaw.latency", _BASE / "latency.py")
+_load_module("custom_components.openclaw.presence", _BASE / "presence.py")
+_load_module("custom_components.openclaw.query_tier", _BASE / "query_tier.py")
+_load_module("custom_components.openclaw.throughput", _BASE / "throughput.py")
+_load_module("custom_components.openclaw.usage", _BASE / "usage.py")
 _gateway_client = _load_module(
     "custom_components.openclaw.gateway_client", _BASE / "gateway_client.py"
 )
@@ -34,6 +39,7 @@ AgentExecutionError = _exceptions.AgentExecutionError
 DevicePairingRequiredError = _exceptions.DevicePairingRequiredError
 GatewayAuthenticationError = _exceptions.GatewayAuthenticationError
 GatewayConnectionError = _exceptions.GatewayConnectionError
+GatewayStalledError = _exceptions.GatewayStalledError
 GatewayTimeoutError = _exceptions.GatewayTimeoutError
 ProtocolError = _exceptions.ProtocolError
 AgentRun = _gateway_client.AgentRun
@@ -47,6 +53,64 @@ class TestAgentRun:
         run.add_output("Hello world")
         assert run.get_response() == "Hello world"
 
+    def test_text_cap_truncates_with_merge_policy(self) -> None:
+        run = AgentRun("run-1", max_text_chars=5)
+        run.add_output("Hello")
+        run.add_output("Hello world")
+        run.set_complete("ok")
+        assert run.get_response() == "Hello"
+        assert run.truncated is True
+        assert run.status == "ok"
+
+    def test_text_cap_fails_run_with_fail_policy(self) -> None:
+        run = AgentRun("run-1", max_text_chars=5, overflow_policy="fail")
+        run.add_output("Hello world")
+        run.set_complete("ok")
+        assert run.overflowed is True
+        assert run.status == "error"
+
+    @pytest.mark.asyncio
+    async def test_backlog_merged_for_slow_consumer(self) -> None:
+        run = AgentRun("run-1", stream=True, max_queued_chars=4)
+        run.add_output("ab")
+        run.add_output("abcd")
+        run.add_output("abcdef")
+        run.set_complete("ok")
+
+        assert run.buffer_usage["queued_chars"] == 4
+        chunks = [chunk async for chunk in run.iter_stream(1)]
+
+        # The consumer skips ahead to the newest text within the cap
+        assert chunks == ["cdef"]
+        assert run.get_response() == "abcdef"
+        assert run.buffer_usage["peak_queued_chars"] == 6
+        assert run.buffer_usage["queued_chars"] == 0
+
+    def test_backlog_stays_bounded_for_non_cumulative_updates(self) -> None:
+        run = AgentRun(
+            "run-1", stream=True, max_text_chars=100, max_queued_chars=10
+        )
+        for index in range(1000):
+            run.add_output(str(index % 10) * 90)
+
+        assert run.buffer_usage["queued_chars"] <= 10
+        assert run.buffer_usage["peak_queued_chars"] == 90
+
+    @pytest.mark.asyncio
+    async def test_backlog_fails_run_with_fail_policy(self) -> None:
+        run = AgentRun(
+            "run-1", stream=True, max_queued_chars=4, overflow_policy="fail"
+        )
+        run.add_output("abc")
+        run.add_output("abcdef")
+        run.add_output("abcdefgh")
+
+        chunks = [chunk async for chunk in run.iter_stream(1)]
+
+        assert chunks == ["abc", "def"]
+        assert run.status == "error"
+        assert run.buffer_usage["text_chars"] == 6
+
 
 class TestHandleAgentEvent:
     def test_buffers_output_from_data_text(self) -> None:
@@ -109,6 +173,33 @@ class TestSendAgentRequest:
 
         assert client._agent_runs == {}
 
+    @pytest.mark.asyncio
+    async def test_buffer_pressure_is_recorded_in_stats(self) -> None:
+        client = OpenClawGatewayClient(
+            "localhost", 1, None, max_response_chars=5
+        )
+        client._gateway.send_request = AsyncMock(  # type: ignore[attr-defined]
+            return_value={"payload": {"runId": "run-1"}}
+        )
+
+        task = asyncio.create_task(client.send_agent_request("hello"))
+        for _ in range(5):
+            await asyncio.sleep(0)
+        client._handle_agent_event(
+            {"payload": {"runId": "run-1", "output": "Hello world"}}
+        )
+        client._handle_agent_event(
+            {"payload": {"runId": "run-1", "status": "ok"}}
+        )
+
+        assert await task == "Hello"
+        stats = client.stats
+        assert stats["peak_response_chars"] == 5
+        assert stats["peak_queued_chars"] == 0
+        assert stats["buffer_overflows"] == 1
+        assert stats["truncated_runs"] == 1
+        assert stats["overflowed_runs"] == 0
+
     @pytest.mark.asyncio
     async def test_timeout_raises_and_cleans_up(self) -> None:
         client = OpenClawGatewayClient("localhost", 1, None, timeout=0)
@@ -222,6 +313,9 @@ class TestStreamAgentRequest:
                 break
             await asyncio.sleep(0)
         assert "run-1" in client._agent_runs
+        # Let the stream pick up its acked run and wait for events
+        for _ in range(5):
+            await asyncio.sleep(0)
 
         client._handle_agent_event(
             {"payload": {"runId": "run-1", "output": "Hi"}}
@@ -321,25 +415,1251 @@ class TestConnectSnapshot:
 
 
 class TestPresence:
-    def test_passthrough_property(self) -> None:
+    def test_seeded_from_handshake_snapshot_on_connect(self) -> None:
         client = OpenClawGatewayClient("localhost", 1, None)
         client._gateway._presence = {"clients": ["a", "b"]}
-        assert client.presence == {"clients": ["a", "b"]}
+        assert client.presence.count is None
 
-    def test_event_updates_state(self) -> None:
+        client._gateway._set_connected(True)
+
+        assert dict(client.presence.clients) == {"a": "a", "b": "b"}
+
+    def test_event_updates_state_and_publishes_change_set(self) -> None:
         client = OpenClawGatewayClient("localhost", 1, None)
-        assert client.presence == {}
+        pushes = []
+        client.add_state_listener(lambda kind, change: pushes.append((kind, change)))
 
-        client._handle_presence_event(
-            {"payload": {"clients": ["ha-client"]}}
-        )
+        client._handle_presence_event({"payload": {"clients": ["ha-client"]}})
+        client._handle_presence_event({"payload": {"clients": ["ha-client"]}})
+        client._handle_presence_event({"payload": {"left": ["ha-client"]}})
 
-        assert client.presence == {"clients": ["ha-client"]}
+        assert client.presence.count == 0
+        assert pushes == [
+            ("presence", {"joined": ["ha-client"], "left": [], "updated": []}),
+            ("presence", {"joined": [], "left": ["ha-client"], "updated": []}),
+        ]
 
     def test_event_with_empty_payload_ignored(self) -> None:
         client = OpenClawGatewayClient("localhost", 1, None)
-        client._gateway._presence = {"clients": ["existing"]}
+        client._handle_presence_event({"payload": ["existing"]})
 
         client._handle_presence_event({"payload": {}})
 
-        assert client.presence == {"clients": ["existing"]}
+        assert list(client.presence.clients) == ["existing"]
+
+
+class TestRequestCoalescing:
+    async def _wait_for_run(self, client, run_id: str = "run-1") -> None:
+        for _ in range(50):
+            if run_id in client._agent_runs:
+                break
+            await asyncio.sleep(0)
+        assert run_id in client._agent_runs
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_share_one_run(self) -> None:
+        client = OpenClawGatewayClient("localhost", 1, None)
+        client._gateway.send_request = AsyncMock(  # type: ignore[attr-defined]
+            return_value={"payload": {"runId": "run-1"}}
+        )
+
+        first = asyncio.create_task(client.send_agent_request("Hello there"))
+        second = asyncio.create_task(client.send_agent_request("hello  there"))
+        await self._wait_for_run(client)
+
+        client._handle_agent_event(
+            {"payload": {"runId": "run-1", "output": "Hi"}}
+        )
+        client._handle_agent_event(
+            {"payload": {"runId": "run-1", "status": "ok"}}
+        )
+
+        assert await first == "Hi"
+        assert await second == "Hi"
+        client._gateway.send_request.assert_called_once()  # type: ignore[attr-defined]
+        assert client.stats["coalesced_requests"] == 1
+        assert client._agent_runs == {}
+        assert client._inflight_requests == {}
+
+    @pytest.mark.asyncio
+    async def test_late_stream_subscriber_receives_full_text(self) -> None:
+        client = OpenClawGatewayClient("localhost", 1, None)
+        client._gateway.send_request = AsyncMock(  # type: ignore[attr-defined]
+            return_value={"payload": {"runId": "run-1"}}
+        )
+
+        first = asyncio.create_task(client.send_agent_request("hello"))
+        await self._wait_for_run(client)
+        client._handle_agent_event(
+            {"payload": {"runId": "run-1", "output": "Hi"}}
+        )
+
+        chunks: list[str] = []
+
+        async def consume():
+            async for chunk in client.stream_agent_request("hello"):
+                chunks.append(chunk)
+
+        second = asyncio.create_task(consume())
+        await asyncio.sleep(0)
+        client._handle_agent_event(
+            {"payload": {"runId": "run-1", "output": "Hi there"}}
+        )
+        client._handle_agent_event(
+            {"payload": {"runId": "run-1", "status": "ok"}}
+        )
+
+        assert await first == "Hi there"
+        await second
+        assert "".join(chunks) == "Hi there"
+        client._gateway.send_request.assert_called_once()  # type: ignore[attr-defined]
+
+    @pytest.mark.asyncio
+    async def test_different_messages_not_coalesced(self) -> None:
+        client = OpenClawGatewayClient("localhost", 1, None)
+        client._gateway.send_request = AsyncMock(  # type: ignore[attr-defined]
+            side_effect=[
+                {"payload": {"runId": "run-1"}},
+                {"payload": {"runId": "run-2"}},
+            ]
+        )
+
+        first = asyncio.create_task(client.send_agent_request("one"))
+        second = asyncio.create_task(client.send_agent_request("two"))
+        await self._wait_for_run(client, "run-1")
+        await self._wait_for_run(client, "run-2")
+
+        for run_id in ("run-1", "run-2"):
+            client._handle_agent_event(
+                {"payload": {"runId": run_id, "status": "ok", "summary": run_id}}
+            )
+
+        assert await first == "run-1"
+        assert await second == "run-2"
+        assert client.stats["coalesced_requests"] == 0
+
+    @pytest.mark.asyncio
+    async def test_zero_window_disables_coalescing(self) -> None:
+        client = OpenClawGatewayClient("localhost", 1, None, coalesce_window=0)
+        client._gateway.send_request = AsyncMock(  # type: ignore[attr-defined]
+            side_effect=[
+                {"payload": {"runId": "run-1"}},
+                {"payload": {"runId": "run-2"}},
+            ]
+        )
+
+        first = asyncio.create_task(client.send_agent_request("hello"))
+        second = asyncio.create_task(client.send_agent_request("hello"))
+        await self._wait_for_run(client, "run-1")
+        await self._wait_for_run(client, "run-2")
+
+        for run_id in ("run-1", "run-2"):
+            client._handle_agent_event(
+                {"payload": {"runId": run_id, "status": "ok", "summary": "ok"}}
+            )
+
+        await asyncio.gather(first, second)
+        assert client._gateway.send_request.call_count == 2  # type: ignore[attr-defined]
+
+    @pytest.mark.asyncio
+    async def test_ack_failure_propagates_to_attached_callers(self) -> None:
+        client = OpenClawGatewayClient("localhost", 1, None)
+        ack = asyncio.get_running_loop().create_future()
+
+        async def fake_send_request(**_kwargs):
+            return await ack
+
+        client._gateway.send_request = fake_send_request  # type: ignore[attr-defined]
+
+        first = asyncio.create_task(client.send_agent_request("hello"))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(client.send_agent_request("hello"))
+        await asyncio.sleep(0)
+        ack.set_exception(GatewayConnectionError("Not connected to Gateway"))
+
+        with pytest.raises(GatewayConnectionError):
+            await first
+        with pytest.raises(GatewayConnectionError):
+            await second
+        assert client._inflight_requests == {}
+
+
+class TestResponseCache:
+    async def _complete(self, client, text: str, run_id: str = "run-1") -> None:
+        for _ in range(50):
+            if run_id in client._agent_runs:
+                break
+            await asyncio.sleep(0)
+        client._handle_agent_event(
+            {"payload": {"runId": run_id, "output": text}}
+        )
+        client._handle_agent_event({"payload": {"runId": run_id, "status": "ok"}})
+
+    async def _send(self, client, message: str, **kwargs) -> str:
+        task = asyncio.create_task(client.send_agent_request(message, **kwargs))
+        await asyncio.sleep(0)
+        if not task.done():
+            await self._complete(client, "Sunny")
+        return await task
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self) -> None:
+        client = OpenClawGatewayClient("localhost", 1, None)
+        client._gateway.send_request = AsyncMock(  # type: ignore[attr-defined]
+            return_value={"payload": {"runId": "run-1"}}
+        )
+
+        assert await self._send(client, "weather?") == "Sunny"
+        assert await self._send(client, "weather?") == "Sunny"
+
+        assert client._gateway.send_request.call_count == 2  # type: ignore[attr-defined]
+        assert client.stats["cache_hits"] == 0
+        assert client.stats["cache_misses"] == 0
+
+    @pytest.mark.asyncio
+    async def test_hit_skips_gateway(self) -> None:
+        client = OpenClawGatewayClient("localhost", 1, None, cache_ttl=60)
+        client._gateway.send_request = AsyncMock(  # type: ignore[attr-defined]
+            return_value={"payload": {"runId": "run-1"}}
+        )
+
+        assert await self._send(client, "Weather?") == "Sunny"
+        assert await self._send(client, "weather?") == "Sunny"
+
+        client._gateway.send_request.assert_called_once()  # type: ignore[attr-defined]
+        assert client.stats["cache_hits"] == 1
+        assert client.stats["cache_misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stream_hit_yields_cached_text(self) -> None:
+        client = OpenClawGatewayClient("localhost", 1, None, cache_ttl=60)
+        client._gateway.send_request = AsyncMock(  # type: ignore[attr-defined]
+            return_value={"payload": {"runId": "run-1"}}
+        )
+        await self._send(client, "weather?")
+
+        chunks = [chunk async for chunk in client.stream_agent_request("weather?")]
+
+        assert chunks == ["Sunny"]
+        client._gateway.send_request.assert_called_once()  # type: ignore[attr-defined]
+
+    @pytest.mark.asyncio
+    async def test_bypass_per_call(self) -> None:
+        client = OpenClawGatewayClient("localhost", 1, None, cache_ttl=60)
+        client._gateway.send_request = AsyncMock(  # type: ignore[attr-defined]
+            return_value={"payload": {"runId": "run-1"}}
+        )
+
+        await self._send(client, "weather?")
+        await self._send(client, "weather?", use_cache=False)
+
+        assert client._gateway.send_request.call_count == 2  # type: ignore[attr-defined]
+        assert client.stats["cache_hits"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cleared_on_session_change(self) -> None:
+        client = OpenClawGatewayClient("localhost", 1, None, cache_ttl=60)
+        client._gateway.send_request = AsyncMock(  # type: ignore[attr-defined]
+            return_value={"payload": {"runId": "run-1"}}
+        )
+
+        await self._send(client, "weather?")
+        client.set_session_key("other")
+        client.set_session_key("main")
+        await self._send(client, "weather?")
+
+        assert client._gateway.send_request.call_count == 2  # type: ignore[attr-defined]
+
+    def test_lru_eviction_and_ttl(self, monkeypatch) -> None:
+        now = [100.0]
+        monkeypatch.setattr(
+            _gateway_client.time, "monotonic", lambda: now[0]
+        )
+        cache = _gateway_client._ResponseCache(ttl=10, max_entries=2)
+
+        cache.put(("a",), "A")
+        cache.put(("b",), "B")
+        assert cache.get(("a",)) == "A"
+        cache.put(("c",), "C")
+
+        assert cache.get(("b",)) is None
+        assert cache.get(("a",)) == "A"
+
+        now[0] += 11
+        assert cache.get(("c",)) is None
+        assert len(cache) == 1
+
+
+class TestOrphanEventBuffer:
+    @pytest.mark.asyncio
+    async def test_events_before_ack_are_replayed(self) -> None:
+        client = OpenClawGatewayClient("localhost", 1, None)
+
+        async def fake_send_request(**_kwargs):
+            # Gateway finishes the run before the ack is processed
+            client._handle_agent_event(
+                {"payload": {"runId": "run-1", "output": "Fast"}}
+            )
+            client._handle_agent_event(
+                {"payload": {"runId": "run-1", "status": "ok"}}
+            )
+            # Another client's run, dropped once no ack is outstanding
+            client._handle_agent_event(
+                {"payload": {"runId": "other", "output": "Elsewhere"}}
+            )
+            return {"payload": {"runId": "run-1"}}
+
+        client._gateway.send_request = fake_send_request  # type: ignore[attr-defined]
+
+        result = await asyncio.wait_for(
+            client.send_agent_request("hello"), timeout=1
+        )
+
+        assert result == "Fast"
+        assert client._orphan_events == {}
+        assert client.stats["early_event_runs"] == 1
+        assert client.stats["orphan_events_buffered"] == 3
+        assert client.stats["orphan_events_replayed"] == 2
+        assert client.stats["orphan_events_dropped"] == 1
+
+    def test_expired_events_are_dropped(self, monkeypatch) -> None:
+        now = [100.0]
+        monkeypatch.setattr(
+            _gateway_client.time, "monotonic", lambda: now[0]
+        )
+        client = OpenClawGatewayClient("localhost", 1, None)
+        client._pending_acks = 1
+
+        client._handle_agent_event(
+            {"payload": {"runId": "stale", "output": "old"}}
+        )
+        now[0] += _const.ORPHAN_EVENT_TTL + 1
+        client._handle_agent_event(
+            {"payload": {"runId": "fresh", "output": "new"}}
+        )
+
+        assert list(client._orphan_events) == ["fresh"]
+        assert client.stats["orphan_events_dropped"] == 1
+
+    def test_buffer_is_bounded(self) -> None:
+        client = OpenClawGatewayClient("localhost", 1, None)
+        client._pending_acks = 1
+
+        for index in range(_const.ORPHAN_EVENT_MAX_RUNS + 1):
+            client._handle_agent_event(
+                {"payload": {"runId": f"run-{index}", "output": "x"}}
+            )
+
+        assert len(client._orphan_events) == _const.ORPHAN_EVENT_MAX_RUNS
+        assert "run-0" not in client._orphan_events
+        assert client.stats["orphan_events_dropped"] == 1
+
+    def test_events_for_a_run_fold_into_one_payload(self) -> None:
+        client = OpenClawGatewayClient("localhost", 1, None)
+        client._pending_acks = 1
+        usage = {"inputTokens": 3, "outputTokens": 5}
+
+        for index in range(1, 500):
+            client._handle_agent_event(
+                {"payload": {"runId": "run-1", "output": "x" * index}}
+            )
+        client._handle_agent_event(
+            {"payload": {"runId": "run-1", "status": "ok", "usage": usage}}
+        )
+        client._handle_agent_event(
+            {"payload": {"runId": "run-1", "data": {"phase": "end"}}}
+        )
+
+        assert client._orphan_events["run-1"].payload == {
+            "runId": "run-1",
+            "output": "x" * 499,
+            "status": "ok",
+            "usage": usage,
+            "data": {"phase": "end"},
+        }
+        assert client.stats["orphan_events_buffered"] == 501
+
+    def test_events_are_only_held_while_an_ack_is_pending(self) -> None:
+        client = OpenClawGatewayClient("localhost", 1, None)
+
+        client._handle_agent_event(
+            {"payload": {"runId": "other", "output": "not ours"}}
+        )
+        assert client._orphan_events == {}
+
+        client._pending_acks = 1
+        client._handle_agent_event(
+            {"payload": {"runId": "other", "output": "maybe ours"}}
+        )
+        assert list(client._orphan_events) == ["other"]
+
+
+class TestAbortAgentRun:
+    async def _drain(self) -> None:
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+    def _abort_calls(self, client) -> list:
+        return [
+            call
+            for call in client._gateway.send_request.call_args_list  # type: ignore[attr-defined]
+            if call.kwargs["method"] == _const.AGENT_ABORT_METHOD
+        ]
+
+    @pytest.mark.asyncio
+    async def test_timeout_aborts_run(self) -> None:
+        client = OpenClawGatewayClient("localhost", 1, None, session_key="voice")
+        client._timeout = 0.01
+        client._gateway.send_request = AsyncMock(  # type: ignore[attr-defined]
+            return_value={"payload": {"runId": "run-1"}}
+        )
+
+        with pytest.raises(GatewayTimeoutError):
+            await client.send_agent_request("hello")
+        await self._drain()
+
+        calls = self._abort_calls(client)
+        assert len(calls) == 1
+        assert calls[0].kwargs["params"] == {"sessionKey": "voice", "runId": "run-1"}
+        assert client.stats["aborts_requested"] == 1
+        assert client.stats["aborts_succeeded"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancel_aborts_run(self) -> None:
+        client = OpenClawGatewayClient("localhost", 1, None)
+        client._gateway.send_request = AsyncMock(  # type: ignore[attr-defined]
+            return_value={"payload": {"runId": "run-1"}}
+        )
+
+        task = asyncio.create_task(client.send_agent_request("hello"))
+        await self._drain()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await self._drain()
+
+        assert len(self._abort_calls(client)) == 1
+
+    def _gated_client(self, **kwargs):
+        client = OpenClawGatewayClient("localhost", 1, None, **kwargs)
+        ack = asyncio.get_running_loop().create_future()
+
+        async def send_request(method, params=None, timeout=None):
+            if method == "agent":
+                return await ack
+            return {}
+
+        client._gateway.send_request = AsyncMock(  # type: ignore[attr-defined]
+            side_effect=send_request
+        )
+        return client, ack
+
+    @pytest.mark.asyncio
+    async def test_cancel_before_ack_aborts_run_once_acked(self) -> None:
+        client, ack = self._gated_client(coalesce_window=0)
+
+        task = asyncio.create_task(client.send_agent_request("hello"))
+        await self._drain()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert self._abort_calls(client) == []
+
+        ack.set_result({"payload": {"runId": "run-1"}})
+        await self._drain()
+
+        calls = self._abort_calls(client)
+        assert [call.kwargs["params"]["runId"] for call in calls] == ["run-1"]
+        assert client._agent_runs == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_owner_hands_run_to_coalesced_caller(self) -> None:
+        client, ack = self._gated_client()
+
+        owner = asyncio.create_task(client.send_agent_request("hello"))
+        await self._drain()
+        joiner = asyncio.create_task(client.send_agent_request("hello"))
+        await self._drain()
+        owner.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await owner
+
+        ack.set_result({"payload": {"runId": "run-1"}})
+        await self._drain()
+        client._handle_agent_event(
+            {"payload": {"runId": "run-1", "status": "ok", "summary": "Hi"}}
+        )
+
+        assert await joiner == "Hi"
+        assert self._abort_calls(client) == []
+        assert client._inflight_requests == {}
+
+    @pytest.mark.asyncio
+    async def test_abandoned_stream_aborts_run(self) -> None:
+        client = OpenClawGatewayClient("localhost", 1, None)
+        client._gateway.send_request = AsyncMock(  # type: ignore[attr-defined]
+            return_value={"payload": {"runId": "run-1"}}
+        )
+
+        stream = client.stream_agent_request("hello")
+        next_chunk = asyncio.create_task(stream.__anext__())
+        await self._drain()
+        client._handle_agent_event(
+            {"payload": {"runId": "run-1", "output": "Hi"}}
+        )
+        assert await next_chunk == "Hi"
+        await stream.aclose()
+        await self._drain()
+
+        assert len(self._abort_calls(client)) == 1
+        assert client._agent_runs == {}
+
+    @pytest.mark.asyncio
+    async def test_completed_run_not_aborted(self) -> None:
+        client = OpenClawGatewayClient("localhost", 1, None)
+        client._gateway.send_request = AsyncMock(  # type: ignore[attr-defined]
+            return_value={"payload": {"runId": "run-1"}}
+        )
+
+        task = asyncio.create_task(client.send_agent_request("hello"))
+        await self._drain()
+        client._handle_agent_event(
+            {"payload": {"runId": "run-1", "status": "ok", "summary": "Hi"}}
+        )
+        await task
+        await self._drain()
+
+        assert self._abort_calls(client) == []
+
+    @pytest.mark.asyncio
+    async def test_abort_failure_is_recorded(self) -> None:
+        client = OpenClawGatewayClient("localhost", 1, None)
+        client._gateway.send_request = AsyncMock(  # type: ignore[attr-defined]
+            side_effect=GatewayConnectionError("Not connected to Gateway")
+        )
+
+        assert await client.abort_agent_run("run-1") is False
+        assert client.stats["aborts_failed"] == 1
+
+
+class TestRequestCounters:
+    @pytest.mark.asyncio
+    async def test_completed_and_failed_requests_are_counted(self) -> None:
+        client = OpenClawGatewayClient("localhost", 1, None, cache_ttl=60)
+        client._gateway.send_request = AsyncMock(  # type: ignore[attr-defined]
+            side_effect=GatewayAuthenticationError("Request failed: missing scope")
+        )
+        with pytest.raises(AgentExecutionError):
+            await client.send_agent_request("hello")
+
+        client._gateway.send_request = AsyncMock(  # type: ignore[attr-defined]
+            return_value={"payload": {"runId": "run-1"}}
+        )
+        task = asyncio.create_task(client.send_agent_request("hello"))
+        for _ in range(5):
+            await asyncio.sleep(0)
+        client._handle_agent_event(
+            {"payload": {"runId": "run-1", "status": "ok", "summary": "Hi"}}
+        )
+        await task
+        # Served from the cache, still a completed request
+        await client.send_agent_request("hello")
+
+        today = client.request_stats["today"]
+        assert today["requests"] == 3
+        assert today["completed"] == 2
+        assert today["auth_failures"] == 1
+        assert client.request_stats["errors_today"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stream_closed_after_output_counts_as_completed(self) -> None:
+        client = OpenClawGatewayClient("localhost", 1, None)
+        client._gateway.send_request = AsyncMock(  # type: ignore[attr-defined]
+            return_value={"payload": {"runId": "run-1"}}
+        )
+
+        stream = client.stream_agent_request("hello")
+        first = asyncio.ensure_future(anext(stream))
+        for _ in range(5):
+            await asyncio.sleep(0)
+        client._handle_agent_event(
+            {"payload": {"runId": "run-1", "data": {"text": "Hi"}}}
+        )
+        assert await first == "Hi"
+        await stream.aclose()
+
+        today = client.request_stats["today"]
+        assert today["requests"] == 1
+        assert today["completed"] == 1
+        assert client.request_stats["errors_today"] == 0
+
+
+class TestUsage:
+    @pytest.mark.asyncio
+    async def test_latest_usage_recorded_once_at_completion(self) -> None:
+        client = OpenClawGatewayClient("localhost", 1, None, model="full")
+        client._gateway.send_request = AsyncMock(  # type: ignore[attr-defined]
+            return_value={"payload": {"runId": "run-1"}}
+        )
+
+        task = asyncio.create_task(client.send_agent_request("hello"))
+        for _ in range(5):
+            await asyncio.sleep(0)
+        client._handle_agent_event(
+            {"payload": {"runId": "run-1", "usage": {"outputTokens": 5}}}
+        )
+        assert client.usage_stats["today"]["runs"] == 0
+        client._handle_agent_event(
+            {
+                "payload": {
+                    "runId": "run-1",
+                    "status": "ok",
+                    "summary": "Hi",
+                    "model": "anthropic/sonnet",
+                    "usage": {"inputTokens": 20, "outputTokens": 8},
+                }
+            }
+        )
+        await task
+        client._handle_agent_event({"payload": {"runId": "run-1", "status": "ok"}})
+
+        stats = client.usage_stats
+        assert stats["today"]["total_tokens"] == 28
+        assert stats["today"]["runs"] == 1
+        assert list(stats["groups"]) == ["main|anthropic/sonnet"]
+
+
+class TestAdaptiveTimeouts:
+    def _client(self, **kwargs):
+        return OpenClawGatewayClient(
+            "localhost", 1, None, timeout=30, adaptive_timeouts=True, **kwargs
+        )
+
+    def _train(self, client, metric: str, seconds: float, count: int = 10) -> None:
+        for _ in range(count):
+            client._latency.record(client._latency_target(), metric, seconds)
+
+    def test_static_deadlines_until_enough_samples(self) -> None:
+        client = self._client()
+        assert client._agent_deadlines() == (
+            _const.AGENT_ACK_TIMEOUT,
+            30,
+            _const.DEFAULT_STALL_TIMEOUT,
+        )
+
+    def test_quick_target_gets_tighter_deadlines_above_a_floor(self) -> None:
+        client = self._client()
+        self._train(client, _latency.METRIC_ACK, 0.1)
+        self._train(client, _latency.METRIC_TOTAL, 2.0)
+        self._train(client, _latency.METRIC_GAP, 0.5)
+
+        ack, timeout, stall = client._agent_deadlines()
+
+        assert ack == _const.ADAPTIVE_ACK_MIN_TIMEOUT
+        assert timeout == 30 * _const.ADAPTIVE_MIN_FRACTION
+        assert stall == (
+            _const.DEFAULT_STALL_TIMEOUT * _const.ADAPTIVE_MIN_FRACTION
+        )
+
+    def test_learned_deadline_between_floor_and_configured(self) -> None:
+        client = self._client()
+        self._train(client, _latency.METRIC_TOTAL, 20.0)
+
+        assert 20.0 <= client._agent_deadlines()[1] < 30
+
+    def test_slow_target_is_capped_at_configured_timeout(self) -> None:
+        client = self._client(thinking="high")
+        self._train(client, _latency.METRIC_TOTAL, 45.0)
+        self._train(client, _latency.METRIC_GAP, 40.0)
+
+        _, timeout, stall = client._agent_deadlines()
+
+        assert timeout == 30
+        assert stall == _const.DEFAULT_STALL_TIMEOUT
+
+    @pytest.mark.asyncio
+    async def test_slow_request_after_fast_ones_is_not_cut_short_by_default(
+        self,
+    ) -> None:
+        client = OpenClawGatewayClient(
+            "localhost", 1, None, timeout=1, stall_timeout=0.3
+        )
+        self._train(client, _latency.METRIC_TOTAL, 0.01)
+        self._train(client, _latency.METRIC_GAP, 0.001)
+        client._gateway.send_request = AsyncMock(  # type: ignore[attr-defined]
+            return_value={"payload": {"runId": "run-1"}}
+        )
+
+        task = asyncio.create_task(client.send_agent_request("think hard"))
+        await asyncio.sleep(0.2)
+        client._handle_agent_event(
+            {"payload": {"runId": "run-1", "status": "ok", "summary": "Done"}}
+        )
+
+        assert await task == "Done"
+
+    def test_deadlines_follow_the_request_target(self) -> None:
+        client = self._client()
+        routed = client._agent_target("hello", "kitchen", None)
+        for _ in range(10):
+            client._latency.record(
+                client._latency_target(routed), _latency.METRIC_TOTAL, 2.0
+            )
+
+        assert "kitchen" in client._latency_target(routed)
+        assert client._agent_deadlines(routed)[1] == 15
+        assert client._agent_deadlines()[1] == 30
+
+    @pytest.mark.asyncio
+    async def test_routed_session_learns_under_the_active_session_too(
+        self,
+    ) -> None:
+        client = OpenClawGatewayClient("localhost", 1, None, timeout=30)
+        client._gateway.send_request = AsyncMock(  # type: ignore[attr-defined]
+            return_value={"payload": {"runId": "run-1"}}
+        )
+
+        task = asyncio.create_task(
+            client.send_agent_request("hello", session_key="main-conv-1")
+        )
+        for _ in range(5):
+            await asyncio.sleep(0)
+        client._handle_agent_event(
+            {"payload": {"runId": "run-1", "status": "ok", "summary": "Hi"}}
+        )
+        await task
+
+        assert set(client.latency_stats) == {"main-conv-1||", "main||"}
+
+    def test_new_routed_session_falls_back_to_shared_deadlines(self) -> None:
+        client = self._client()
+        self._train(client, _latency.METRIC_TOTAL, 2.0)
+        routed = client._agent_target("hello", "main-conv-2", None)
+
+        assert client._agent_deadlines(routed) == client._agent_deadlines()
+
+    def test_disabled_uses_static_deadlines(self) -> None:
+        client = OpenClawGatewayClient(
+            "localhost", 1, None, timeout=30, adaptive_timeouts=False
+        )
+        self._train(client, _latency.METRIC_TOTAL, 2.0)
+        assert client._agent_deadlines()[1] == 30
+
+    @pytest.mark.asyncio
+    async def test_completed_run_is_learned(self) -> None:
+        client = OpenClawGatewayClient("localhost", 1, None)
+        client._gateway.send_request = AsyncMock(  # type: ignore[attr-defined]
+            return_value={"payload": {"runId": "run-1"}}
+        )
+
+        task = asyncio.create_task(client.send_agent_request("hello"))
+        for _ in range(5):
+            await asyncio.sleep(0)
+        client._handle_agent_event(
+            {"payload": {"runId": "run-1", "status": "ok", "summary": "Hi"}}
+        )
+        await task
+
+        stats = client.latency_stats["main||"]
+        assert stats["ack"]["samples"] == 1
+        assert stats["total"]["samples"] == 1
+        assert stats["gap"]["samples"] == 1
+
+    @pytest.mark.asyncio
+    async def test_completed_run_feeds_latency_quantiles(self) -> None:
+        client = OpenClawGatewayClient("localhost", 1, None)
+        client._gateway.send_request = AsyncMock(  # type: ignore[attr-defined]
+            return_value={"payload": {"runId": "run-1"}}
+        )
+        pushes = []
+        client.add_state_listener(lambda kind, payload: pushes.append(kind))
+
+        task = asyncio.create_task(client.send_agent_request("hello"))
+        for _ in range(5):
+            await asyncio.sleep(0)
+        client._handle_agent_event(
+            {"payload": {"runId": "run-1", "data": {"text": "Hi"}}}
+        )
+        client._handle_agent_event({"payload": {"runId": "run-1", "status": "ok"}})
+        await task
+
+        quantiles = client.latency_quantiles
+        assert quantiles["ack"]["samples"] == 1
+        assert quantiles["first_token"]["samples"] == 1
+        assert quantiles["total"]["samples"] == 1
+        assert quantiles["first_token"]["p50"] <= quantiles["total"]["p50"]
+        assert pushes == ["latency"]
+
+    @pytest.mark.asyncio
+    async def test_stalled_run_fails_early(self) -> None:
+        run = AgentRun("run-1")
+        with pytest.raises(GatewayStalledError, match="stalled"):
+            await run.wait_complete(5, stall_timeout=0.01)
+
+    @pytest.mark.asyncio
+    async def test_events_keep_run_alive(self) -> None:
+        run = AgentRun("run-1", stream=True)
+
+        async def feed():
+            for index in range(5):
+                await asyncio.sleep(0.01)
+                run.touch()
+                run.add_output("x" * (index + 1))
+            run.set_complete("ok")
+
+        feeder = asyncio.create_task(feed())
+        chunks = [chunk async for chunk in run.iter_stream(5, stall_timeout=0.03)]
+        await feeder
+
+        assert "".join(chunks) == "xxxxx"
+
+
+class TestStallWatchdog:
+    def _client(self, **kwargs) -> OpenClawGatewayClient:
+        client = OpenClawGatewayClient(
+            "localhost", 1, None, adaptive_timeouts=False, **kwargs
+        )
+        client._gateway.send_request = AsyncMock(  # type: ignore[attr-defined]
+            return_value={"payload": {"runId": "run-1"}}
+        )
+        return client
+
+    @pytest.mark.asyncio
+    async def test_silent_run_is_failed_counted_and_aborted(self) -> None:
+        client = self._client(stall_timeout=0.05)
+
+        with pytest.raises(GatewayStalledError):
+            await client.send_agent_request("hello")
+        await asyncio.sleep(0)
+
+        assert client.stats["stalled_runs"] == 1
+        assert client.stats["aborts_requested"] == 1
+        assert "run-1" not in client._agent_runs
+
+    @pytest.mark.asyncio
+    async def test_phase_events_keep_run_alive(self) -> None:
+        client = self._client(stall_timeout=0.05)
+
+        task = asyncio.create_task(client.send_agent_request("hello"))
+        for _ in range(4):
+            await asyncio.sleep(0.03)
+            client._handle_agent_event(
+                {"payload": {"runId": "run-1", "data": {"phase": "thinking"}}}
+            )
+        client._handle_agent_event(
+            {"payload": {"runId": "run-1", "status": "ok", "summary": "Hi"}}
+        )
+
+        assert await task == "Hi"
+        assert client.stats["stalled_runs"] == 0
+
+    @pytest.mark.asyncio
+    async def test_streaming_stall_is_counted(self) -> None:
+        client = self._client(stall_timeout=0.05)
+
+        with pytest.raises(GatewayStalledError):
+            async for _ in client.stream_agent_request("hello"):
+                pass
+
+        assert client.stats["stalled_runs"] == 1
+
+    def test_zero_disables_watchdog(self) -> None:
+        client = self._client(stall_timeout=0)
+        assert client._agent_deadlines()[2] is None
+
+    def test_zero_disables_learned_watchdog_too(self) -> None:
+        client = OpenClawGatewayClient("localhost", 1, None, stall_timeout=0)
+        for _ in range(10):
+            client._latency.record(client._latency_target(), _latency.METRIC_GAP, 0.5)
+        assert client._agent_deadlines()[2] is None
+
+
+class TestTurnDeadline:
+    @pytest.mark.asyncio
+    async def test_ack_time_counts_against_budget(self) -> None:
+        client = OpenClawGatewayClient("localhost", 1, None, stall_timeout=0)
+
+        async def slow_ack(**kwargs):
+            await asyncio.sleep(0.1)
+            return {"payload": {"runId": "run-1"}}
+
+        client._gateway.send_request = slow_ack  # type: ignore[assignment]
+
+        started = asyncio.get_running_loop().time()
+        with pytest.raises(GatewayTimeoutError):
+            await client.send_agent_request("hello", timeout=0.15)
+
+        assert asyncio.get_running_loop().time() - started < 0.25
+
+    @pytest.mark.asyncio
+    async def test_ack_timeout_capped_by_budget(self) -> None:
+        client = OpenClawGatewayClient("localhost", 1, None)
+        client._gateway.send_request = AsyncMock(  # type: ignore[attr-defined]
+            side_effect=GatewayTimeoutError("Request timeout for agent")
+        )
+
+        with pytest.raises(GatewayTimeoutError):
+            await client.send_agent_request("hello", timeout=2)
+
+        assert client._gateway.send_request.await_args.kwargs["timeout"] == 2
+
+    @pytest.mark.asyncio
+    async def test_exhausted_budget_sends_nothing(self) -> None:
+        client = OpenClawGatewayClient("localhost", 1, None)
+        client._gateway.send_request = AsyncMock()  # type: ignore[attr-defined]
+
+        with pytest.raises(GatewayTimeoutError):
+            async for _ in client.stream_agent_request("hello", timeout=0):
+                pass
+
+        client._gateway.send_request.assert_not_awaited()
+
+    def test_default_budget_is_request_timeout(self) -> None:
+        client = OpenClawGatewayClient("localhost", 1, None, timeout=30)
+        assert client.agent_budget() == 30
+
+
+class TestSessionOverride:
+    @pytest.mark.asyncio
+    async def test_request_uses_given_session(self) -> None:
+        client = OpenClawGatewayClient("localhost", 1, None, session_key="main")
+        client._gateway.send_request = AsyncMock(  # type: ignore[attr-defined]
+            side_effect=[
+                {"payload": {"runId": "run-1"}},
+                {"payload": {"runId": "run-2"}},
+            ]
+        )
+
+        first = asyncio.create_task(
+            client.send_agent_request("hello", session_key="main-device-a")
+        )
+        second = asyncio.create_task(
+            client.send_agent_request("hello", session_key="main-device-b")
+        )
+        for _ in range(5):
+            await asyncio.sleep(0)
+        for run_id in ("run-1", "run-2"):
+            client._handle_agent_event(
+                {"payload": {"runId": run_id, "status": "ok", "summary": run_id}}
+            )
+
+        assert {await first, await second} == {"run-1", "run-2"}
+        sessions = [
+            call.kwargs["params"]["sessionKey"]
+            for call in client._gateway.send_request.await_args_list
+        ]
+        assert sessions == ["main-device-a", "main-device-b"]
+        assert client.session_key == "main"
+
+
+class TestLengthBudget:
+    @pytest.mark.asyncio
+    async def test_max_chars_sent_as_message_hint_and_keyed_separately(self) -> None:
+        client = OpenClawGatewayClient("localhost", 1, None, session_key="main")
+        client._gateway.send_request = AsyncMock(  # type: ignore[attr-defined]
+            side_effect=[
+                {"payload": {"runId": "run-1"}},
+                {"payload": {"runId": "run-2"}},
+            ]
+        )
+
+        spoken = asyncio.create_task(client.send_agent_request("hello", max_chars=80))
+        typed = asyncio.create_task(client.send_agent_request("hello"))
+        for _ in range(5):
+            await asyncio.sleep(0)
+        for run_id in ("run-1", "run-2"):
+            client._handle_agent_event(
+                {"payload": {"runId": run_id, "status": "ok", "summary": run_id}}
+            )
+
+        assert {await spoken, await typed} == {"run-1", "run-2"}
+        params = [
+            call.kwargs["params"]
+            for call in client._gateway.send_request.await_args_list
+        ]
+        assert params[0]["message"] == "hello" + _const.BREVITY_HINT.format(
+            max_chars=80
+        )
+        assert params[1]["message"] == "hello"
+        assert "options" not in params[0] and "options" not in params[1]
+
+
+class TestLocalIntentStats:
+    def test_hits_count_time_saved_against_learned_latency(self) -> None:
+        client = OpenClawGatewayClient("localhost", 1, None)
+        client.record_local_intent(True, 0.05)
+        client._latency.record(client._latency_target(), _latency.METRIC_TOTAL, 3.0)
+        client.record_local_intent(True, 0.05)
+        client.record_local_intent(False, 0.02)
+
+        stats = client.stats
+        assert stats["local_intent_hits"] == 2
+        assert stats["local_intent_misses"] == 1
+        assert stats["local_intent_saved_ms"] == 2950
+        assert stats["local_intent_overhead_ms"] == 20
+
+
+class TestAutoTier:
+    @pytest.mark.asyncio
+    async def test_simple_prompt_uses_fast_tier_and_records_its_latency(
+        self,
+    ) -> None:
+        client = OpenClawGatewayClient(
+            "localhost",
+            1,
+            None,
+            model="big",
+            thinking="high",
+            coalesce_window=0,
+            auto_tier=True,
+            fast_model="small",
+            fast_thinking="off",
+        )
+        client._gateway.send_request = AsyncMock(  # type: ignore[attr-defined]
+            side_effect=[
+                {"payload": {"runId": "run-1"}},
+                {"payload": {"runId": "run-2"}},
+            ]
+        )
+
+        for run_id, message in (
+            ("run-1", "Is the door locked?"),
+            ("run-2", "Explain why the heating kept running overnight"),
+        ):
+            task = asyncio.create_task(client.send_agent_request(message))
+            for _ in range(5):
+                await asyncio.sleep(0)
+            client._handle_agent_event(
+                {"payload": {"runId": run_id, "status": "ok", "summary": "ok"}}
+            )
+            await task
+
+        options = [
+            call.kwargs["params"]["options"]
+            for call in client._gateway.send_request.await_args_list
+        ]
+        assert options == [
+            {"model": "small", "thinking": "off"},
+            {"model": "big", "thinking": "high"},
+        ]
+        assert client.stats["fast_tier_requests"] == 1
+        assert client.stats["full_tier_requests"] == 1
+        assert set(client.tier_stats) == {"fast", "full"}
+        assert client.tier_stats["fast"]["samples"] == 1
+        assert set(client.tier_stats["fast"]) == {"p50", "p95", "samples"}
+        assert client.tier_stats["fast"]["p50"] is not None
+
+    def test_budget_is_learned_for_the_tier_a_message_will_use(self) -> None:
+        client = OpenClawGatewayClient(
+            "localhost",
+            1,
+            None,
+            timeout=30,
+            model="big",
+            adaptive_timeouts=True,
+            auto_tier=True,
+            fast_model="small",
+        )
+        fast = client._agent_target("Is the door locked?", None, None, peek=True)
+        for _ in range(10):
+            client._latency.record(
+                client._latency_target(fast), _latency.METRIC_TOTAL, 2.0
+            )
+
+        assert client.agent_budget("Is the door locked?", "main") == 15
+        assert client.agent_budget("Explain why the heating kept running") == 30
+        assert client.stats["fast_tier_requests"] == 0
+        assert client.stats["full_tier_requests"] == 0
+
+    def test_tiering_off_by_default(self) -> None:
+        client = OpenClawGatewayClient("localhost", 1, None, model="big")
+        target = client._agent_target("Is the door locked?", None, None)
+        assert target.model == "big"
+        assert target.tier is None
+        assert client.tier_stats == {}
+
+
+class TestStatePush:
+    def _client(self):
+        client = OpenClawGatewayClient("localhost", 1, None)
+        pushes = []
+        remove = client.add_state_listener(
+            lambda kind, payload: pushes.append((kind, payload))
+        )
+        return client, pushes, remove
+
+    def test_health_event_pushes_payload(self) -> None:
+        client, pushes, _ = self._client()
+        client._handle_health_event({"payload": {"ok": True}})
+        client._handle_health_event({"payload": {}})
+        assert pushes == [("health", {"ok": True})]
+
+    def test_state_version_change_requests_refetch(self) -> None:
+        client, pushes, _ = self._client()
+        client._handle_presence_event(
+            {"payload": {}, "stateVersion": {"status": 1, "health": 1}}
+        )
+        assert pushes == []
+
+        client._handle_presence_event(
+            {"payload": {}, "stateVersion": {"status": 2, "health": 1}}
+        )
+        client._handle_health_event(
+            {"payload": {"ok": False}, "stateVersion": {"status": 2, "health": 2}}
+        )
+        assert pushes == [("status", None), ("health", {"ok": False})]
+
+    def test_presence_version_change_requests_no_refetch(self) -> None:
+        client, pushes, _ = self._client()
+        for version in (1, 2, 3):
+            client._handle_presence_event(
+                {
+                    "payload": {},
+                    "stateVersion": {"presence": version, "sessions": version},
+                }
+            )
+        assert pushes == []
+
+    def test_listener_removal_and_failures_are_isolated(self) -> None:
+        client, pushes, remove = self._client()
+
+        def _broken(kind, payload):
+            raise RuntimeError("boom")
+
+        client.add_state_listener(_broken)
+        client._handle_status_event({"payload": {"uptimeMs": 1}})
+        remove()
+        client._handle_status_event({"payload": {"uptimeMs": 2}})
+        assert pushes == [("status", {"uptimeMs": 1})]
+
+
+class TestHedgedRequests:
+    def _client(self, **kwargs) -> OpenClawGatewayClient:
+        client = OpenClawGatewayClient(
+            "localhost",
+            1,
+            None,
+            coalesce_window=0,
+            adaptive_timeouts=False,
+            hedge_requests=True,
+            hedge_delay=0.01,
+            **kwargs,
+        )
+        client.agent_calls = []  # type: ignore[attr-defined]
+        client.aborted = []  # type: ignore[attr-defined]
+
+        async def send_request(method, params=None, timeout=None):
+            if method == "chat.abort":
+                client.aborted.append(params["runId"])
+                return {"payload": {"aborted": True}}
+            client.agent_calls.append(params)
+            return {"payload": {"runId": f"run-{len(client.agent_calls)}"}}
+
+        client._gateway.send_request = send_request  # type: ignore[assignment]
+        return client
+
+    async def _finish_when_started(self, client, run_id: str, text: str) -> None:
+        while run_id not in client._agent_runs:
+            await asyncio.sleep(0.005)
+        client._handle_agent_event(
+            {"payload": {"runId": run_id, "status": "ok", "summary": text}}
+        )
+
+    @pytest.mark.asyncio
+    async def test_backup_wins_and_primary_is_aborted(self) -> None:
+        client = self._client(hedge_model="fast")
+        finisher = asyncio.create_task(
+            self._finish_when_started(client, "run-2", "from backup")
+        )
+
+        assert await client.send_agent_request("hello") == "from backup"
+        await finisher
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert [call["sessionKey"] for call in client.agent_calls] == [
+            "main",
+            "main-hedge",
+        ]
+        assert client.agent_calls[1]["options"] == {"model": "fast"}
+        assert client.aborted == ["run-1"]
+        assert client.stats["hedged_requests"] == 1
+        assert client.stats["hedge_backup_wins"] == 1
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_is_not_hedged(self) -> None:
+        client = self._client()
+        client._hedge_delay = 1.0
+        finisher = asyncio.create_task(
+            self._finish_when_started(client, "run-1", "quick")
+        )
+
+        assert await client.send_agent_request("hello") == "quick"
+        await finisher
+
+        assert len(client.agent_calls) == 1
+        assert client.stats["hedged_requests"] == 0
+
+    def test_hedging_is_rate_limited(self) -> None:
+        client = self._client()
+
+        taken = [client._take_hedge_token() for _ in range(10)]
+
+        assert taken[:2] == [True, True]
+        assert sum(taken) == 3
+        assert client.stats["hedges_skipped"] == 7
+
+    @pytest.mark.asyncio
+    async def test_stream_follows_first_target_to_speak(self) -> None:
+        client = self._client()
+
+        async def feed_backup():
+            while "run-2" not in client._agent_runs:
+                await asyncio.sleep(0.005)
+            client._handle_agent_event(
+                {"payload": {"runId": "run-2", "data": {"text": "Hi"}}}
+            )
+            await asyncio.sleep(0.01)
+            client._handle_agent_event(
+                {"payload": {"runId": "run-2", "data": {"text": " there"}}}
+            )
+            client._handle_agent_event({"payload": {"runId": "run-2", "status": "ok"}})
+
+        feeder = asyncio.create_task(feed_backup())
+        chunks = [chunk async for chunk in client.stream_agent_request("hello")]
+        await feeder
+        await asyncio.sleep(0)
+
+        assert "".join(chunks) == "Hi there"
+        assert client.aborted == ["run-1"]
+        assert client.stats["hedge_backup_wins"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stream_loser_is_aborted_before_winner_finishes(self) -> None:
+        client = self._client()
+
+        async def speak_backup():
+            while "run-2" not in client._agent_runs:
+                await asyncio.sleep(0.005)
+            client._handle_agent_event(
+                {"payload": {"runId": "run-2", "data": {"text": "Hi"}}}
+            )
+
+        speaker = asyncio.create_task(speak_backup())
+        stream = client.stream_agent_request("hello")
+        assert await anext(stream) == "Hi"
+        await speaker
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        # The backup is still streaming, yet the primary is already gone
+        assert client.aborted == ["run-1"]
+        assert "run-1" not in client._agent_runs
+        assert "run-2" in client._agent_runs
+
+        client._handle_agent_event(
+            {"payload": {"runId": "run-2", "data": {"text": "Hi there"}}}
+        )
+        client._handle_agent_event({"payload": {"runId": "run-2", "status": "ok"}})
+        assert [chunk async for chunk in stream] == [" there"]
+        assert client.aborted == ["run-1"]
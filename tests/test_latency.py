@@ -0,0 +1,163 @@
+"""Tests for latency learning (HA-free)."""
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+_BASE = Path(__file__).parent.parent / "custom_components" / "openclaw"
+
+
+def _load_module(name: str, path: Path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+sys.modules.setdefault("custom_components", ModuleType("custom_components"))
+sys.modules.setdefault(
+    "custom_components.openclaw", ModuleType("custom_components.openclaw")
+)
+
+_latency = _load_module("custom_components.openclaw.latency", _BASE / "latency.py")
+
+LatencyEstimator = _latency.LatencyEstimator
+LatencyTracker = _latency.LatencyTracker
+QuantileEstimator = _latency.QuantileEstimator
+RollingQuantiles = _latency.RollingQuantiles
+
+
+class TestLatencyEstimator:
+    def test_first_sample_seeds_mean_and_deviation(self):
+        estimator = LatencyEstimator()
+        estimator.add(2.0)
+        assert estimator.mean == 2.0
+        assert estimator.deviation == 1.0
+        assert estimator.samples == 1
+
+    def test_converges_towards_steady_latency(self):
+        estimator = LatencyEstimator()
+        for _ in range(100):
+            estimator.add(1.0)
+        assert estimator.mean == pytest.approx(1.0)
+        assert estimator.deviation < 0.01
+        assert estimator.bound(4) == pytest.approx(1.0, abs=0.05)
+
+    def test_roundtrip_serialization(self):
+        estimator = LatencyEstimator(1.5, 0.25, 7)
+        restored = LatencyEstimator.from_dict(estimator.as_dict())
+        assert restored.mean == 1.5
+        assert restored.deviation == 0.25
+        assert restored.samples == 7
+
+
+class TestQuantileEstimator:
+    def test_exact_for_few_samples(self):
+        estimator = QuantileEstimator(0.5)
+        assert estimator.value is None
+        for value in (3.0, 1.0, 2.0):
+            estimator.add(value)
+        assert estimator.value == 2.0
+
+    def test_tracks_quantiles_of_a_stream(self):
+        median = QuantileEstimator(0.5)
+        p95 = QuantileEstimator(0.95)
+        # Deterministic shuffle of 1..1000
+        for index in range(1000):
+            value = float((index * 7919) % 1000 + 1)
+            median.add(value)
+            p95.add(value)
+        assert median.value == pytest.approx(500, rel=0.05)
+        assert p95.value == pytest.approx(950, rel=0.03)
+        assert median.samples == 1000
+
+
+class TestRollingQuantiles:
+    def test_falls_back_to_previous_window_until_enough_samples(self):
+        now = [0.0]
+        quantiles = RollingQuantiles(window=60, clock=lambda: now[0])
+        for _ in range(20):
+            quantiles.add(1.0)
+
+        now[0] = 61.0
+        quantiles.add(5.0)
+        assert quantiles.as_dict() == {"p50": 1.0, "p95": 1.0, "samples": 20}
+
+        for _ in range(_latency.QUANTILE_MIN_SAMPLES):
+            quantiles.add(5.0)
+        assert quantiles.as_dict()["p50"] == 5.0
+
+    def test_forgets_data_older_than_two_windows(self):
+        now = [0.0]
+        quantiles = RollingQuantiles(window=60, clock=lambda: now[0])
+        quantiles.add(1.0)
+        now[0] = 200.0
+        assert quantiles.as_dict() == {"p50": None, "p95": None, "samples": 0}
+
+
+class TestLatencyTracker:
+    def test_target_key_includes_model_and_thinking(self):
+        assert _latency.target_key("main", None, None) == "main||"
+        assert _latency.target_key("main", "fast", "low") == "main|fast|low"
+
+    def test_record_and_get(self):
+        tracker = LatencyTracker()
+        tracker.record("main||", _latency.METRIC_ACK, 0.2)
+        estimator = tracker.get("main||", _latency.METRIC_ACK)
+        assert estimator is not None
+        assert estimator.samples == 1
+        assert tracker.get("main||", _latency.METRIC_TOTAL) is None
+
+    def test_targets_are_bounded_least_recently_used_first(self):
+        tracker = LatencyTracker()
+        for index in range(_latency.LATENCY_MAX_TARGETS + 1):
+            tracker.record(f"main-{index}||", _latency.METRIC_TOTAL, 1.0)
+            tracker.record("main||", _latency.METRIC_TOTAL, 1.0)
+
+        targets = tracker.as_dict()
+        assert len(targets) == _latency.LATENCY_MAX_TARGETS
+        assert "main||" in targets
+        assert "main-0||" not in targets
+
+    def test_negative_samples_ignored(self):
+        tracker = LatencyTracker()
+        tracker.record("main||", _latency.METRIC_ACK, -1)
+        assert tracker.as_dict() == {}
+
+    @pytest.mark.asyncio
+    async def test_load_and_save_through_store(self):
+        store = MagicMock()
+        store.async_load = AsyncMock(
+            return_value={
+                "targets": {
+                    "main||": {"total": {"mean": 3.0, "deviation": 1.0, "samples": 9}}
+                }
+            }
+        )
+        storage_mod = ModuleType("homeassistant.helpers.storage")
+        storage_mod.Store = MagicMock(return_value=store)  # type: ignore[attr-defined]
+        sys.modules.setdefault("homeassistant", ModuleType("homeassistant"))
+        sys.modules.setdefault("homeassistant.helpers", ModuleType("homeassistant.helpers"))
+        previous = sys.modules.get("homeassistant.helpers.storage")
+        sys.modules["homeassistant.helpers.storage"] = storage_mod
+        try:
+            tracker = LatencyTracker(MagicMock(), "gw:1")
+            await tracker.async_load()
+        finally:
+            if previous is None:
+                sys.modules.pop("homeassistant.helpers.storage", None)
+            else:
+                sys.modules["homeassistant.helpers.storage"] = previous
+
+        assert storage_mod.Store.call_args.args[2] == "openclaw.latency.gw_1"
+        assert tracker.get("main||", "total").samples == 9
+
+        tracker.record("main||", _latency.METRIC_TOTAL, 3.0)
+        store.async_delay_save.assert_called_once()
+        data = store.async_delay_save.call_args.args[0]()
+        assert data["targets"]["main||"]["total"]["samples"] == 10
@@ -0,0 +1,80 @@
+"""Tests for the incremental presence model."""
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+
+def _load_module(name: str, path: Path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+_BASE = Path(__file__).parent.parent / "custom_components" / "openclaw"
+sys.modules.setdefault("custom_components", ModuleType("custom_components"))
+sys.modules.setdefault(
+    "custom_components.openclaw", ModuleType("custom_components.openclaw")
+)
+_presence = _load_module(
+    "custom_components.openclaw.presence", _BASE / "presence.py"
+)
+PresenceModel = _presence.PresenceModel
+
+
+def test_unknown_until_first_report() -> None:
+    model = PresenceModel()
+    assert model.count is None
+    assert not model.apply({"other": "data"})
+    assert model.count is None
+
+
+def test_snapshot_is_diffed_in_place() -> None:
+    model = PresenceModel()
+    first = model.apply([{"id": "a", "mode": "ui"}, {"instanceId": "b"}])
+    assert first.as_dict() == {"joined": ["a", "b"], "left": [], "updated": []}
+
+    clients = model.clients
+    change = model.apply(
+        {"clients": [{"id": "a", "mode": "cli"}, {"deviceId": "c"}]}
+    )
+
+    assert change.as_dict() == {"joined": ["c"], "left": ["b"], "updated": ["a"]}
+    assert list(clients) == ["a", "c"]
+    assert model.count == 2
+    assert not model.apply([{"id": "a", "mode": "cli"}, {"deviceId": "c"}])
+
+
+def test_delta_updates_apply_directly() -> None:
+    model = PresenceModel()
+    model.apply(["a", "b"])
+
+    change = model.apply(
+        {"joined": [{"id": "c"}], "updated": ["a"], "left": ["b", "missing"]}
+    )
+
+    assert change.as_dict() == {"joined": ["c"], "left": ["b"], "updated": []}
+    assert dict(model.clients) == {"a": "a", "c": {"id": "c"}}
+
+
+def test_count_only_reports() -> None:
+    model = PresenceModel()
+    model.apply(["a"])
+
+    change = model.apply({"clients": 5})
+    assert change.left == ["a"]
+    assert change.recounted
+    assert model.count == 5
+    assert not model.apply({"clients": 5})
+
+    assert model.apply(["b"]).recounted
+    assert model.count == 1
+
+
+def test_entries_without_id_keep_their_position() -> None:
+    model = PresenceModel()
+    model.apply([{"mode": "ui"}, {"mode": "cli"}])
+    assert list(model.clients) == ["#0", "#1"]
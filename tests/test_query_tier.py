@@ -0,0 +1,64 @@
+"""Tests for query complexity tiering."""
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+
+def _load_module(name: str, path: Path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+_BASE = Path(__file__).parent.parent / "custom_components" / "openclaw"
+sys.modules.setdefault("custom_components", ModuleType("custom_components"))
+sys.modules.setdefault(
+    "custom_components.openclaw", ModuleType("custom_components.openclaw")
+)
+_load_module("custom_components.openclaw.const", _BASE / "const.py")
+_tier = _load_module(
+    "custom_components.openclaw.query_tier", _BASE / "query_tier.py"
+)
+QueryClassifier = _tier.QueryClassifier
+
+
+def test_short_simple_prompt_is_fast() -> None:
+    classifier = QueryClassifier(max_words=12)
+    assert classifier.classify("What time is it?", "main") == "fast"
+    assert classifier.classify("Is the garage door open", "main") == "fast"
+
+
+def test_long_multi_sentence_or_reasoning_prompt_is_full() -> None:
+    classifier = QueryClassifier(max_words=5)
+    assert classifier.classify("one two three four five six", "main") == "full"
+    assert classifier.classify("Lights off. Then lock up.", "main") == "full"
+    assert classifier.classify("Explain the weather", "main") == "full"
+    assert classifier.classify("", "main") == "full"
+
+
+def test_follow_up_to_complex_turn_stays_full() -> None:
+    classifier = QueryClassifier(max_words=12)
+    assert classifier.classify("Why is the heating on?", "main") == "full"
+    assert classifier.classify("and the hallway?", "main") == "full"
+    assert classifier.classify("and the hallway?", "other") == "fast"
+    assert classifier.classify("Turn it down", "main") == "fast"
+
+
+def test_peek_leaves_history_untouched() -> None:
+    classifier = QueryClassifier(max_words=12)
+    assert classifier.peek("Why is the heating on?", "main") == "full"
+    assert classifier.peek("and the hallway?", "main") == "fast"
+    classifier.classify("Why is the heating on?", "main")
+    assert classifier.peek("and the hallway?", "main") == "full"
+
+
+def test_history_is_bounded() -> None:
+    classifier = QueryClassifier(max_words=12, max_sessions=2)
+    classifier.classify("Why is it cold?", "a")
+    classifier.classify("Hi", "b")
+    classifier.classify("Hi", "c")
+    assert classifier.classify("and now?", "a") == "fast"
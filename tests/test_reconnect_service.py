@@ -68,6 +68,7 @@ async def test_reconnect_service_calls_clients() -> None:
             self.connect = AsyncMock()
             self.connected = True
             self._gateway = MagicMock()
+            self.add_state_listener = MagicMock()
 
     gateway_client_mod.OpenClawGatewayClient = OpenClawGatewayClient
 
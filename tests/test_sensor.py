@@ -27,6 +27,12 @@ class _SensorStateClass:
     MEASUREMENT = "measurement"
 
 
+class _SensorDeviceClass:
+    DATA_SIZE = "data_size"
+    DURATION = "duration"
+    TIMESTAMP = "timestamp"
+
+
 class _EntityCategory:
     DIAGNOSTIC = "diagnostic"
 
@@ -39,11 +45,25 @@ class _DataUpdateCoordinator:
     pass
 
 
+class _Debouncer:
+    def __init__(self, hass, logger, *, cooldown, immediate, function) -> None:
+        self.cooldown = cooldown
+        self.function = function
+        self.scheduled = 0
+
+    def async_schedule_call(self) -> None:
+        self.scheduled += 1
+
+    def async_cancel(self) -> None:
+        pass
+
+
 _ha = MagicMock()
 
 _sensor_mod = ModuleType("homeassistant.components.sensor")
 _sensor_mod.SensorEntity = _SensorEntity  # type: ignore[attr-defined]
 _sensor_mod.SensorStateClass = _SensorStateClass  # type: ignore[attr-defined]
+_sensor_mod.SensorDeviceClass = _SensorDeviceClass  # type: ignore[attr-defined]
 
 _const_mod = ModuleType("homeassistant.const")
 _const_mod.EntityCategory = _EntityCategory  # type: ignore[attr-defined]
@@ -67,6 +87,10 @@ sys.modules["homeassistant.components.sensor"] = _sensor_mod
 sys.modules["homeassistant.const"] = _const_mod
 sys.modules["homeassistant.helpers.update_coordinator"] = _coordinator_mod
 
+_debounce_mod = ModuleType("homeassistant.helpers.debounce")
+_debounce_mod.Debouncer = _Debouncer  # type: ignore[attr-defined]
+sys.modules["homeassistant.helpers.debounce"] = _debounce_mod
+
 sys.modules.setdefault("custom_components", ModuleType("custom_components"))
 sys.modules.setdefault("custom_components.openclaw", ModuleType("custom_components.openclaw"))
 
@@ -82,27 +106,41 @@ def _load_module(name: str, path: Path):
 _const = _load_module("custom_components.openclaw.const", _BASE / "const.py")
 _exceptions = _load_module("custom_components.openclaw.exceptions", _BASE / "exceptions.py")
 _gateway = _load_module("custom_components.openclaw.gateway", _BASE / "gateway.py")
+_latency = _load_module("custom_components.openclaw.latency", _BASE / "latency.py")
+_load_module("custom_components.openclaw.presence", _BASE / "presence.py")
+_load_module("custom_components.openclaw.query_tier", _BASE / "query_tier.py")
+_load_module("custom_components.openclaw.throughput", _BASE / "throughput.py")
+_load_module("custom_components.openclaw.usage", _BASE / "usage.py")
 _gateway_client = _load_module(
     "custom_components.openclaw.gateway_client", _BASE / "gateway_client.py"
 )
+_load_module("custom_components.openclaw.coordinator", _BASE / "coordinator.py")
 _sensor = _load_module("custom_components.openclaw.sensor", _BASE / "sensor.py")
 
 OpenClawUptimeSensor = _sensor.OpenClawUptimeSensor
 OpenClawConnectedClientsSensor = _sensor.OpenClawConnectedClientsSensor
 OpenClawHealthSensor = _sensor.OpenClawHealthSensor
+OpenClawLatencySensor = _sensor.OpenClawLatencySensor
+OpenClawRequestSensor = _sensor.OpenClawRequestSensor
+OpenClawConnectionSensor = _sensor.OpenClawConnectionSensor
+OpenClawUsageSensor = _sensor.OpenClawUsageSensor
 OpenClawGatewayClient = _gateway_client.OpenClawGatewayClient
 
 
-def _make_coordinator(data=None):
+def _make_coordinator(data=None, kind="status"):
     coordinator = MagicMock()
-    coordinator.data = data
+    coordinator.data = None if data is None else {kind: data}
     return coordinator
 
 
+def _make_health_coordinator(data=None):
+    return _make_coordinator(data, kind="health")
+
+
 def _make_client(**overrides):
     client = OpenClawGatewayClient("localhost", 1, None)
     if "presence" in overrides:
-        client._gateway._presence = overrides["presence"]
+        client.presence.apply(overrides["presence"])
     if "snapshot" in overrides:
         client._gateway._connect_snapshot = overrides["snapshot"]
     return client
@@ -144,6 +182,16 @@ class TestOpenClawUptimeSensor:
         assert attrs["state_version"] == 5
         assert attrs["sessions"] == 3
 
+    def test_extra_state_attributes_summarize_session_list(self) -> None:
+        client = _make_client()
+        sessions = [{"sessionKey": f"s{index}", "messages": []} for index in range(8)]
+        coordinator = _make_coordinator({"sessions": sessions})
+        sensor = OpenClawUptimeSensor(coordinator, "test_entry", client)
+        attrs = sensor.extra_state_attributes
+        assert attrs["sessions"] == 8
+        assert attrs["session_keys"] == ["s0", "s1", "s2", "s3", "s4"]
+        assert "session_keys" in sensor._unrecorded_attributes
+
     def test_extra_state_attributes_empty(self) -> None:
         client = _make_client()
         coordinator = _make_coordinator(None)
@@ -191,16 +239,27 @@ class TestOpenClawConnectedClientsSensor:
         assert sensor.native_value is None
 
     def test_extra_state_attributes_with_list(self) -> None:
-        client = _make_client(presence={"clients": ["ha", "web"]})
+        client = _make_client(
+            presence={"clients": [{"id": "ha", "host": "x"}, {"id": "web"}]}
+        )
         sensor = OpenClawConnectedClientsSensor("test_entry", client)
         attrs = sensor.extra_state_attributes
-        assert attrs["client_list"] == ["ha", "web"]
+        assert attrs == {"client_ids": ["ha", "web"]}
+
+    def test_client_ids_capped_and_unrecorded(self) -> None:
+        client = _make_client(presence=[f"c{index}" for index in range(7)])
+        sensor = OpenClawConnectedClientsSensor("test_entry", client)
+        assert sensor.native_value == 7
+        assert sensor.extra_state_attributes["client_ids"] == [
+            "c0", "c1", "c2", "c3", "c4"
+        ]
+        assert "client_ids" in sensor._unrecorded_attributes
 
     def test_extra_state_attributes_no_list(self) -> None:
         client = _make_client(presence={"clients": 2})
         sensor = OpenClawConnectedClientsSensor("test_entry", client)
         attrs = sensor.extra_state_attributes
-        assert "client_list" not in attrs
+        assert "client_ids" not in attrs
 
     def test_extra_state_attributes_empty(self) -> None:
         client = _make_client()
@@ -219,43 +278,78 @@ class TestOpenClawConnectedClientsSensor:
         info = sensor.device_info
         assert ("openclaw", "test_entry") in info["identifiers"]
 
+    def test_does_not_poll(self) -> None:
+        sensor = OpenClawConnectedClientsSensor("test_entry", _make_client())
+        assert sensor._attr_should_poll is False
+
+    def test_presence_push_writes_state_without_interval(self) -> None:
+        client = _make_client()
+        sensor = OpenClawConnectedClientsSensor("test_entry", client, 0)
+        sensor.async_write_ha_state = MagicMock()
+        client.add_state_listener(sensor._handle_state_push)
+
+        client._handle_presence_event({"payload": [{"id": "a"}, {"id": "b"}]})
+        client._handle_health_event({"payload": {"ok": True}})
+
+        sensor.async_write_ha_state.assert_called_once_with()
+        assert sensor.native_value == 2
+
+    def test_presence_push_is_debounced(self) -> None:
+        client = _make_client()
+        sensor = OpenClawConnectedClientsSensor("test_entry", client, 2.0)
+        sensor.async_write_ha_state = MagicMock()
+        sensor._debouncer = _Debouncer(
+            None,
+            None,
+            cooldown=2.0,
+            immediate=True,
+            function=sensor.async_write_ha_state,
+        )
+        client.add_state_listener(sensor._handle_state_push)
+
+        for count in range(1, 4):
+            client._handle_presence_event({"payload": [{"id": str(count)}]})
+
+        assert sensor._debouncer.scheduled == 3
+        sensor.async_write_ha_state.assert_not_called()
+
 
 # ── Health Sensor ──
 
 
 class TestOpenClawHealthSensor:
     def test_native_value(self) -> None:
-        coordinator = _make_coordinator({"status": "ok"})
+        coordinator = _make_health_coordinator({"status": "ok"})
         sensor = OpenClawHealthSensor(coordinator, "test_entry")
         assert sensor.native_value == "ok"
 
     def test_native_value_none_when_no_data(self) -> None:
-        coordinator = _make_coordinator(None)
+        coordinator = _make_health_coordinator(None)
         sensor = OpenClawHealthSensor(coordinator, "test_entry")
         assert sensor.native_value is None
 
     def test_native_value_ok_when_data_has_no_status_key(self) -> None:
-        coordinator = _make_coordinator({"version": "1.0"})
+        coordinator = _make_health_coordinator({"version": "1.0"})
         sensor = OpenClawHealthSensor(coordinator, "test_entry")
         assert sensor.native_value == "ok"
 
     def test_native_value_from_healthy_true(self) -> None:
-        coordinator = _make_coordinator({"healthy": True})
+        coordinator = _make_health_coordinator({"healthy": True})
         sensor = OpenClawHealthSensor(coordinator, "test_entry")
         assert sensor.native_value == "ok"
 
     def test_native_value_from_healthy_false(self) -> None:
-        coordinator = _make_coordinator({"healthy": False})
+        coordinator = _make_health_coordinator({"healthy": False})
         sensor = OpenClawHealthSensor(coordinator, "test_entry")
         assert sensor.native_value == "unhealthy"
 
     def test_native_value_status_takes_precedence_over_healthy(self) -> None:
-        coordinator = _make_coordinator({"status": "degraded", "healthy": True})
+        coordinator = _make_health_coordinator({"status": "degraded", "healthy": True})
         sensor = OpenClawHealthSensor(coordinator, "test_entry")
         assert sensor.native_value == "degraded"
 
     def test_extra_state_attributes(self) -> None:
-        coordinator = _make_coordinator({
+        coordinator = _make_health_coordinator({
             "status": "ok",
             "version": "2.1.0",
             "uptimeMs": 50000,
@@ -270,24 +364,165 @@ class TestOpenClawHealthSensor:
         assert attrs["cpuUsage"] == 0.5
 
     def test_extra_state_attributes_omits_missing(self) -> None:
-        coordinator = _make_coordinator({"status": "ok"})
+        coordinator = _make_health_coordinator({"status": "ok"})
         sensor = OpenClawHealthSensor(coordinator, "test_entry")
         attrs = sensor.extra_state_attributes
         assert attrs == {}
 
     def test_extra_state_attributes_empty_data(self) -> None:
-        coordinator = _make_coordinator(None)
+        coordinator = _make_health_coordinator(None)
         sensor = OpenClawHealthSensor(coordinator, "test_entry")
         attrs = sensor.extra_state_attributes
         assert attrs == {}
 
     def test_unique_id(self) -> None:
-        coordinator = _make_coordinator(None)
+        coordinator = _make_health_coordinator(None)
         sensor = OpenClawHealthSensor(coordinator, "test_entry")
         assert sensor._attr_unique_id == "test_entry_gateway_health"
 
     def test_device_info(self) -> None:
-        coordinator = _make_coordinator(None)
+        coordinator = _make_health_coordinator(None)
         sensor = OpenClawHealthSensor(coordinator, "test_entry")
         info = sensor.device_info
         assert ("openclaw", "test_entry") in info["identifiers"]
+
+
+
+# ── Latency Sensors ──
+
+
+class TestOpenClawLatencySensor:
+    def test_unknown_without_samples(self) -> None:
+        sensor = OpenClawLatencySensor("test_entry", _make_client(), "total", "p50")
+        assert sensor.native_value is None
+        assert sensor.extra_state_attributes == {"samples": 0}
+
+    def test_reports_quantile_in_milliseconds(self) -> None:
+        client = _make_client()
+        for seconds in (1.0, 2.0, 3.0):
+            client._quantiles["first_token"].add(seconds)
+        median = OpenClawLatencySensor("test_entry", client, "first_token", "p50")
+        p95 = OpenClawLatencySensor("test_entry", client, "first_token", "p95")
+        assert median.native_value == 2000
+        assert p95.native_value == 3000
+        assert median.extra_state_attributes == {"samples": 3}
+        assert median._attr_name == "OpenClaw Time to First Token p50"
+        assert median._attr_unique_id == "test_entry_first_token_latency_p50"
+
+    def test_writes_state_on_latency_push_only(self) -> None:
+        sensor = OpenClawLatencySensor("test_entry", _make_client(), "ack", "p95")
+        sensor.async_write_ha_state = MagicMock()
+        sensor._handle_state_push("presence", {"joined": ["a"]})
+        sensor.async_write_ha_state.assert_not_called()
+        sensor._handle_state_push("latency", None)
+        sensor.async_write_ha_state.assert_called_once()
+
+
+# ── Request Sensors ──
+
+
+class TestOpenClawRequestSensor:
+    def _client(self):
+        client = _make_client()
+        for counter in ("requests", "completed", "requests", "timeouts"):
+            client._requests.record(counter)
+        return client
+
+    def test_daily_totals(self) -> None:
+        client = self._client()
+        requests = OpenClawRequestSensor("test_entry", client, "requests_today")
+        errors = OpenClawRequestSensor("test_entry", client, "errors_today")
+        assert requests.native_value == 2
+        assert requests._attr_state_class == "total_increasing"
+        assert requests.extra_state_attributes["timeouts"] == 1
+        assert "requests" not in requests.extra_state_attributes
+        assert errors.native_value == 1
+        assert errors.extra_state_attributes == {}
+
+    def test_rates(self) -> None:
+        client = self._client()
+        rate = OpenClawRequestSensor("test_entry", client, "request_rate")
+        error_rate = OpenClawRequestSensor("test_entry", client, "error_rate")
+        assert rate.native_value == client.request_stats["per_minute"]["requests"]
+        assert error_rate.native_value == 50.0
+        assert error_rate._attr_native_unit_of_measurement == "%"
+        assert error_rate._attr_unique_id == "test_entry_error_rate"
+
+
+# ── Connection Sensors ──
+
+
+class TestOpenClawConnectionSensor:
+    def test_connected_since_only_while_connected(self) -> None:
+        client = _make_client()
+        sensor = OpenClawConnectionSensor("test_entry", client, "connected_since")
+        assert sensor.native_value is None
+
+        client._gateway._record_session_start()
+        value = sensor.native_value
+        assert value.tzinfo is not None
+        assert sensor._attr_device_class == "timestamp"
+
+        client._gateway._record_session_end(MagicMock(close_code=1012))
+        assert sensor.native_value is None
+
+    def test_reconnects_with_flapping_attributes(self) -> None:
+        client = _make_client()
+        gateway = client._gateway
+        for _ in range(2):
+            gateway._record_session_start()
+            gateway._record_session_end(MagicMock(close_code=1006))
+        sensor = OpenClawConnectionSensor("test_entry", client, "reconnects")
+        assert sensor.native_value == 1
+        attrs = sensor.extra_state_attributes
+        assert attrs["short_sessions"] == 2
+        assert attrs["last_close_code"] == 1006
+        assert attrs["last_close_reason"] == "1006"
+
+    def test_traffic_totals(self) -> None:
+        client = _make_client()
+        client._gateway._count_received("héllo")
+        sensor = OpenClawConnectionSensor("test_entry", client, "bytes_received")
+        assert sensor.native_value == 6
+        assert sensor._attr_native_unit_of_measurement == "B"
+        assert sensor.extra_state_attributes == {}
+
+
+# ── Usage Sensors ──
+
+
+class TestOpenClawUsageSensor:
+    def _client(self):
+        client = _make_client()
+        client._usage.record(
+            "main",
+            "big",
+            {
+                "input_tokens": 90,
+                "output_tokens": 10,
+                "total_tokens": 100,
+                "cost": 0.123456,
+            },
+        )
+        client._usage.record("kitchen", "small", {"total_tokens": 40})
+        return client
+
+    def test_tokens_today_with_top_groups(self) -> None:
+        sensor = OpenClawUsageSensor("test_entry", self._client(), "tokens_today")
+        assert sensor.native_value == 140
+        assert sensor._attr_state_class == "total_increasing"
+        attrs = sensor.extra_state_attributes
+        assert attrs["runs"] == 2
+        assert attrs["input_tokens"] == 90
+        assert attrs["top_today"] == {"main|big": 100, "kitchen|small": 40}
+        assert "top_today" in sensor._unrecorded_attributes
+
+    def test_cost_and_rolling_window(self) -> None:
+        client = self._client()
+        cost = OpenClawUsageSensor("test_entry", client, "cost_today")
+        rolling = OpenClawUsageSensor("test_entry", client, "tokens_rolling")
+        assert cost.native_value == 0.1235
+        assert cost.extra_state_attributes == {}
+        assert rolling.native_value == 140
+        assert rolling._attr_state_class == "measurement"
+        assert rolling._attr_unique_id == "test_entry_tokens_rolling"
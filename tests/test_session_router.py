@@ -0,0 +1,88 @@
+"""Tests for conversation and device session routing."""
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+from unittest.mock import patch
+
+
+def _load_module(name: str, path: Path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+_BASE = Path(__file__).parent.parent / "custom_components" / "openclaw"
+sys.modules.setdefault("custom_components", ModuleType("custom_components"))
+sys.modules.setdefault(
+    "custom_components.openclaw", ModuleType("custom_components.openclaw")
+)
+_load_module("custom_components.openclaw.const", _BASE / "const.py")
+_router = _load_module(
+    "custom_components.openclaw.session_router", _BASE / "session_router.py"
+)
+SessionRouter = _router.SessionRouter
+
+
+def test_none_mode_uses_base_session() -> None:
+    router = SessionRouter("none")
+    assert router.resolve("main", "conv-1", "device-1") == "main"
+    assert len(router) == 0
+
+
+def test_conversation_mode_routes_by_conversation() -> None:
+    router = SessionRouter("conversation")
+
+    first = router.resolve("main", "conv-1", "device-1")
+
+    assert first.startswith("main-conversation-")
+    assert router.resolve("main", "conv-1", "device-2") == first
+    assert router.resolve("main", "conv-2", "device-1") != first
+    assert router.resolve("main", None, "device-1") == "main"
+
+
+def test_device_mode_falls_back_to_conversation() -> None:
+    router = SessionRouter("device")
+
+    by_device = router.resolve("main", "conv-1", "device-1")
+    by_conversation = router.resolve("main", "conv-2", None)
+
+    assert by_device.startswith("main-device-")
+    assert by_conversation.startswith("main-conversation-")
+    assert router.resolve("main", "conv-3", "device-1") == by_device
+
+
+def test_base_session_change_starts_new_routes() -> None:
+    router = SessionRouter("device")
+
+    old = router.resolve("main", None, "device-1")
+    new = router.resolve("kitchen", None, "device-1")
+
+    assert new.startswith("kitchen-device-")
+    assert new != old
+
+
+def test_least_recently_used_route_is_evicted() -> None:
+    router = SessionRouter("device", max_entries=2)
+
+    first = router.resolve("main", None, "device-1")
+    router.resolve("main", None, "device-2")
+    router.resolve("main", None, "device-1")
+    router.resolve("main", None, "device-3")
+
+    assert len(router) == 2
+    assert router.resolve("main", None, "device-1") == first
+
+
+def test_idle_route_expires() -> None:
+    router = SessionRouter("device", idle_timeout=60)
+
+    with patch.object(_router.time, "monotonic", return_value=1000.0):
+        first = router.resolve("main", None, "device-1")
+    with patch.object(_router.time, "monotonic", return_value=1030.0):
+        assert router.resolve("main", None, "device-1") == first
+    with patch.object(_router.time, "monotonic", return_value=1100.0):
+        assert router.resolve("main", None, "device-1") != first
@@ -69,6 +69,7 @@ async def test_set_session_service_updates_client() -> None:
             self.connected = True
             self.set_session_key = MagicMock()
             self._gateway = MagicMock()
+            self.add_state_listener = MagicMock()
 
     gateway_client_mod.OpenClawGatewayClient = OpenClawGatewayClient
 
@@ -0,0 +1,81 @@
+"""Tests for agent request counters (HA-free)."""
+
+import asyncio
+import importlib.util
+import sys
+from datetime import date
+from pathlib import Path
+from types import ModuleType
+
+
+def _load_module(name: str, path: Path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+_BASE = Path(__file__).parent.parent / "custom_components" / "openclaw"
+sys.modules.setdefault("custom_components", ModuleType("custom_components"))
+sys.modules.setdefault(
+    "custom_components.openclaw", ModuleType("custom_components.openclaw")
+)
+_exceptions = _load_module(
+    "custom_components.openclaw.exceptions", _BASE / "exceptions.py"
+)
+_throughput = _load_module(
+    "custom_components.openclaw.throughput", _BASE / "throughput.py"
+)
+RequestMeter = _throughput.RequestMeter
+failure_outcome = _throughput.failure_outcome
+
+
+def test_failure_outcomes() -> None:
+    wrapped = _exceptions.AgentExecutionError("Request failed")
+    wrapped.__cause__ = _exceptions.GatewayAuthenticationError("missing scope")
+
+    assert failure_outcome(_exceptions.GatewayStalledError("x")) == "stalls"
+    assert failure_outcome(_exceptions.GatewayTimeoutError("x")) == "timeouts"
+    assert failure_outcome(wrapped) == "auth_failures"
+    assert (
+        failure_outcome(_exceptions.GatewayConnectionError("x"))
+        == "connection_errors"
+    )
+    assert failure_outcome(_exceptions.AgentExecutionError("x")) == "execution_errors"
+    assert failure_outcome(asyncio.CancelledError()) == "cancelled"
+
+
+def test_rates_cover_the_recent_window() -> None:
+    now = [0.0]
+    meter = RequestMeter(clock=lambda: now[0])
+    for _ in range(3):
+        meter.record("requests")
+        meter.record("completed")
+    meter.record("requests")
+    meter.record("timeouts")
+
+    stats = meter.as_dict()
+    assert stats["per_minute"]["requests"] == round(4 / _throughput.RATE_WINDOW, 3)
+    assert stats["error_rate"] == 25.0
+
+    now[0] = 60.0 * (_throughput.RATE_WINDOW + 1)
+    stats = meter.as_dict()
+    assert stats["per_minute"]["requests"] == 0
+    assert stats["error_rate"] is None
+    assert stats["totals"]["requests"] == 4
+
+
+def test_daily_totals_reset_on_date_change() -> None:
+    today = [date(2026, 1, 1)]
+    meter = RequestMeter(today=lambda: today[0])
+    meter.record("requests")
+    meter.record("stalls")
+    assert meter.as_dict()["today"]["requests"] == 1
+    assert meter.as_dict()["errors_today"] == 1
+
+    today[0] = date(2026, 1, 2)
+    stats = meter.as_dict()
+    assert stats["today"]["requests"] == 0
+    assert stats["errors_today"] == 0
+    assert stats["totals"]["stalls"] == 1
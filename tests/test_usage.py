@@ -0,0 +1,70 @@
+"""Tests for token usage aggregation (HA-free)."""
+
+import importlib.util
+import sys
+from datetime import date
+from pathlib import Path
+from types import ModuleType
+
+
+def _load_module(name: str, path: Path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+_BASE = Path(__file__).parent.parent / "custom_components" / "openclaw"
+sys.modules.setdefault("custom_components", ModuleType("custom_components"))
+sys.modules.setdefault(
+    "custom_components.openclaw", ModuleType("custom_components.openclaw")
+)
+_usage = _load_module("custom_components.openclaw.usage", _BASE / "usage.py")
+UsageTracker = _usage.UsageTracker
+parse_usage = _usage.parse_usage
+
+
+def test_parse_usage_from_payload_or_data() -> None:
+    assert parse_usage({"usage": {"inputTokens": 150, "outputTokens": 45}}) == {
+        "input_tokens": 150,
+        "output_tokens": 45,
+        "total_tokens": 195,
+    }
+    assert parse_usage(
+        {"data": {"usage": {"total_tokens": 10, "estimatedCost": 0.01}}}
+    ) == {"total_tokens": 10, "cost": 0.01}
+    assert parse_usage({"data": {"text": "hi"}}) is None
+    assert parse_usage({"usage": {"note": "n/a"}}) is None
+
+
+def test_totals_by_day_window_and_group() -> None:
+    today = [date(2026, 1, 1)]
+    now = [0.0]
+    tracker = UsageTracker(today=lambda: today[0], clock=lambda: now[0])
+    tracker.record("main", "fast", {"total_tokens": 100, "cost": 0.5})
+    tracker.record("main", None, {"total_tokens": 50})
+
+    stats = tracker.as_dict()
+    assert stats["today"]["total_tokens"] == 150
+    assert stats["today"]["runs"] == 2
+    assert stats["rolling"]["cost"] == 0.5
+    assert stats["groups"]["main|fast"]["totals"]["total_tokens"] == 100
+    assert stats["groups"]["main|"]["today"]["runs"] == 1
+
+    now[0] = 60.0 * (_usage.USAGE_WINDOW + 1)
+    today[0] = date(2026, 1, 2)
+    stats = tracker.as_dict()
+    assert stats["rolling"]["total_tokens"] == 0
+    assert stats["today"]["total_tokens"] == 0
+    assert stats["groups"]["main|fast"]["today"]["total_tokens"] == 0
+    assert stats["totals"]["total_tokens"] == 150
+
+
+def test_groups_are_bounded() -> None:
+    tracker = UsageTracker()
+    for index in range(_usage.USAGE_MAX_GROUPS + 1):
+        tracker.record(f"s{index}", None, {"total_tokens": 1})
+    groups = tracker.as_dict()["groups"]
+    assert len(groups) == _usage.USAGE_MAX_GROUPS
+    assert "s0|" not in groups